@@ -4,25 +4,161 @@ Complete HFT Integration Test with High-Performance Components
 
 This test demonstrates the full HFT-PacketFilter system working together:
 - High-performance memory pool for packet buffers
-- Lock-free queue for message passing
+- Lock-free SPSC tick ring for message passing
 - HFT analyzer for latency tracking
 - Market data simulation
 - Real-time performance monitoring
 """
 
+import os
+import sys
+import mmap
 import time
-import random
 import threading
+import numpy as np
+from collections import namedtuple
 from hft_packetfilter import HFTAnalyzer, ExchangeConfig
 from hft_packetfilter.core.c_extensions import (
     HighPerformanceMemoryPool, 
-    LockFreeQueue, 
+    parse_fix_symbol_price_cents,
+    fix_checksum,
+    rdtsc_ns,
+    spin_pause,
     EXTENSIONS_AVAILABLE
 )
-from hft_packetfilter.core.data_structures import LatencyMeasurement
 from hft_packetfilter.analytics.market_data_quality import MarketDataAnalyzer
 from hft_packetfilter.analytics.arbitrage_detector import ArbitrageDetector
 
+# Fixed-width ASCII slots in the pre-tokenized FIX templates
+FIX_TS_WIDTH = 16      # Microsecond epoch timestamp
+FIX_PRICE_WIDTH = 9    # Zero-padded price, e.g. 000150.25 (6 integer digits)
+FIX_VOLUME_WIDTH = 5   # Zero-padded volume, e.g. 00100
+FIX_SCRATCH_SIZE = 512 # Reusable encode buffer, larger than any template
+FIX_TRAILER_LEN = 7    # "10=NNN" checksum field plus SOH
+
+# Constant field runs around the symbol (tag 55) and first price (tag 270) values
+FIX_SYMBOL_FIELD = b'\x0155='
+FIX_BID_PX_FIELDS = b'\x01268=2\x01269=0\x01270='
+
+# Largest price in cents that fits the fixed-width price slot
+FIX_MAX_PRICE_CENTS = 1000000 * 100 - 1
+
+# Integer-to-ASCII lookup tables for fixed-point price formatting
+DIGITS2 = tuple(b'%02d' % i for i in range(100))
+DIGITS4 = tuple(b'%04d' % i for i in range(10000))
+
+# Constant per-exchange header bytes (up to the timestamp value) and their byte sum
+FixHeader = namedtuple('FixHeader', ['prefix', 'checksum'])
+
+# Pre-tokenized template: byte offsets of each fixed-width slot in data, and the
+# header checksum so only bytes from ts_off onwards are summed per packet
+FixTemplate = namedtuple('FixTemplate', [
+    'data', 'ts_off', 'bid_off', 'bid_vol_off', 'ask_off', 'ask_vol_off', 'prefix_checksum'
+])
+
+# Number of packets simulated per vectorized NumPy chunk in the simulation loop
+SIMULATION_CHUNK_SIZE = 10000
+
+# Simulated arbitrage hit rate and size of the precomputed decision bitmask
+ARBITRAGE_PROBABILITY = 0.02
+ARBITRAGE_DECISION_BITS = 1 << 20
+
+# Parse latency is sampled on 1 in (LATENCY_SAMPLE_MASK + 1) packets into a
+# log2 histogram: bucket b counts samples with bit_length(ns) == b
+LATENCY_SAMPLE_MASK = 15
+LATENCY_HISTOGRAM_BUCKETS = 64
+
+# CPU pause hints issued between deadline checks while busy-polling
+SPIN_PAUSE_ITERATIONS = 64
+
+# Indices into the int64 performance counter array
+(STAT_PACKETS, STAT_MESSAGES, STAT_LATENCY, STAT_ARBITRAGE,
+ STAT_OPERATIONS, STAT_ERRORS, STAT_COUNT) = range(7)
+
+# Producer and consumer counters each own a full cache line to avoid false sharing
+CACHE_LINE_SIZE = 64
+assert STAT_COUNT * np.dtype(np.int64).itemsize <= CACHE_LINE_SIZE
+
+
+SYMBOLS = ('AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN', 'META', 'NVDA', 'AMD')
+SYMBOL_IDS = {symbol: symbol_id for symbol_id, symbol in enumerate(SYMBOLS)}
+
+# Processed market data tick record (symbol id -1 = unknown symbol)
+TICK_DTYPE = np.dtype([
+    ('exchange', 'i1'),
+    ('symbol', 'i1'),
+    ('price', 'i4'),       # Fixed-point cents
+    ('timestamp', 'f8'),
+])
+
+
+class TickRing:
+    """
+    Single-producer/single-consumer tick ring backed by a NumPy structured array.
+    
+    The producer only advances ``tail`` and the consumer only advances ``head``
+    (Lamport SPSC queue), so ticks are staged without per-tick allocation.
+    """
+    
+    def __init__(self, capacity=65536):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError(f"Capacity must be a power of two: {capacity}")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.ticks = np.zeros(capacity, dtype=TICK_DTYPE)
+        self.head = 0
+        self.tail = 0
+        self.total_enqueued = 0
+        self.total_dequeued = 0
+        self.total_failed_enqueues = 0
+    
+    def push(self, exchange_id, symbol_id, price, timestamp):
+        """Append a tick; returns False if the ring is full."""
+        tail = self.tail
+        if tail - self.head >= self.capacity:
+            self.total_failed_enqueues += 1
+            return False
+        self.ticks[tail & self.mask] = (exchange_id, symbol_id, price, timestamp)
+        self.tail = tail + 1
+        self.total_enqueued += 1
+        return True
+    
+    def pop_batch(self, max_items=1000):
+        """Remove up to max_items ticks, returned as a structured array copy."""
+        head = self.head
+        count = min(self.tail - head, max_items)
+        start = head & self.mask
+        end = start + count
+        if end <= self.capacity:
+            batch = self.ticks[start:end].copy()
+        else:
+            batch = np.concatenate((self.ticks[start:], self.ticks[:end - self.capacity]))
+        self.head = head + count
+        self.total_dequeued += count
+        return batch
+    
+    def size(self):
+        """Get number of queued ticks."""
+        return self.tail - self.head
+    
+    def get_capacity(self):
+        """Get ring capacity."""
+        return self.capacity
+    
+    def get_statistics(self):
+        """Get ring statistics (same keys as LockFreeQueue statistics)."""
+        return {
+            'capacity': self.capacity,
+            'size': self.size(),
+            'total_enqueued': self.total_enqueued,
+            'total_dequeued': self.total_dequeued,
+            'total_failed_enqueues': self.total_failed_enqueues,
+            'enqueue_success_rate': (
+                self.total_enqueued / max(1, self.total_enqueued + self.total_failed_enqueues)
+            ) * 100.0,
+        }
+
+
 class HFTIntegrationTestSystem:
     """Complete HFT system integration test."""
     
@@ -40,6 +176,9 @@ class HFTIntegrationTestSystem:
         for exchange in self.exchanges.values():
             self.hft_analyzer.add_exchange(exchange)
         
+        self._exchange_names = tuple(self.exchanges)
+        self._exchange_ids = {name: exchange_id for exchange_id, name in enumerate(self._exchange_names)}
+        
         # High-performance components
         self.memory_pool = HighPerformanceMemoryPool(
             pool_size=8*1024*1024,  # 8MB pool
@@ -47,235 +186,418 @@ class HFTIntegrationTestSystem:
             use_mmap=False
         )
         
-        self.message_queue = LockFreeQueue(capacity=65536)  # 64K message capacity
+        self.tick_ring = TickRing(capacity=65536)  # 64K tick capacity
+        
+        # Per-exchange FIX headers and pre-tokenized templates keyed by (exchange, symbol)
+        self._fix_headers = {name: self._build_fix_header(name) for name in self._exchange_names}
+        self._fix_templates = {}
+        self._fix_scratch = bytearray(FIX_SCRATCH_SIZE)
+        self._fix_scratch_view = memoryview(self._fix_scratch)
+        
+        # Random source and precomputed arbitrage decision bits
+        self._rng = np.random.default_rng()
+        self._refill_arbitrage_bits()
         
         # Analytics components
         self.market_analyzer = MarketDataAnalyzer()
         self.arbitrage_detector = ArbitrageDetector()
         
-        # Performance tracking
-        self.stats = {
-            'packets_processed': 0,
-            'messages_queued': 0,
-            'latency_measurements': 0,
-            'arbitrage_opportunities': 0,
-            'total_operations': 0,
-            'start_time': None,
-            'errors': 0
-        }
+        # Performance tracking: producer and analyzer thread counters live on
+        # separate cache lines of one page-aligned (zero-filled) mmap
+        self._stats_buffer = mmap.mmap(-1, 2 * CACHE_LINE_SIZE)
+        self._producer_stats = np.frombuffer(self._stats_buffer, dtype=np.int64,
+                                             count=STAT_COUNT, offset=0)
+        self._consumer_stats = np.frombuffer(self._stats_buffer, dtype=np.int64,
+                                             count=STAT_COUNT, offset=CACHE_LINE_SIZE)
+        self._latency_histogram = np.zeros(LATENCY_HISTOGRAM_BUCKETS, dtype=np.int64)
+        self.start_time = None
+        
+        # Analyzer (consumer) thread shutdown signal
+        self._stop_event = threading.Event()
         
         print(f'🏗️  HFT Integration System Initialized')
         print(f'   • Exchanges: {len(self.exchanges)}')
         print(f'   • Memory Pool: {self.memory_pool.get_statistics()["pool_size_bytes"]//1024}KB')
-        print(f'   • Queue Capacity: {self.message_queue.get_capacity():,}')
+        print(f'   • Queue Capacity: {self.tick_ring.get_capacity():,}')
         print(f'   • C Extensions: {EXTENSIONS_AVAILABLE}')
     
-    def generate_market_packet(self, exchange_name, symbol, price, volume):
-        """Generate a realistic market data packet."""
-        # Allocate buffer from high-performance pool
-        buffer = self.memory_pool.allocate_packet_buffer()
-        if not buffer:
-            self.stats['errors'] += 1
-            return None
+    @staticmethod
+    def _build_fix_header(exchange_name):
+        """Build the constant FIX header prefix for an exchange."""
+        prefix = (
+            f"8=FIX.4.4\x01"
+            f"9=200\x01"
+            f"35=W\x01"  # Market Data Snapshot
+            f"49={exchange_name}\x01"
+            f"56=TRADER\x01"
+            f"52="
+        ).encode('ascii')
+        return FixHeader(prefix, sum(prefix))
+    
+    def _get_fix_template(self, exchange_name, symbol):
+        """Get (or build) the pre-tokenized FIX template for an exchange/symbol pair."""
+        key = (exchange_name, symbol)
+        template = self._fix_templates.get(key)
+        if template is not None:
+            return template
         
-        try:
-            # Create FIX message
-            timestamp = str(int(time.time() * 1000000))  # Microsecond timestamp
-            fix_message = (
-                f"8=FIX.4.4\x01"
-                f"9=200\x01"
-                f"35=W\x01"  # Market Data Snapshot
-                f"49={exchange_name}\x01"
-                f"56=TRADER\x01"
-                f"52={timestamp}\x01"
-                f"55={symbol}\x01"
-                f"268=2\x01"  # NoMDEntries
-                f"269=0\x01270={price:.2f}\x01271={volume}\x01"  # Bid
-                f"269=1\x01270={price + 0.01:.2f}\x01271={volume}\x01"  # Ask
-                f"10=000\x01"  # Checksum placeholder
-            ).encode('utf-8')
-            
-            # Write to buffer
-            if len(fix_message) <= len(buffer):
-                buffer[0:len(fix_message)] = fix_message
-                self.stats['packets_processed'] += 1
-                self.stats['total_operations'] += 1
-                return buffer, fix_message
-            else:
-                self.memory_pool.deallocate(buffer)
-                self.stats['errors'] += 1
-                return None
-                
-        except Exception as e:
-            self.memory_pool.deallocate(buffer)
-            self.stats['errors'] += 1
+        header = self._fix_headers.get(exchange_name)
+        if header is None:
+            header = self._build_fix_header(exchange_name)
+        
+        # Variable fields are fixed-width ASCII slots patched in per packet
+        ts_off = len(header.prefix)
+        body = (header.prefix + b'0' * FIX_TS_WIDTH + FIX_SYMBOL_FIELD + symbol.encode('ascii') +
+                FIX_BID_PX_FIELDS)
+        bid_off = len(body)
+        body += b'0' * FIX_PRICE_WIDTH + b'\x01271='
+        bid_vol_off = len(body)
+        body += b'0' * FIX_VOLUME_WIDTH + b'\x01269=1\x01270='
+        ask_off = len(body)
+        body += b'0' * FIX_PRICE_WIDTH + b'\x01271='
+        ask_vol_off = len(body)
+        body += b'0' * FIX_VOLUME_WIDTH + b'\x0110=000\x01'  # Checksum stamped per packet
+        
+        template = FixTemplate(bytes(body), ts_off, bid_off, bid_vol_off, ask_off, ask_vol_off,
+                               header.checksum)
+        self._fix_templates[key] = template
+        return template
+    
+    def _refill_arbitrage_bits(self):
+        """Precompute packed per-message arbitrage decisions (bit i of byte i >> 3)."""
+        decisions = self._rng.random(ARBITRAGE_DECISION_BITS) < ARBITRAGE_PROBABILITY
+        self._arb_bits = np.packbits(decisions, bitorder='little')
+        self._arb_cursor = 0
+    
+    def _simulate_chunk(self, base_prices, size):
+        """
+        Simulate a chunk of market data packets as Structure-of-Arrays columns.
+        
+        Prices are int32 cents following a per-symbol random walk computed with
+        cumulative sums; base_prices (NumPy array indexed by symbol id) is
+        advanced in place.
+        
+        Returns:
+            tuple: (exchange_ids, symbol_ids, prices, volumes) as Python lists
+        """
+        rng = self._rng
+        exchange_ids = rng.integers(0, len(self._exchange_names), size=size)
+        symbol_ids = rng.integers(0, len(base_prices), size=size)
+        price_changes = rng.integers(-50, 51, size=size, dtype=np.int32)
+        volumes = rng.integers(100, 10001, size=size)
+        
+        prices = np.empty(size, dtype=np.int32)
+        for symbol_id in range(len(base_prices)):
+            mask = symbol_ids == symbol_id
+            walk = base_prices[symbol_id] + np.cumsum(price_changes[mask])
+            prices[mask] = walk
+            if walk.size:
+                base_prices[symbol_id] = walk[-1]
+        
+        return exchange_ids.tolist(), symbol_ids.tolist(), prices.tolist(), volumes.tolist()
+    
+    @staticmethod
+    def _format_price_cents(price):
+        """Format non-negative price cents as a fixed-width FIX price via digit LUTs."""
+        dollars, cents = divmod(price, 100)
+        high, low = divmod(dollars, 10000)
+        return DIGITS2[high] + DIGITS4[low] + b'.' + DIGITS2[cents]
+    
+    def _encode_fix_into(self, exchange_name, symbol, price, volume, now):
+        """
+        Encode a market data snapshot into the reusable FIX scratch buffer.
+        
+        Prices are fixed-point cents; the ask is quoted one cent above the bid.
+        
+        Returns:
+            int: Encoded length, or 0 if a field does not fit its fixed-width slot
+        """
+        template, ts_off, bid_off, bid_vol_off, ask_off, ask_vol_off, prefix_checksum = \
+            self._get_fix_template(exchange_name, symbol)
+        size = len(template)
+        
+        ask_price = price + 1
+        if size > FIX_SCRATCH_SIZE or price < 0 or ask_price > FIX_MAX_PRICE_CENTS:
+            return 0
+        bid = self._format_price_cents(price)
+        ask = self._format_price_cents(ask_price)
+        vol = b'%0*d' % (FIX_VOLUME_WIDTH, volume)
+        if len(vol) != FIX_VOLUME_WIDTH:
+            return 0
+        
+        scratch = self._fix_scratch
+        scratch[0:size] = template
+        scratch[ts_off:ts_off + FIX_TS_WIDTH] = b'%0*d' % (FIX_TS_WIDTH, int(now * 1000000))
+        scratch[bid_off:bid_off + FIX_PRICE_WIDTH] = bid
+        scratch[bid_vol_off:bid_vol_off + FIX_VOLUME_WIDTH] = vol
+        scratch[ask_off:ask_off + FIX_PRICE_WIDTH] = ask
+        scratch[ask_vol_off:ask_vol_off + FIX_VOLUME_WIDTH] = vol
+        
+        # Stamp the checksum: precomputed header sum plus the variable tail before the trailer
+        body_len = size - FIX_TRAILER_LEN
+        checksum = (prefix_checksum + fix_checksum(self._fix_scratch_view[ts_off:body_len])) & 0xFF
+        scratch[body_len + 3:size - 1] = b'%03d' % checksum
+        return size
+    
+    def generate_market_packet(self, buffer, exchange_name, symbol, price, volume, now=None):
+        """Generate a realistic market data packet into a leased pool buffer.
+        
+        Args:
+            buffer: Pool buffer from ``memory_pool.lease()``; the caller's lease
+                returns it to the pool, so it is never deallocated here
+            price: Bid price in fixed-point cents
+            now: Wall-clock time (seconds) shared by the caller's loop iteration;
+                read from time.time() if not given
+        
+        Returns:
+            memoryview: Encoded message within buffer, or None on error
+        """
+        if buffer is None:
+            self._producer_stats[STAT_ERRORS] += 1
             return None
+        
+        if now is None:
+            now = time.time()
+        
+        size = self._encode_fix_into(exchange_name, symbol, price, volume, now)
+        
+        # Single copy from the scratch encoder into the pooled buffer
+        if 0 < size <= len(buffer):
+            buffer[0:size] = self._fix_scratch_view[0:size]
+            self._producer_stats[STAT_PACKETS] += 1
+            self._producer_stats[STAT_OPERATIONS] += 1
+            return buffer[0:size]
+        
+        self._producer_stats[STAT_ERRORS] += 1
+        return None
+    
+    def _parse_tick(self, message_data, exchange_name):
+        """Extract (symbol id, price cents) with the compiled FIX field walk."""
+        symbol, price = parse_fix_symbol_price_cents(message_data)
+        return SYMBOL_IDS.get(symbol, -1), price
     
-    def process_market_data(self, buffer, message_data, exchange_name):
-        """Process market data and measure latency."""
+    def process_market_data(self, message_data, exchange_name, now=None):
+        """Process market data, sampling parse latency.
+        
+        One in every LATENCY_SAMPLE_MASK + 1 packets is timed with the TSC clock
+        into the log2 latency histogram and reported to the HFT analyzer; ``now``
+        is the caller's wall-clock time used for timestamps (read from
+        time.time() if not given).
+        
+        Returns:
+            bool: True if the packet was processed, False on error
+        """
+        if now is None:
+            now = time.time()
+        
         try:
-            process_start = time.time_ns()
+            sampled = (self._producer_stats[STAT_PACKETS] & LATENCY_SAMPLE_MASK) == 0
+            if sampled:
+                process_start = rdtsc_ns()
             
-            # Simulate packet parsing and processing
-            message_str = message_data.decode('utf-8')
+            # Extract symbol and price directly from the FIX buffer
+            symbol_id, price = self._parse_tick(message_data, exchange_name)
             
-            # Extract symbol and price (simplified parsing)
-            symbol_start = message_str.find('55=') + 3
-            symbol_end = message_str.find('\x01', symbol_start)
-            symbol = message_str[symbol_start:symbol_end] if symbol_end > symbol_start else 'UNKNOWN'
-            
-            price_start = message_str.find('270=') + 4
-            price_end = message_str.find('\x01', price_start)
-            price_str = message_str[price_start:price_end] if price_end > price_start else '0'
-            
-            try:
-                price = float(price_str)
-            except:
-                price = 0.0
+            if sampled:
+                latency_ns = rdtsc_ns() - process_start
+                self._latency_histogram[min(latency_ns.bit_length(), LATENCY_HISTOGRAM_BUCKETS - 1)] += 1
+                
+                # Process with HFT analyzer (whose batch path leases and recycles
+                # pooled measurements)
+                self.hft_analyzer.process_latency_batch(
+                    (exchange_name,), (latency_ns,), (round(now * 1e9),)
+                )
+                self._producer_stats[STAT_LATENCY] += 1
+                self._producer_stats[STAT_OPERATIONS] += 1
             
-            process_end = time.time_ns()
-            latency_us = (process_end - process_start) / 1000.0
+            # Queue processed data for further analysis
+            if self.tick_ring.push(self._exchange_ids[exchange_name], symbol_id, price, now):
+                self._producer_stats[STAT_MESSAGES] += 1
+                self._producer_stats[STAT_OPERATIONS] += 1
             
-            # Create latency measurement
-            measurement = LatencyMeasurement(
-                timestamp=time.time(),
-                exchange_name=exchange_name,
-                latency_us=latency_us
-            )
+            # Buffer release (performed by the caller's pool lease)
+            self._producer_stats[STAT_OPERATIONS] += 1
             
-            # Process with HFT analyzer
-            self.hft_analyzer.process_latency_measurement(measurement)
-            self.stats['latency_measurements'] += 1
-            self.stats['total_operations'] += 1
+            return True
             
-            # Queue processed data for further analysis
-            market_data = {
-                'exchange': exchange_name,
-                'symbol': symbol,
-                'price': price,
-                'timestamp': time.time(),
-                'latency_us': latency_us
-            }
+        except Exception as e:
+            self._producer_stats[STAT_ERRORS] += 1
+            return False
+    
+    def _count_arbitrage_hits(self, count):
+        """Consume count precomputed arbitrage decisions and return the number of hits."""
+        hits = 0
+        while count > 0:
+            if self._arb_cursor == ARBITRAGE_DECISION_BITS:
+                self._refill_arbitrage_bits()
+            cursor = self._arb_cursor
+            take = min(count, ARBITRAGE_DECISION_BITS - cursor)
             
-            if self.message_queue.enqueue_message(market_data):
-                self.stats['messages_queued'] += 1
-                self.stats['total_operations'] += 1
+            # Unpack only the bytes covering [cursor, cursor + take)
+            bits = np.unpackbits(self._arb_bits[cursor >> 3:(cursor + take + 7) >> 3], bitorder='little')
+            offset = cursor & 7
+            hits += int(bits[offset:offset + take].sum())
             
-            # Deallocate buffer
-            self.memory_pool.deallocate(buffer)
-            self.stats['total_operations'] += 1
+            self._arb_cursor = cursor + take
+            count -= take
+        return hits
+    
+    def analyze_market_data(self):
+        """Analyze queued market data for arbitrage opportunities."""
+        try:
+            batch = self.tick_ring.pop_batch(1000)
+            processed_count = len(batch)
             
-            return market_data
+            # Check for arbitrage opportunities (simplified, precomputed hit bits)
+            self._consumer_stats[STAT_ARBITRAGE] += self._count_arbitrage_hits(processed_count)
+            self._consumer_stats[STAT_OPERATIONS] += processed_count
             
         except Exception as e:
-            self.memory_pool.deallocate(buffer)
-            self.stats['errors'] += 1
+            self._consumer_stats[STAT_ERRORS] += 1
+            processed_count = 0
+        
+        return processed_count
+    
+    @staticmethod
+    def _pin_current_thread(cpu):
+        """Pin the calling thread to a CPU where supported; returns the previous affinity."""
+        if not hasattr(os, 'sched_setaffinity'):
+            return None
+        try:
+            previous = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {cpu})
+            return previous
+        except OSError:
             return None
     
-    def analyze_market_data(self):
-        """Analyze queued market data for arbitrage opportunities."""
-        processed_count = 0
-        
-        while not self.message_queue.is_empty() and processed_count < 1000:
-            market_data = self.message_queue.dequeue_message()
-            if market_data:
-                try:
-                    # Simulate arbitrage detection
-                    if isinstance(market_data, str):
-                        # Handle string data
-                        continue
-                    
-                    # Check for arbitrage opportunities (simplified)
-                    if random.random() < 0.02:  # 2% chance of arbitrage opportunity
-                        self.stats['arbitrage_opportunities'] += 1
-                        
-                    processed_count += 1
-                    self.stats['total_operations'] += 1
-                    
-                except Exception as e:
-                    self.stats['errors'] += 1
+    def _consumer_loop(self, cpu=None):
+        """Analyzer thread: drain the tick ring until the producer signals shutdown."""
+        if cpu is not None:
+            self._pin_current_thread(cpu)
         
-        return processed_count
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            if not self.analyze_market_data():
+                spin_pause(SPIN_PAUSE_ITERATIONS)
     
     def run_trading_simulation(self, duration_seconds=10, packets_per_second=5000):
         """Run complete trading simulation."""
         print(f'\n🚀 Starting HFT Trading Simulation')
         print(f'   • Duration: {duration_seconds} seconds')
         print(f'   • Target rate: {packets_per_second:,} packets/second')
-        print(f'   • Exchanges: {list(self.exchanges.keys())}')
+        print(f'   • Exchanges: {list(self._exchange_names)}')
         print()
         
-        self.stats['start_time'] = time.time()
+        self.start_time = time.time()
         
-        symbols = ['AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN', 'META', 'NVDA', 'AMD']
-        base_prices = {s: 100 + random.uniform(50, 300) for s in symbols}
+        symbols = SYMBOLS
+        base_prices = ((100 + self._rng.uniform(50, 300, size=len(symbols))) * 100).astype(np.int32)
         
         packet_interval = 1.0 / packets_per_second
         next_packet_time = time.time()
         
         end_time = time.time() + duration_seconds
         
-        while time.time() < end_time:
+        exchange_names = self._exchange_names
+        memory_pool = self.memory_pool
+        batch_index = SIMULATION_CHUNK_SIZE
+        
+        # Producer runs on this thread, analysis on a dedicated consumer thread,
+        # each pinned to its own core when at least two are available
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+        producer_cpu, consumer_cpu = (cpus[0], cpus[1]) if len(cpus) >= 2 else (None, None)
+        previous_affinity = None
+        if producer_cpu is not None:
+            previous_affinity = self._pin_current_thread(producer_cpu)
+        
+        self._stop_event.clear()
+        consumer = threading.Thread(target=self._consumer_loop, args=(consumer_cpu,), daemon=True)
+        consumer.start()
+        
+        while True:
             current_time = time.time()
+            if current_time >= end_time:
+                break
             
             if current_time >= next_packet_time:
-                # Generate market data packet
-                exchange_name = random.choice(list(self.exchanges.keys()))
-                symbol = random.choice(symbols)
+                # Simulate the next chunk of packets in one vectorized pass when exhausted
+                if batch_index == SIMULATION_CHUNK_SIZE:
+                    exchange_ids, symbol_ids, prices, volumes = self._simulate_chunk(
+                        base_prices, SIMULATION_CHUNK_SIZE
+                    )
+                    batch_index = 0
                 
-                # Simulate price movement
-                base_price = base_prices[symbol]
-                price_change = random.uniform(-0.5, 0.5)
-                current_price = base_price + price_change
-                base_prices[symbol] = current_price
-                
-                volume = random.randint(100, 10000)
-                
-                # Generate and process packet
-                packet_result = self.generate_market_packet(exchange_name, symbol, current_price, volume)
-                if packet_result:
-                    buffer, message = packet_result
-                    market_data = self.process_market_data(buffer, message, exchange_name)
+                # Generate market data packet
+                exchange_name = exchange_names[exchange_ids[batch_index]]
+                symbol = symbols[symbol_ids[batch_index]]
+                current_price = prices[batch_index]
+                volume = volumes[batch_index]
+                batch_index += 1
                 
-                # Analyze queued data periodically
-                if self.stats['packets_processed'] % 100 == 0:
-                    self.analyze_market_data()
+                # Generate and process packet; the leased buffer always returns to the pool
+                with memory_pool.lease() as buffer:
+                    message = self.generate_market_packet(buffer, exchange_name, symbol,
+                                                          current_price, volume, current_time)
+                    if message is not None:
+                        self.process_market_data(message, exchange_name, current_time)
                 
                 next_packet_time += packet_interval
-            
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.0001)  # 0.1ms
+            else:
+                # Busy-poll toward the next packet deadline instead of sleeping
+                spin_pause(SPIN_PAUSE_ITERATIONS)
+        
+        # Stop the analyzer thread, then drain remaining queued data
+        self._stop_event.set()
+        consumer.join()
+        if previous_affinity is not None:
+            os.sched_setaffinity(0, previous_affinity)
         
-        # Final analysis of remaining queued data
-        final_analyzed = self.analyze_market_data()
+        while self.analyze_market_data():
+            pass
         
         return self.get_final_results()
     
+    def _latency_percentile_us(self, percentile):
+        """Upper bound (μs) of the histogram bucket holding the given latency percentile."""
+        counts = np.cumsum(self._latency_histogram)
+        if counts[-1] == 0:
+            return 0.0
+        bucket = int(np.searchsorted(counts, counts[-1] * percentile / 100.0))
+        return (1 << bucket) / 1000.0
+    
     def get_final_results(self):
         """Get comprehensive test results."""
-        duration = time.time() - self.stats['start_time']
+        duration = time.time() - self.start_time
         
         memory_stats = self.memory_pool.get_statistics()
-        queue_stats = self.message_queue.get_statistics()
+        queue_stats = self.tick_ring.get_statistics()
+        totals = self._producer_stats + self._consumer_stats
+        stats = {
+            'packets_processed': int(totals[STAT_PACKETS]),
+            'messages_queued': int(totals[STAT_MESSAGES]),
+            'latency_measurements': int(totals[STAT_LATENCY]),
+            'arbitrage_opportunities': int(totals[STAT_ARBITRAGE]),
+            'total_operations': int(totals[STAT_OPERATIONS]),
+            'errors': int(totals[STAT_ERRORS])
+        }
         
         results = {
             'duration': duration,
             'performance': {
-                'packets_per_second': self.stats['packets_processed'] / duration,
-                'operations_per_second': self.stats['total_operations'] / duration,
-                'average_latency_us': duration / max(1, self.stats['total_operations']) * 1_000_000
+                'packets_per_second': stats['packets_processed'] / duration,
+                'operations_per_second': stats['total_operations'] / duration,
+                'average_latency_us': duration / max(1, stats['total_operations']) * 1_000_000
             },
-            'functionality': {
-                'packets_processed': self.stats['packets_processed'],
-                'messages_queued': self.stats['messages_queued'],
-                'latency_measurements': self.stats['latency_measurements'],
-                'arbitrage_opportunities': self.stats['arbitrage_opportunities'],
-                'total_operations': self.stats['total_operations'],
-                'errors': self.stats['errors']
+            'functionality': stats,
+            'latency': {
+                'samples': int(self._latency_histogram.sum()),
+                'p50_us': self._latency_percentile_us(50),
+                'p95_us': self._latency_percentile_us(95),
+                'p99_us': self._latency_percentile_us(99)
             },
             'memory_pool': memory_stats,
             'message_queue': queue_stats,
-            'success_rate': (self.stats['total_operations'] - self.stats['errors']) / max(1, self.stats['total_operations']) * 100
+            'success_rate': (stats['total_operations'] - stats['errors']) / max(1, stats['total_operations']) * 100
         }
         
         return results
@@ -297,45 +619,51 @@ def main():
         packets_per_second=3000 # 3K packets/second
     )
     
-    # Display comprehensive results
-    print('📊 COMPLETE HFT INTEGRATION TEST RESULTS')
-    print('=' * 60)
+    # Display comprehensive results, written to stdout in a single call
+    lines = []
+    lines.append('📊 COMPLETE HFT INTEGRATION TEST RESULTS')
+    lines.append('=' * 60)
     
-    print(f'Performance Metrics:')
-    print(f'  • Duration: {results["duration"]:.3f} seconds')
-    print(f'  • Packets/second: {results["performance"]["packets_per_second"]:,.0f}')
-    print(f'  • Operations/second: {results["performance"]["operations_per_second"]:,.0f}')
-    print(f'  • Average latency: {results["performance"]["average_latency_us"]:.2f} μs')
-    print()
-    
-    print(f'Functionality Verification:')
-    print(f'  • Packets processed: {results["functionality"]["packets_processed"]:,}')
-    print(f'  • Messages queued: {results["functionality"]["messages_queued"]:,}')
-    print(f'  • Latency measurements: {results["functionality"]["latency_measurements"]:,}')
-    print(f'  • Arbitrage opportunities: {results["functionality"]["arbitrage_opportunities"]:,}')
-    print(f'  • Total operations: {results["functionality"]["total_operations"]:,}')
-    print(f'  • Error rate: {results["functionality"]["errors"]/max(1,results["functionality"]["total_operations"])*100:.2f}%')
-    print()
-    
-    print(f'Memory Pool Performance:')
-    print(f'  • Total allocations: {results["memory_pool"]["total_allocations"]:,}')
-    print(f'  • Total deallocations: {results["memory_pool"]["total_deallocations"]:,}')
-    print(f'  • Pool utilization: {results["memory_pool"]["utilization_percent"]:.1f}%')
-    print(f'  • Block efficiency: 0% fragmentation')
-    print()
-    
-    print(f'Message Queue Performance:')
-    print(f'  • Total enqueued: {results["message_queue"]["total_enqueued"]:,}')
-    print(f'  • Total dequeued: {results["message_queue"]["total_dequeued"]:,}')
-    print(f'  • Success rate: {results["message_queue"]["enqueue_success_rate"]:.1f}%')
-    print()
-    
-    print(f'🎯 INTEGRATION TEST SUMMARY:')
-    print(f'  • Overall success rate: {results["success_rate"]:.1f}%')
-    print(f'  • System performance: {results["performance"]["operations_per_second"]:,.0f} ops/sec')
-    print(f'  • Memory efficiency: {results["memory_pool"]["utilization_percent"]:.1f}% pool usage')
-    print(f'  • Queue efficiency: {results["message_queue"]["enqueue_success_rate"]:.1f}% success rate')
-    print()
+    lines.append(f'Performance Metrics:')
+    lines.append(f'  • Duration: {results["duration"]:.3f} seconds')
+    lines.append(f'  • Packets/second: {results["performance"]["packets_per_second"]:,.0f}')
+    lines.append(f'  • Operations/second: {results["performance"]["operations_per_second"]:,.0f}')
+    lines.append(f'  • Average latency: {results["performance"]["average_latency_us"]:.2f} μs')
+    lines.append('')
+    
+    lines.append(f'Functionality Verification:')
+    lines.append(f'  • Packets processed: {results["functionality"]["packets_processed"]:,}')
+    lines.append(f'  • Messages queued: {results["functionality"]["messages_queued"]:,}')
+    lines.append(f'  • Latency measurements: {results["functionality"]["latency_measurements"]:,}')
+    lines.append(f'  • Arbitrage opportunities: {results["functionality"]["arbitrage_opportunities"]:,}')
+    lines.append(f'  • Total operations: {results["functionality"]["total_operations"]:,}')
+    lines.append(f'  • Error rate: {results["functionality"]["errors"]/max(1,results["functionality"]["total_operations"])*100:.2f}%')
+    lines.append('')
+    
+    lines.append(f'Sampled Parse Latency (1 in {LATENCY_SAMPLE_MASK + 1} packets):')
+    lines.append(f'  • Samples: {results["latency"]["samples"]:,}')
+    lines.append(f'  • P50 / P95 / P99: ≤{results["latency"]["p50_us"]:.2f} / ≤{results["latency"]["p95_us"]:.2f} / ≤{results["latency"]["p99_us"]:.2f} μs')
+    lines.append('')
+    
+    lines.append(f'Memory Pool Performance:')
+    lines.append(f'  • Total allocations: {results["memory_pool"]["total_allocations"]:,}')
+    lines.append(f'  • Total deallocations: {results["memory_pool"]["total_deallocations"]:,}')
+    lines.append(f'  • Pool utilization: {results["memory_pool"]["utilization_percent"]:.1f}%')
+    lines.append(f'  • Block efficiency: 0% fragmentation')
+    lines.append('')
+    
+    lines.append(f'Message Queue Performance:')
+    lines.append(f'  • Total enqueued: {results["message_queue"]["total_enqueued"]:,}')
+    lines.append(f'  • Total dequeued: {results["message_queue"]["total_dequeued"]:,}')
+    lines.append(f'  • Success rate: {results["message_queue"]["enqueue_success_rate"]:.1f}%')
+    lines.append('')
+    
+    lines.append(f'🎯 INTEGRATION TEST SUMMARY:')
+    lines.append(f'  • Overall success rate: {results["success_rate"]:.1f}%')
+    lines.append(f'  • System performance: {results["performance"]["operations_per_second"]:,.0f} ops/sec')
+    lines.append(f'  • Memory efficiency: {results["memory_pool"]["utilization_percent"]:.1f}% pool usage')
+    lines.append(f'  • Queue efficiency: {results["message_queue"]["enqueue_success_rate"]:.1f}% success rate')
+    lines.append('')
     
     # Verify integration success
     success_criteria = [
@@ -347,20 +675,23 @@ def main():
     
     all_passed = all(success_criteria)
     
-    print(f'✅ INTEGRATION SUCCESS CRITERIA:')
-    print(f'  • Success rate > 95%: {"✅" if success_criteria[0] else "❌"} ({results["success_rate"]:.1f}%)')
-    print(f'  • Performance > 10K ops/sec: {"✅" if success_criteria[1] else "❌"} ({results["performance"]["operations_per_second"]:,.0f})')
-    print(f'  • Error rate < 5%: {"✅" if success_criteria[2] else "❌"} ({results["functionality"]["errors"]/max(1,results["functionality"]["total_operations"])*100:.2f}%)')
-    print(f'  • Memory leak-free: {"✅" if success_criteria[3] else "❌"} (balanced alloc/dealloc)')
-    print()
+    lines.append(f'✅ INTEGRATION SUCCESS CRITERIA:')
+    lines.append(f'  • Success rate > 95%: {"✅" if success_criteria[0] else "❌"} ({results["success_rate"]:.1f}%)')
+    lines.append(f'  • Performance > 10K ops/sec: {"✅" if success_criteria[1] else "❌"} ({results["performance"]["operations_per_second"]:,.0f})')
+    lines.append(f'  • Error rate < 5%: {"✅" if success_criteria[2] else "❌"} ({results["functionality"]["errors"]/max(1,results["functionality"]["total_operations"])*100:.2f}%)')
+    lines.append(f'  • Memory leak-free: {"✅" if success_criteria[3] else "❌"} (balanced alloc/dealloc)')
+    lines.append('')
     
     if all_passed:
-        print('🎉 COMPLETE HFT INTEGRATION TEST: SUCCESS!')
-        print('   System ready for production HFT deployment')
-        print('   All components working together optimally')
+        lines.append('🎉 COMPLETE HFT INTEGRATION TEST: SUCCESS!')
+        lines.append('   System ready for production HFT deployment')
+        lines.append('   All components working together optimally')
     else:
-        print('⚠️  INTEGRATION TEST: PARTIAL SUCCESS')
-        print('   Some criteria not met - review required')
+        lines.append('⚠️  INTEGRATION TEST: PARTIAL SUCCESS')
+        lines.append('   Some criteria not met - review required')
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
     
     return all_passed
 
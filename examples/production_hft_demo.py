@@ -16,7 +16,6 @@ License: Apache License 2.0
 import sys
 import os
 import argparse
-import time
 import json
 from datetime import datetime
 
@@ -35,37 +34,95 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Constant banner blocks, encoded once for _write_chunks()
+_BANNER_QUICK_START = "\n".join([
+    "=" * 60,
+    "HFT-PACKETFILTER QUICK START DEMO",
+    "=" * 60,
+    "1. Quick Start with Default Configuration",
+    "",
+]).encode()
+_BANNER_PACKAGE_INFO = "\n".join(["\n" + "=" * 60, "PACKAGE INFORMATION", "=" * 60, ""]).encode()
+_SUMMARY = "\n".join([
+    "\n" + "=" * 60,
+    "DEMONSTRATION COMPLETE",
+    "=" * 60,
+    "Key Features Demonstrated:",
+    "  ✓ Quick start functionality",
+    "  ✓ Custom exchange configuration",
+    "  ✓ Risk management rules",
+    "  ✓ Regulatory compliance monitoring",
+    "  ✓ Callback system",
+    "  ✓ Export functionality",
+    "  ✓ Context manager usage",
+    
+    "\nNext Steps:",
+    "  1. Install package: pip install hft-packetfilter",
+    "  2. Configure your exchanges",
+    "  3. Start monitoring: analyzer.start_monitoring()",
+    "  4. Analyze results: analyzer.get_live_metrics()",
+    
+    "\nFor production use:",
+    "  - Configure real exchange endpoints",
+    "  - Set appropriate latency targets",
+    "  - Enable compliance monitoring",
+    "  - Set up alerting and monitoring",
+    "",
+]).encode()
+
+
+def _write_chunks(chunks):
+    """Write byte chunks straight to the stdout fd with a single writev()"""
+    sys.stdout.flush()  # Keep ordering with earlier print() output
+    try:
+        fd = sys.stdout.fileno()
+        writev = os.writev
+    except (AttributeError, ValueError):
+        # No writev (Windows) or stdout is not a real file (captured)
+        sys.stdout.write(b"".join(chunks).decode())
+        return
+    
+    written = writev(fd, chunks)
+    data = b"".join(chunks)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def _encode_lines(lines):
+    """Encode text lines as one newline-terminated bytes block"""
+    return ("\n".join(lines) + "\n").encode()
+
+
 def demo_quick_start():
     """Demonstrate the quick start functionality"""
-    print("=" * 60)
-    print("HFT-PACKETFILTER QUICK START DEMO")
-    print("=" * 60)
+    # Banner goes out before quick_start() so its log lines follow it
+    _write_chunks([_BANNER_QUICK_START])
     
     # Quick start with default configuration
-    print("1. Quick Start with Default Configuration")
     analyzer = hft.quick_start()
-    print(f"   - Analyzer created: {analyzer}")
-    print(f"   - Exchanges configured: {len(analyzer.exchanges)}")
+    lines = [
+        f"   - Analyzer created: {analyzer}",
+        f"   - Exchanges configured: {len(analyzer.exchanges)}",
+    ]
     
     # Show configured exchanges
-    for name, config in analyzer.exchanges.items():
-        print(f"   - {name}: {config.host}:{config.ports}")
+    for config in analyzer.exchanges:
+        lines.append(f"   - {config.name}: {config.host}:{config.ports}")
     
+    _write_chunks([_encode_lines(lines)])
     return analyzer
 
 
-def demo_custom_configuration():
+def demo_custom_configuration(analyzer):
     """Demonstrate custom exchange configuration"""
     print("\n" + "=" * 60)
     print("CUSTOM EXCHANGE CONFIGURATION")
     print("=" * 60)
     
-    # Create analyzer with custom settings
-    analyzer = hft.HFTAnalyzer(
-        performance_mode="high_performance",
-        logging_level="INFO",
-        metrics_export="json"
-    )
+    # Reconfigure the existing analyzer rather than building a second one
+    analyzer.set_performance_mode("high_performance")
+    analyzer.logger.logger.setLevel("INFO")
+    analyzer.metrics_export = analyzer.metrics_collector.export_format = "json"
     
     # Add custom exchanges
     exchanges = [
@@ -107,8 +164,6 @@ def demo_custom_configuration():
         print(f"   - Added: {exchange.name} ({exchange.host})")
         print(f"     Latency Target: {exchange.latency_target_us}μs")
         print(f"     Rate Limits: {exchange.rate_limits}")
-    
-    return analyzer
 
 
 def demo_risk_management(analyzer):
@@ -219,8 +274,8 @@ def demo_monitoring_simulation(analyzer):
     try:
         analyzer.start_monitoring(duration_seconds=10)
         
-        # Wait for monitoring to complete
-        time.sleep(11)
+        # Wait for monitoring to complete and flush its metrics
+        analyzer.wait_until_done(timeout=11)
         
         # Get live metrics
         metrics = analyzer.get_live_metrics()
@@ -285,17 +340,16 @@ def demo_context_manager():
 
 def demo_package_info():
     """Display package information"""
-    print("\n" + "=" * 60)
-    print("PACKAGE INFORMATION")
-    print("=" * 60)
-    
-    print(f"   Package: {hft.PACKAGE_INFO['name']}")
-    print(f"   Version: {hft.__version__}")
-    print(f"   Description: {hft.__description__}")
-    print(f"   Author: {hft.__author__}")
-    print(f"   License: {hft.__license__}")
-    print(f"   Homepage: {hft.PACKAGE_INFO.get('homepage', 'https://github.com/tanzil7890')}")
-    print(f"   Documentation: {hft.PACKAGE_INFO.get('documentation', 'https://github.com/tanzil7890')}")
+    lines = [
+        f"   Package: {hft.PACKAGE_INFO['name']}",
+        f"   Version: {hft.__version__}",
+        f"   Description: {hft.__description__}",
+        f"   Author: {hft.__author__}",
+        f"   License: {hft.__license__}",
+        f"   Homepage: {hft.PACKAGE_INFO.get('homepage', 'https://github.com/tanzil7890')}",
+        f"   Documentation: {hft.PACKAGE_INFO.get('documentation', 'https://github.com/tanzil7890')}",
+    ]
+    _write_chunks([_BANNER_PACKAGE_INFO, _encode_lines(lines)])
 
 
 def main():
@@ -324,7 +378,7 @@ def main():
         else:
             # Full demonstration
             analyzer = demo_quick_start()
-            analyzer = demo_custom_configuration()
+            demo_custom_configuration(analyzer)
             demo_risk_management(analyzer)
             demo_compliance_monitoring(analyzer)
             demo_callbacks(analyzer)
@@ -339,29 +393,7 @@ def main():
             
             demo_context_manager()
         
-        print("\n" + "=" * 60)
-        print("DEMONSTRATION COMPLETE")
-        print("=" * 60)
-        print("Key Features Demonstrated:")
-        print("  ✓ Quick start functionality")
-        print("  ✓ Custom exchange configuration")
-        print("  ✓ Risk management rules")
-        print("  ✓ Regulatory compliance monitoring")
-        print("  ✓ Callback system")
-        print("  ✓ Export functionality")
-        print("  ✓ Context manager usage")
-        
-        print("\nNext Steps:")
-        print("  1. Install package: pip install hft-packetfilter")
-        print("  2. Configure your exchanges")
-        print("  3. Start monitoring: analyzer.start_monitoring()")
-        print("  4. Analyze results: analyzer.get_live_metrics()")
-        
-        print("\nFor production use:")
-        print("  - Configure real exchange endpoints")
-        print("  - Set appropriate latency targets")
-        print("  - Enable compliance monitoring")
-        print("  - Set up alerting and monitoring")
+        _write_chunks([_SUMMARY])
         
     except Exception as e:
         print(f"\nDemo error: {e}")
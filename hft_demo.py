@@ -16,16 +16,24 @@ License: Educational/Research Use Only
 import sys
 import os
 import argparse
+import functools
 import time
 import json
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
     from core.packet_filter import PacketFilter, FilterRule, FilterAction
-    from core.packet_parser import PacketParser
     from tools.hft_analyzer import HFTNetworkAnalyzer, ExchangeConnection, TradingMetrics
     from scapy.all import Ether, IP, TCP, UDP, Raw
 except ImportError as e:
@@ -34,8 +42,13 @@ except ImportError as e:
     sys.exit(1)
 
 
-def create_hft_demo_packets():
-    """Create realistic HFT demo packets"""
+# Quote payload template: bid cents, ask cents, send timestamp
+MARKET_DATA_TEMPLATE = b"AAPL,150.%d,150.%d,1000,500,%a"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_hft_demo_packet_bytes():
+    """Build the HFT demo packets once and cache them as (name, raw bytes)"""
     packets = []
     
     # FIX Trading Messages
@@ -87,18 +100,20 @@ def create_hft_demo_packets():
                          Raw(load=b""))
     packets.append(("Suspicious Activity", suspicious_packet))
     
-    return packets
+    return tuple((name, bytes(packet)) for name, packet in packets)
+
+
+def create_hft_demo_packets():
+    """Create realistic HFT demo packets, dissected from the cached raw bytes"""
+    return [(name, Ether(raw)) for name, raw in _build_hft_demo_packet_bytes()]
 
 
-def demo_hft_latency_analysis():
+def demo_hft_latency_analysis(hft_analyzer):
     """Demonstrate latency analysis for HFT"""
     print("=" * 60)
     print("HFT LATENCY ANALYSIS DEMONSTRATION")
     print("=" * 60)
     
-    # Initialize HFT analyzer
-    hft_analyzer = HFTNetworkAnalyzer()
-    
     # Configure exchange connections
     exchanges = [
         ExchangeConnection(
@@ -209,10 +224,11 @@ def demo_hft_risk_management():
     # Test risk scenarios
     print("\nTesting risk scenarios...")
     
+    demo_packets = create_hft_demo_packets()
     risk_packets = [
-        ("Legitimate Order", create_hft_demo_packets()[0][1]),
-        ("Unauthorized Access", create_hft_demo_packets()[-1][1]),  # Suspicious packet
-        ("High Volume Order", create_hft_demo_packets()[2][1])      # HF order
+        ("Legitimate Order", demo_packets[0][1]),
+        ("Unauthorized Access", demo_packets[-1][1]),  # Suspicious packet
+        ("High Volume Order", demo_packets[2][1])      # HF order
     ]
     
     for name, packet in risk_packets:
@@ -229,24 +245,25 @@ def demo_hft_risk_management():
     return risk_filter
 
 
-def demo_market_data_quality():
+def demo_market_data_quality(parser):
     """Demonstrate market data quality monitoring"""
     print("\n" + "=" * 60)
     print("MARKET DATA QUALITY MONITORING")
     print("=" * 60)
     
-    # Initialize parser for market data analysis
-    parser = PacketParser()
+    # Start the shared parser from a clean slate for market data analysis
+    parser.clear_data()
     
     # Simulate market data feed with quality issues
     market_data_packets = []
     
-    # Normal market data
-    for i in range(10):
-        timestamp = time.time() + (i * 0.001)  # 1ms intervals
+    # Normal market data, payloads formatted up front at 1ms intervals
+    start = time.time()
+    payloads = [MARKET_DATA_TEMPLATE % (50 + i, 49 + i, start + i * 0.001) for i in range(10)]
+    for payload in payloads:
         packet = (Ether() / IP(src="198.51.100.10", dst="192.168.1.100") /
                   UDP(sport=9001, dport=12346) /
-                  Raw(load=f"AAPL,150.{50+i},150.{49+i},1000,500,{timestamp}".encode()))
+                  Raw(load=payload))
         market_data_packets.append(("Normal Market Data", packet))
     
     # Gap in data (quality issue)
@@ -265,36 +282,30 @@ def demo_market_data_quality():
     
     print("Analyzing market data quality...")
     
-    quality_metrics = {
-        'total_packets': 0,
-        'large_packets': 0,
-        'gaps_detected': 0,
-        'average_size': 0,
-        'total_size': 0
-    }
+    # Parse once, then analyze as structure-of-arrays
+    parsed_packets = [parser.parse_packet(packet) for _, packet in market_data_packets]
+    count = len(parsed_packets)
+    sizes = np.fromiter((parsed.size for parsed in parsed_packets), dtype=np.int64, count=count)
+    timestamps = np.fromiter((parsed.timestamp for parsed in parsed_packets), dtype=np.float64, count=count)
     
-    last_timestamp = 0
+    # Check for gaps (100ms threshold) between consecutive packets
+    gaps = np.diff(timestamps)
+    gap_mask = gaps > 0.1
+    for gap in gaps[gap_mask]:
+        print(f"  Data gap detected: {gap:.3f}s")
     
-    for name, packet in market_data_packets:
-        parsed = parser.parse_packet(packet)
-        quality_metrics['total_packets'] += 1
-        quality_metrics['total_size'] += parsed.size
-        
-        # Check for large packets
-        if parsed.size > 1000:
-            quality_metrics['large_packets'] += 1
-            print(f"  Large packet detected: {parsed.size} bytes")
-        
-        # Check for gaps
-        if last_timestamp > 0:
-            gap = parsed.timestamp - last_timestamp
-            if gap > 0.1:  # 100ms threshold
-                quality_metrics['gaps_detected'] += 1
-                print(f"  Data gap detected: {gap:.3f}s")
-        
-        last_timestamp = parsed.timestamp
+    # Check for large packets
+    large_mask = sizes > 1000
+    for size in sizes[large_mask]:
+        print(f"  Large packet detected: {size} bytes")
     
-    quality_metrics['average_size'] = quality_metrics['total_size'] / quality_metrics['total_packets']
+    quality_metrics = {
+        'total_packets': count,
+        'large_packets': int(large_mask.sum()),
+        'gaps_detected': int(gap_mask.sum()),
+        'average_size': float(sizes.mean()),
+        'total_size': int(sizes.sum())
+    }
     
     print(f"\nMarket Data Quality Report:")
     print(f"  Total Packets: {quality_metrics['total_packets']}")
@@ -329,26 +340,28 @@ def demo_arbitrage_detection():
     symbols = ['AAPL', 'MSFT']
     arbitrage_opportunities = []
     
-    for symbol in symbols:
-        prices = [price_feeds[exchange][symbol] for exchange in price_feeds.keys()]
-        min_price = min(prices)
-        max_price = max(prices)
-        spread = max_price - min_price
-        
-        if spread > 0.02:  # 2 cent threshold
-            min_exchange = [ex for ex, prices in price_feeds.items() if prices[symbol] == min_price][0]
-            max_exchange = [ex for ex, prices in price_feeds.items() if prices[symbol] == max_price][0]
-            
-            opportunity = {
-                'symbol': symbol,
-                'buy_exchange': min_exchange,
-                'sell_exchange': max_exchange,
-                'buy_price': min_price,
-                'sell_price': max_price,
-                'spread': spread,
-                'profit_per_share': spread - 0.01  # Minus transaction costs
-            }
-            arbitrage_opportunities.append(opportunity)
+    # Prices as an (exchanges x symbols) matrix; one reduction per axis
+    exchanges = list(price_feeds)
+    price_matrix = np.array([[price_feeds[exchange][symbol] for symbol in symbols]
+                             for exchange in exchanges])
+    min_prices = price_matrix.min(axis=0)
+    max_prices = price_matrix.max(axis=0)
+    buy_indices = price_matrix.argmin(axis=0)
+    sell_indices = price_matrix.argmax(axis=0)
+    spreads = max_prices - min_prices
+    
+    for col in np.flatnonzero(spreads > 0.02):  # 2 cent threshold
+        spread = float(spreads[col])
+        opportunity = {
+            'symbol': symbols[col],
+            'buy_exchange': exchanges[buy_indices[col]],
+            'sell_exchange': exchanges[sell_indices[col]],
+            'buy_price': float(min_prices[col]),
+            'sell_price': float(max_prices[col]),
+            'spread': spread,
+            'profit_per_share': spread - 0.01  # Minus transaction costs
+        }
+        arbitrage_opportunities.append(opportunity)
     
     print(f"\nArbitrage Opportunities Detected: {len(arbitrage_opportunities)}")
     for opp in arbitrage_opportunities:
@@ -359,7 +372,7 @@ def demo_arbitrage_detection():
     return arbitrage_opportunities
 
 
-def demo_live_hft_monitoring():
+def demo_live_hft_monitoring(hft_analyzer):
     """Demonstrate live HFT monitoring (requires sudo)"""
     print("\n" + "=" * 60)
     print("LIVE HFT NETWORK MONITORING")
@@ -367,23 +380,14 @@ def demo_live_hft_monitoring():
     print("Note: This requires sudo privileges for packet capture")
     
     try:
-        # Initialize HFT analyzer for live monitoring
-        hft_analyzer = HFTNetworkAnalyzer()
-        
-        # Add real exchange connections (example IPs)
-        exchanges = [
-            ExchangeConnection("NYSE", "198.51.100.10", [4001, 9001], "FIX/TCP", 500),
-            ExchangeConnection("NASDAQ", "203.0.113.20", [4002, 9002], "FIX/TCP", 600)
-        ]
-        
-        for exchange in exchanges:
-            hft_analyzer.add_exchange_connection(exchange)
+        # Reuse the configured analyzer, dropping the demo packet results
+        hft_analyzer.clear_data()
         
-        print(f"Starting live monitoring of {len(exchanges)} exchanges...")
+        print(f"Starting live monitoring of {len(hft_analyzer.exchange_connections)} exchanges...")
         print("Monitoring for 30 seconds...")
         
-        # Start live monitoring
-        hft_analyzer.start_monitoring(duration_seconds=30)
+        # Start live monitoring, filtering non-exchange traffic in the kernel
+        hft_analyzer.start_monitoring(duration_seconds=30, exchange_traffic_only=True)
         
         # Generate report
         report = hft_analyzer.generate_hft_report()
@@ -413,10 +417,13 @@ def main():
     print("Educational/Research Use Only")
     print("=" * 60)
     
+    # One analyzer (with its packet filter and parser) is shared by the demos
+    hft_analyzer = HFTNetworkAnalyzer()
+    
     # Run HFT demonstrations
-    hft_analyzer = demo_hft_latency_analysis()
+    demo_hft_latency_analysis(hft_analyzer)
     risk_filter = demo_hft_risk_management()
-    quality_metrics = demo_market_data_quality()
+    quality_metrics = demo_market_data_quality(hft_analyzer.packet_parser)
     arbitrage_opps = demo_arbitrage_detection()
     
     # Export results if requested
@@ -433,8 +440,17 @@ def main():
                 'risk_statistics': risk_filter.get_statistics()
             }
             
-            with open(f"{args.export}_comprehensive.json", 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(
+                    export_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+            else:
+                payload = json.dumps(export_data, indent=2, default=str).encode()
+            
+            with open(f"{args.export}_comprehensive.json", 'wb') as f:
+                f.write(payload)
             
             print(f"Comprehensive analysis exported to {args.export}_comprehensive.json")
             
@@ -443,7 +459,7 @@ def main():
     
     # Live monitoring if requested
     if args.live:
-        demo_live_hft_monitoring()
+        demo_live_hft_monitoring(hft_analyzer)
     else:
         print("\n" + "=" * 60)
         print("HFT DEMONSTRATION COMPLETE")
@@ -7,9 +7,10 @@ Test integration of high-performance memory pool with HFT trading system.
 
 from hft_packetfilter import HFTAnalyzer, ExchangeConfig
 from hft_packetfilter.core.c_extensions import HighPerformanceMemoryPool, EXTENSIONS_AVAILABLE, LockFreeQueue
-from hft_packetfilter.core.data_structures import LatencyMeasurement, TradingMetrics
+from hft_packetfilter.core.data_structures import TradingMetrics
+import numpy as np
 import time
-import random
+from collections import Counter
 
 def main():
     print('🔗 HFT System Integration Test with High-Performance Memory Pool')
@@ -41,46 +42,70 @@ def main():
     start_time = time.time()
     total_operations = 0
     
-    for round_num in range(50):  # 50 rounds of trading simulation
+    # Wall-clock epoch of perf_counter_ns() zero, taken once: per-packet
+    # timestamps are synthesized from the batch timings, not read per packet
+    wall_epoch_ns = time.time_ns() - time.perf_counter_ns()
+    
+    fix_header = b'8=FIX.4.4\x019=100\x0135=D\x01'  # NewOrderSingle
+    header_len = len(fix_header)
+    sequence_ids = [f'{i:04d}'.encode() for i in range(20)]
+    round_exchange_names = ['NYSE' if j % 2 == 0 else 'NASDAQ' for j in range(20)]
+    allocate_packet_buffer = memory_pool.allocate_packet_buffer
+    deallocate = memory_pool.deallocate
+    
+    # Rounds are independent, so their latency samples are collected here
+    # and handed to the analyzer in a single batch after the last round
+    num_rounds = 50
+    sample_names = []
+    sample_latencies_ns = np.empty(num_rounds * 20, dtype=np.int64)
+    sample_timestamps_ns = np.empty(num_rounds * 20, dtype=np.int64)
+    sample_count = 0
+    msg_type_counts = Counter()
+    
+    for round_num in range(num_rounds):  # 50 rounds of trading simulation
         # Allocate buffers for market data packets
         market_data_buffers = []
         
         for i in range(20):  # 20 packets per round
-            buf = memory_pool.allocate_packet_buffer()
-            if buf:
+            buf = allocate_packet_buffer()
+            if buf is not None:
                 # Simulate FIX message data
-                fix_header = b'8=FIX.4.4\x019=100\x0135=D\x01'  # NewOrderSingle
-                buf[0:len(fix_header)] = fix_header
-                buf[len(fix_header):len(fix_header)+4] = f'{i:04d}'.encode()
+                buf[0:header_len] = fix_header
+                buf[header_len:header_len + 4] = sequence_ids[i]
                 market_data_buffers.append(buf)
                 total_operations += 1
         
-        # Process buffers and measure latency
-        for j, buf in enumerate(market_data_buffers):
-            # Simulate packet processing latency
-            process_start = time.time_ns()
-            
-            # Extract message type (simulate processing)
-            if len(buf) > 20:
-                msg_type = buf[15:20]
-                
-            process_end = time.time_ns()
-            latency_us = (process_end - process_start) / 1000.0
-            
-            # Create latency measurement
-            measurement = LatencyMeasurement(
-                timestamp=time.time(),
-                exchange_name='NYSE' if j % 2 == 0 else 'NASDAQ',
-                latency_us=latency_us
-            )
-            
-            # Process with HFT analyzer
-            analyzer.process_latency_measurement(measurement)
-            
-            # Deallocate buffer
-            memory_pool.deallocate(buf)
+        # Process the round's buffers as one batch, timed once, so the
+        # per-packet latency is not dominated by the timer calls themselves
+        process_start = time.perf_counter_ns()
+        
+        # Extract message type (simulate processing)
+        msg_types = [buf[15:20] for buf in market_data_buffers if len(buf) > 20]
+        
+        process_end = time.perf_counter_ns()
+        latency_ns = (process_end - process_start) // max(1, len(market_data_buffers))
+        msg_type_counts.update(bytes(msg_type).strip(b'\x01') for msg_type in msg_types)
+        
+        # Record the round's samples, then release the buffers
+        batch_size = len(market_data_buffers)
+        batch_end = sample_count + batch_size
+        sample_names.extend(round_exchange_names[:batch_size])
+        sample_latencies_ns[sample_count:batch_end] = latency_ns
+        sample_timestamps_ns[sample_count:batch_end] = np.linspace(
+            process_start, process_end, batch_size, dtype=np.int64
+        )
+        sample_count = batch_end
+        
+        for buf in market_data_buffers:
+            deallocate(buf)
             total_operations += 1
     
+    analyzer.process_latency_batch(
+        sample_names,
+        sample_latencies_ns[:sample_count],
+        wall_epoch_ns + sample_timestamps_ns[:sample_count]
+    )
+    
     test1_duration = time.time() - start_time
     test1_ops_per_sec = total_operations / test1_duration
     
@@ -88,6 +113,8 @@ def main():
     print(f'  • Duration: {test1_duration:.3f} seconds')
     print(f'  • Operations: {total_operations:,}')
     print(f'  • Rate: {test1_ops_per_sec:,.0f} ops/sec')
+    print('  • Message types: ' + ', '.join(f'{msg_type.decode()} x{count:,}'
+                                             for msg_type, count in msg_type_counts.items()))
     print()
     
     # Test 2: Lock-Free Queue Performance
@@ -97,29 +124,44 @@ def main():
     start_time = time.time()
     queue_operations = 10000
     
+    # Trading messages as rows of a structured array (type 0 = order,
+    # side 0 = BUY / 1 = SELL), filled column-wise; the queue carries row indices
+    message_dtype = np.dtype([('type', 'u1'), ('symbol', 'S8'), ('side', 'u1'), ('quantity', 'i4'), ('price', 'f4')])
+    messages = np.empty(queue_operations, dtype=message_dtype)
+    sequence = np.arange(queue_operations)
+    symbol_table = np.array([f'AAPL{k}'.encode() for k in range(100)], dtype='S8')
+    messages['type'] = 0
+    messages['symbol'] = symbol_table[sequence % 100]
+    messages['side'] = sequence & 1
+    rng = np.random.default_rng()
+    messages['quantity'] = rng.integers(100, 1001, queue_operations)
+    messages['price'] = np.round(150.0 + rng.uniform(-5, 5, queue_operations), 2)
+    
     # Enqueue trading messages
+    enqueue_message = message_queue.enqueue_message
     for i in range(queue_operations):
-        trading_msg = {
-            'type': 'order',
-            'symbol': f'AAPL{i%100}',
-            'side': 'BUY' if i % 2 == 0 else 'SELL',
-            'quantity': random.randint(100, 1000),
-            'price': round(150.0 + random.uniform(-5, 5), 2)
-        }
-        message_queue.enqueue_message(trading_msg)
-    
-    # Dequeue and process messages
+        enqueue_message(i)
+    
+    # Drain and process messages in bulk, one queue call per batch, reading
+    # each batch's records column-wise. The compiled queue hands items back
+    # as strings, so indices are converted back to integers first
     processed_messages = 0
-    while not message_queue.is_empty():
-        msg = message_queue.dequeue_message()
-        if msg:
-            processed_messages += 1
+    buy_quantity = 0
+    notional = 0.0
+    dequeue_batch = message_queue.dequeue_batch
+    while batch := dequeue_batch(4096):
+        records = messages[np.fromiter(map(int, batch), np.intp, len(batch))]
+        processed_messages += len(batch)
+        buy_quantity += int(records['quantity'][records['side'] == 0].sum())
+        notional += float(np.dot(records['quantity'], records['price']))
     
     test2_duration = time.time() - start_time
     test2_ops_per_sec = (queue_operations * 2) / test2_duration  # enqueue + dequeue
     
     print(f'✅ Test 2 completed:')
     print(f'  • Messages processed: {processed_messages:,}')
+    print(f'  • Buy quantity: {buy_quantity:,}')
+    print(f'  • Notional: ${notional:,.2f}')
     print(f'  • Queue ops/sec: {test2_ops_per_sec:,.0f}')
     print(f'  • Duration: {test2_duration:.3f} seconds')
     print()
@@ -131,27 +173,29 @@ def main():
     start_time = time.time()
     combined_operations = 0
     
-    for iteration in range(1000):
-        # Allocate memory
-        buffer = memory_pool.allocate()
-        if buffer:
-            # Write trading data
-            buffer[0:10] = b'TRADE_DATA'
-            combined_operations += 1
-            
-            # Queue the buffer reference
-            message_queue.enqueue(f'buffer_{iteration}')
-            combined_operations += 1
-            
-            # Dequeue and process
-            msg = message_queue.dequeue()
-            if msg:
-                combined_operations += 1
-            
-            # Deallocate
-            memory_pool.deallocate(buffer)
+    # Allocate all buffers in one call to the pool
+    buffers = memory_pool.allocate_many(1000)
+    enqueue = message_queue.enqueue
+    dequeue = message_queue.dequeue
+    
+    for iteration, buffer in enumerate(buffers):
+        # Write trading data
+        buffer[0:10] = b'TRADE_DATA'
+        combined_operations += 1
+        
+        # Queue the buffer reference
+        enqueue(f'buffer_{iteration}')
+        combined_operations += 1
+        
+        # Dequeue and process
+        msg = dequeue()
+        if msg:
             combined_operations += 1
     
+    # Deallocate all buffers in one call
+    memory_pool.deallocate_many(buffers)
+    combined_operations += len(buffers)
+    
     test3_duration = time.time() - start_time
     test3_ops_per_sec = combined_operations / test3_duration
     
@@ -180,10 +224,8 @@ def main():
     print(f'  • Success rate: {queue_stats["enqueue_success_rate"]:.1f}%')
     print()
     print(f'HFT System Metrics:')
-    print(f'  • Exchanges configured: {len(hft_metrics)}')
-    if hft_metrics:
-        total_measurements = sum(len(m.latency_measurements) for m in hft_metrics.values())
-        print(f'  • Total latency measurements: {total_measurements}')
+    print(f'  • Exchanges configured: {len(hft_metrics["exchanges"])}')
+    print(f'  • Total latency measurements: {len(analyzer.latency_measurements)}')
     print(f'  • System status: Production Ready ✅')
     print()
     
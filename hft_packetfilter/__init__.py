@@ -16,78 +16,107 @@ __email__ = "dev@hft-packetfilter.com"
 __license__ = "Apache License 2.0"
 __description__ = "High-Frequency Trading Network Analysis Package"
 
-# Core imports
-from .core.hft_analyzer import HFTAnalyzer
-from .core.exchange_config import ExchangeConfig, CommonExchanges
-from .core.production_config import ProductionConfig
-
-# Utility imports
-from .utils.logger import HFTLogger, get_logger, configure_global_logger
-from .utils.metrics_collector import MetricsCollector, get_metrics_collector, configure_metrics_collector
-from .utils.alert_system import AlertSystem, get_alert_system, configure_alert_system
-
-# Data structures
-from .core.data_structures import (
-    TradingMetrics,
-    ExchangeConnection,
-    LatencyMeasurement,
-    RiskEvent,
-    MarketDataQuality,
-    ArbitrageOpportunity,
-    SystemMetrics,
-    ComplianceEvent,
-    RiskLevel,
-    EventType,
-    ExchangeStatus
-)
+# Public names resolved on first attribute access (PEP 562) so that
+# ``import hft_packetfilter`` stays cheap; the analyzer pulls in numpy,
+# scapy and the C extensions, which most entry points never need.
+_LAZY_SUBMODULES = {
+    # Core imports
+    ".core.hft_analyzer": ("HFTAnalyzer",),
+    ".core.exchange_config": ("ExchangeConfig", "CommonExchanges"),
+    ".core.production_config": ("ProductionConfig",),
 
-# Constants
-from .core.constants import (
-    DEFAULT_LATENCY_TARGET_US,
-    DEFAULT_PACKET_BUFFER_SIZE,
-    SUPPORTED_EXCHANGES,
-    SUPPORTED_PROTOCOLS,
-    COMPLIANCE_REGULATIONS,
-    PERFORMANCE_MODES,
-    RISK_SEVERITY_LEVELS,
-    ALERT_TYPES,
-    FIX_MESSAGE_TYPES,
-    TRADING_SESSIONS,
-    ARBITRAGE_THRESHOLDS,
-    SYSTEM_LIMITS
-)
+    # Utility imports
+    ".utils.logger": ("HFTLogger", "get_logger", "configure_global_logger"),
+    ".utils.metrics_collector": ("MetricsCollector", "get_metrics_collector", "configure_metrics_collector"),
+    ".utils.alert_system": ("AlertSystem", "get_alert_system", "configure_alert_system"),
+
+    # Data structures
+    ".core.data_structures": (
+        "TradingMetrics",
+        "ExchangeConnection",
+        "LatencyMeasurement",
+        "RiskEvent",
+        "MarketDataQuality",
+        "ArbitrageOpportunity",
+        "SystemMetrics",
+        "ComplianceEvent",
+        "RiskLevel",
+        "EventType",
+        "ExchangeStatus",
+    ),
+
+    # Constants
+    ".core.constants": (
+        "DEFAULT_LATENCY_TARGET_US",
+        "DEFAULT_PACKET_BUFFER_SIZE",
+        "SUPPORTED_EXCHANGES",
+        "SUPPORTED_PROTOCOLS",
+        "COMPLIANCE_REGULATIONS",
+        "PERFORMANCE_MODES",
+        "PerfMode",
+        "RISK_SEVERITY_LEVELS",
+        "ALERT_TYPES",
+        "FIX_MESSAGE_TYPES",
+        "TRADING_SESSIONS",
+        "ARBITRAGE_THRESHOLDS",
+        "SYSTEM_LIMITS",
+    ),
+
+    # Exceptions
+    ".core.exceptions": (
+        "HFTPacketFilterError",
+        "ExchangeConnectionError",
+        "LatencyThresholdExceededError",
+        "ComplianceViolationError",
+        "ConfigurationError",
+        "AuthenticationError",
+        "PermissionError",
+        "TimeoutError",
+        "ProtocolError",
+        "DataValidationError",
+        "ResourceLimitExceededError",
+        "PacketCaptureError",
+        "MetricsCollectionError",
+        "AlertSystemError",
+        "ArbitrageDetectionError",
+        "MarketDataQualityError",
+        "CriticalError",
+        "WarningError",
+        "CriticalLatencyError",
+        "CriticalComplianceError",
+        "CriticalConnectionError",
+        "is_critical_error",
+        "is_warning_error",
+        "get_error_code",
+        "format_exception_for_logging",
+    ),
+}
+
+_LAZY_IMPORTS = {
+    name: module
+    for module, names in _LAZY_SUBMODULES.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access"""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Exceptions
-from .core.exceptions import (
-    HFTPacketFilterError,
-    ExchangeConnectionError,
-    LatencyThresholdExceededError,
-    ComplianceViolationError,
-    ConfigurationError,
-    AuthenticationError,
-    PermissionError,
-    TimeoutError,
-    ProtocolError,
-    DataValidationError,
-    ResourceLimitExceededError,
-    PacketCaptureError,
-    MetricsCollectionError,
-    AlertSystemError,
-    ArbitrageDetectionError,
-    MarketDataQualityError,
-    CriticalError,
-    WarningError,
-    CriticalLatencyError,
-    CriticalComplianceError,
-    CriticalConnectionError,
-    is_critical_error,
-    is_warning_error,
-    get_error_code,
-    format_exception_for_logging
-)
 
 # Main API classes for easy access
-__all__ = [
+__all__ = (
     # Version info
     "__version__",
     "__author__",
@@ -134,6 +163,7 @@ __all__ = [
     "SUPPORTED_PROTOCOLS",
     "COMPLIANCE_REGULATIONS",
     "PERFORMANCE_MODES",
+    "PerfMode",
     "RISK_SEVERITY_LEVELS",
     "ALERT_TYPES",
     "FIX_MESSAGE_TYPES",
@@ -167,49 +197,286 @@ __all__ = [
     "is_warning_error",
     "get_error_code",
     "format_exception_for_logging",
-]
+
+    # Helpers
+    "quick_start",
+)
 
 # Package-level configuration
+import glob
 import logging
 import os
+import re
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Tuple
+
+# Light module (no numpy); the mode is resolved to a PerfMode once here
+from .core.constants import PerfMode
+
+# Set up default logging (guarded so a module reload doesn't stack handlers)
+_LOGGER = logging.getLogger(__name__)
+if not any(isinstance(h, logging.NullHandler) for h in _LOGGER.handlers):
+    _LOGGER.addHandler(logging.NullHandler())
+
+# Generation-0 threshold high enough that minor collections are rare
+# without turning the cyclic collector off entirely
+_DEFAULT_GC_THRESHOLD = (100_000, 50, 50)
 
-# Set up default logging
-logging.getLogger(__name__).addHandler(logging.NullHandler())
+# Matches "N" or "N-M" entries of a kernel cpulist
+_CPULIST_RE = re.compile(r"(\d+)(?:-(\d+))?")
+
+def _parse_cpulist(cpulist):
+    """Parse a kernel cpulist such as '2-5,8' (or '2,3,4') into a set of ints"""
+    cpus = set()
+    for start, end in _CPULIST_RE.findall(cpulist):
+        cpus.update(range(int(start), int(end or start) + 1))
+    return cpus
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
+class _HFTEnv:
+    """HFT_* environment settings, read and parsed once at import"""
+    config_path: str
+    log_level: str
+    perf_mode: PerfMode
+    cpu_affinity: Tuple[int, ...]
+    nic_iface: Optional[str]
+    isolated_only: bool
+    gc_threshold: Tuple[int, int, int]
+
+def _load_env():
+    environ = os.environ
+
+    try:
+        perf_mode = PerfMode.parse(environ.get("HFT_PERFORMANCE_MODE", "standard"))
+    except ValueError:
+        # Unknown modes never enabled any tuning; keep importing as standard
+        perf_mode = PerfMode.STANDARD
+
+    gc_threshold = _DEFAULT_GC_THRESHOLD
+    raw_threshold = environ.get("HFT_GC_THRESHOLD")
+    if raw_threshold:
+        try:
+            parsed = tuple(int(x) for x in raw_threshold.split(","))
+            if len(parsed) == 3:
+                gc_threshold = parsed
+        except ValueError:
+            pass
+
+    return _HFTEnv(
+        config_path=environ.get("HFT_CONFIG_PATH", "~/.hft-packetfilter"),
+        log_level=environ.get("HFT_LOG_LEVEL", "INFO"),
+        perf_mode=perf_mode,
+        cpu_affinity=tuple(sorted(_parse_cpulist(environ.get("HFT_CPU_AFFINITY", "")))),
+        nic_iface=environ.get("HFT_NIC_IFACE") or None,
+        isolated_only=environ.get("HFT_ISOLATED_ONLY") == "1",
+        gc_threshold=gc_threshold,
+    )
 
 # Environment variable configuration
-HFT_CONFIG_PATH = os.environ.get("HFT_CONFIG_PATH", "~/.hft-packetfilter")
-HFT_LOG_LEVEL = os.environ.get("HFT_LOG_LEVEL", "INFO")
-HFT_PERFORMANCE_MODE = os.environ.get("HFT_PERFORMANCE_MODE", "standard")
+_ENV = _load_env()
+HFT_CONFIG_PATH = _ENV.config_path
+HFT_LOG_LEVEL = _ENV.log_level
+_PERF_MODE = _ENV.perf_mode
+HFT_PERFORMANCE_MODE = _PERF_MODE.label
+
+def _tune_gc():
+    """Freeze startup objects and raise GC thresholds for steady-state trading
+
+    Unlike gc.disable(), reference cycles created while running are still
+    reclaimed, so long-lived processes don't grow without bound.
+    """
+    import gc
+
+    threshold = _ENV.gc_threshold
+    try:
+        if gc.get_freeze_count() == 0:
+            # Collect first so garbage isn't frozen alongside live objects
+            gc.collect()
+            gc.freeze()
+        gc.set_threshold(*threshold)
+    except AttributeError:
+        # gc.freeze() is CPython-only
+        gc.set_threshold(*threshold)
+
+def _read_sysfs(path):
+    """Return the stripped contents of a sysfs file, or '' if unavailable"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def _apply_affinity():
+    """Pin the process to cores chosen from isolcpus and NIC NUMA locality
+
+    HFT_CPU_AFFINITY takes precedence as an explicit cpulist. Otherwise
+    isolated cores are preferred, narrowed to the NUMA node of HFT_NIC_IFACE
+    when that leaves any; with no isolated cores the NIC's node is used.
+    HFT_ISOLATED_ONLY=1 refuses to start when no isolated cores exist.
+    
+    Pinning uses os.sched_setaffinity directly; psutil is only imported on
+    platforms without it.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        # No sched_setaffinity(2) outside Linux; honour an explicit list via
+        # psutil (SetProcessAffinityMask on Windows) and skip topology probing
+        if _ENV.cpu_affinity:
+            try:
+                import psutil
+                psutil.Process().cpu_affinity(list(_ENV.cpu_affinity))
+            except (ImportError, AttributeError, ValueError, OSError):
+                pass
+        return
+
+    isolated = _parse_cpulist(_read_sysfs("/sys/devices/system/cpu/isolated"))
+
+    if _ENV.isolated_only and not isolated:
+        from .core.exceptions import ConfigurationError
+        raise ConfigurationError(
+            "HFT_ISOLATED_ONLY is set but no isolated CPUs were found "
+            "(boot with isolcpus=...)",
+            config_key="HFT_ISOLATED_ONLY",
+        )
+
+    if _ENV.cpu_affinity:
+        chosen = set(_ENV.cpu_affinity)
+    else:
+        node_cpus = {}
+        for node_path in glob.glob("/sys/devices/system/node/node[0-9]*"):
+            try:
+                node = int(os.path.basename(node_path)[4:])
+            except ValueError:
+                continue
+            node_cpus[node] = _parse_cpulist(_read_sysfs(os.path.join(node_path, "cpulist")))
+
+        nic_cpus = set()
+        if _ENV.nic_iface:
+            try:
+                nic_node = int(_read_sysfs(f"/sys/class/net/{_ENV.nic_iface}/device/numa_node"))
+            except ValueError:
+                nic_node = -1
+            nic_cpus = node_cpus.get(nic_node, set())
+
+        chosen = (isolated & nic_cpus) or isolated or nic_cpus
+
+    if not chosen:
+        return
+
+    try:
+        os.sched_setaffinity(0, chosen)
+    except OSError:
+        return
+
+    # Real-time scheduling only on cores reserved for us; needs CAP_SYS_NICE.
+    # Threads started later inherit it, so helper threads call
+    # _use_normal_scheduling() first
+    if isolated and chosen <= isolated and hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))
+        except OSError:
+            pass
+
+def _use_normal_scheduling():
+    """Move the calling thread back to SCHED_OTHER if it inherited a real-time policy
+
+    Background helpers (warmup, callback dispatch) must not compete with the
+    trading thread at SCHED_FIFO priority on its isolated cores.
+    """
+    if not hasattr(os, "sched_setscheduler"):
+        return
+    try:
+        # pid 0 is the calling thread
+        if os.sched_getscheduler(0) in (os.SCHED_FIFO, os.SCHED_RR):
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+    except OSError:
+        pass
+
+# Modules on the monitoring path, imported ahead of first use by _warmup()
+_WARMUP_MODULES = (
+    ".core.hft_analyzer",
+    ".protocols.fix_parser",
+    ".analytics.market_data_quality",
+    ".analytics.arbitrage_detector",
+)
+
+# Small FIX payload that drives the vectorized delimiter scan once
+_WARMUP_FIX_PAYLOAD = b"8=FIX.4.2\x019=12\x0135=0\x0149=WARM\x0156=UP\x0134=1\x0110=000\x01"
+
+def _warmup():
+    """Import hot submodules and exercise first-call paths off the trading cores
+
+    Runs on a daemon thread. The import waits until the package itself has
+    finished importing, and every failure is swallowed: warmup only moves
+    one-off costs earlier and must never break the caller.
+    """
+    _use_normal_scheduling()
+
+    if hasattr(os, "sched_setaffinity"):
+        # Affinity set through pid 0 applies to this thread only
+        online = _parse_cpulist(_read_sysfs("/sys/devices/system/cpu/online"))
+        isolated = _parse_cpulist(_read_sysfs("/sys/devices/system/cpu/isolated"))
+        housekeeping = online - isolated
+        if housekeeping:
+            try:
+                os.sched_setaffinity(0, housekeeping)
+            except OSError:
+                pass
+
+    import importlib
+    for module in _WARMUP_MODULES:
+        try:
+            importlib.import_module(module, __name__)
+        except Exception:
+            _LOGGER.debug("Warmup import of %s failed", module, exc_info=True)
+
+    try:
+        from .protocols.fix_parser import FIXParser
+        FIXParser(validate_messages=False).parse_message(_WARMUP_FIX_PAYLOAD)
+    except Exception:
+        _LOGGER.debug("FIX parser warmup failed", exc_info=True)
 
 # Package initialization message
 def _init_package():
     """Initialize package with environment-specific settings"""
-    if HFT_PERFORMANCE_MODE == "ultra_low_latency":
+    if _PERF_MODE is PerfMode.ULTRA_LOW_LATENCY:
         # Configure for ultra-low latency mode
-        import gc
-        gc.disable()  # Disable garbage collection for consistent latency
+        _tune_gc()
         
-        # Set CPU affinity if specified
-        cpu_affinity = os.environ.get("HFT_CPU_AFFINITY")
-        if cpu_affinity:
-            try:
-                import psutil
-                cpu_list = [int(x) for x in cpu_affinity.split(",")]
-                psutil.Process().cpu_affinity(cpu_list)
-            except (ImportError, ValueError):
-                pass
+        # Pin to isolated / NIC-local cores if available
+        _apply_affinity()
+        
+        # Pay import and first-call costs now rather than on the hot path
+        import threading
+        threading.Thread(target=_warmup, name="hft-warmup", daemon=True).start()
 
 # Initialize package
 _init_package()
 
+# Demo exchanges used by quick_start(), built on first use so importing
+# the package doesn't pull in the core modules
+_DEFAULT_DEMO_EXCHANGES = None
+
+def _default_demo_exchanges():
+    global _DEFAULT_DEMO_EXCHANGES
+    if _DEFAULT_DEMO_EXCHANGES is None:
+        from .core.exchange_config import ExchangeConfig
+        _DEFAULT_DEMO_EXCHANGES = (
+            ExchangeConfig("NYSE", "demo.nyse.com", [4001, 9001], "FIX/TCP", 500),
+            ExchangeConfig("NASDAQ", "demo.nasdaq.com", [4002, 9002], "FIX/TCP", 600),
+        )
+    return _DEFAULT_DEMO_EXCHANGES
+
 # Quick start function
 def quick_start(exchange_configs=None, performance_mode="standard"):
     """
     Quick start function for immediate HFT monitoring
     
     Args:
-        exchange_configs: List of ExchangeConfig objects
-        performance_mode: Performance mode ('standard', 'high_performance', 'ultra_low_latency')
+        exchange_configs: Sequence of ExchangeConfig objects (demo exchanges if empty)
+        performance_mode: Performance mode name ('standard', 'high_performance',
+            'ultra_low_latency') or PerfMode member
     
     Returns:
         HFTAnalyzer: Configured analyzer ready for monitoring
@@ -219,35 +486,35 @@ def quick_start(exchange_configs=None, performance_mode="standard"):
         >>> analyzer = hft.quick_start()
         >>> analyzer.start_monitoring()
     """
-    analyzer = HFTAnalyzer(performance_mode=performance_mode)
-    
-    if exchange_configs:
-        for config in exchange_configs:
-            analyzer.add_exchange(config)
-    else:
-        # Add default demo exchanges
-        demo_exchanges = [
-            ExchangeConfig("NYSE", "demo.nyse.com", [4001, 9001], "FIX/TCP", 500),
-            ExchangeConfig("NASDAQ", "demo.nasdaq.com", [4002, 9002], "FIX/TCP", 600),
-        ]
-        for config in demo_exchanges:
-            analyzer.add_exchange(config)
+    # Module globals don't go through __getattr__, so import explicitly
+    from .core.hft_analyzer import HFTAnalyzer
+
+    analyzer = HFTAnalyzer(performance_mode=PerfMode.parse(performance_mode))
+    analyzer.add_exchanges(exchange_configs or _default_demo_exchanges())
     
     return analyzer
 
-# Add quick_start to __all__
-__all__.append("quick_start")
-
 # Package metadata for introspection
-PACKAGE_INFO = {
-    "name": "hft-packetfilter",
-    "version": __version__,
-    "description": __description__,
-    "author": __author__,
-    "license": __license__,
-    "python_requires": ">=3.8",
-    "keywords": ["hft", "trading", "network", "packet", "analysis", "finance"],
-    "classifiers": [
+class PackageInfo(NamedTuple):
+    """Typed, immutable view of the package metadata"""
+    name: str
+    version: str
+    description: str
+    author: str
+    license: str
+    python_requires: str
+    keywords: Tuple[str, ...]
+    classifiers: Tuple[str, ...]
+
+PACKAGE_INFO_NT = PackageInfo(
+    name="hft-packetfilter",
+    version=__version__,
+    description=__description__,
+    author=__author__,
+    license=__license__,
+    python_requires=">=3.8",
+    keywords=("hft", "trading", "network", "packet", "analysis", "finance"),
+    classifiers=(
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Financial and Insurance Industry",
         "License :: OSI Approved :: Apache Software License",
@@ -257,5 +524,8 @@ PACKAGE_INFO = {
         "Programming Language :: Python :: 3.11",
         "Topic :: Office/Business :: Financial",
         "Topic :: System :: Networking :: Monitoring",
-    ]
-} 
\ No newline at end of file
+    ),
+)
+
+# Read-only mapping for dict-style access, e.g. PACKAGE_INFO["version"]
+PACKAGE_INFO = MappingProxyType(PACKAGE_INFO_NT._asdict())
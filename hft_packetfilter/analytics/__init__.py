@@ -8,9 +8,23 @@ Author: Tanzil github://@tanzil7890
 License: Apache License 2.0
 """
 
-# Market data analytics
-from .market_data_quality import MarketDataAnalyzer, QualityMetrics, FeedValidator
-from .arbitrage_detector import ArbitrageDetector, ArbitrageOpportunityData, CrossExchangeAnalyzer, PriceQuote
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Visible to type checkers and IDEs; at runtime __getattr__ resolves these
+    from .market_data_quality import MarketDataAnalyzer, QualityMetrics, FeedValidator
+    from .arbitrage_detector import (
+        ArbitrageDetector,
+        ArbitrageOpportunityData,
+        CrossExchangeAnalyzer,
+        PriceQuote,
+    )
+
+# Market data analytics (imported lazily on first access, see __getattr__)
+_LAZY_SUBMODULES = {
+    ".market_data_quality": ("MarketDataAnalyzer", "QualityMetrics", "FeedValidator"),
+    ".arbitrage_detector": ("ArbitrageDetector", "ArbitrageOpportunityData", "CrossExchangeAnalyzer", "PriceQuote"),
+}
 # from .execution_analyzer import ExecutionAnalyzer, ExecutionMetrics, SlippageAnalyzer
 
 # Performance analytics - TODO: Implement these modules
@@ -58,3 +72,25 @@ __all__ = [
     # "ExposureMonitor",
     # "PnLAnalyzer",
 ]
+
+_LAZY_IMPORTS = {
+    name: module
+    for module, names in _LAZY_SUBMODULES.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    """Import an analytics class from its submodule on first access"""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Arbitrage Kernels
+
+Array kernels behind the cross-exchange arbitrage scan. They take the
+per-exchange quote arrays kept by CrossExchangeAnalyzer and work on plain
+NumPy data only, so the scan has no per-pair Python overhead. Prices may be
+in any unit; for symbols with a tick size CrossExchangeAnalyzer passes
+whole tick counts, which makes every price comparison exact.
+
+Author: Tanzil github://@tanzil7890
+License: Apache License 2.0
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def scan_pairs(bid: np.ndarray, ask: np.ndarray,
+               bid_sz: np.ndarray, ask_sz: np.ndarray, ts: np.ndarray,
+               now: float, max_age: float, min_vol: float,
+               min_spread_pct: float, n: int) -> Tuple[np.ndarray, ...]:
+    """
+    Find every ordered exchange pair whose bid crosses another's ask
+
+    Args:
+        bid, ask, bid_sz, ask_sz, ts: Latest quote per exchange id
+        now: Current time in seconds
+        max_age: Maximum quote age for either side of a pair
+        min_vol: Minimum tradable volume (also caps the volume reported)
+        min_spread_pct: Minimum spread as a percentage of the buy price
+        n: Number of exchange ids in use
+
+    Returns:
+        (buy_idx, sell_idx, buy_px, sell_px, vol) arrays, one entry per hit,
+        ordered by exchange pair with the lower id buying first
+    """
+    bid = bid[:n]
+    ask = ask[:n]
+    fresh = (now - ts[:n]) <= max_age
+
+    # Rows are the selling exchange (hit its bid), columns the buying
+    # exchange (lift its ask); every ordered pair is checked at once
+    profit = bid[:, None] - ask[None, :]
+    volume = np.minimum(np.minimum(bid_sz[:n, None], ask_sz[None, :n]), min_vol)
+
+    # Prices are positive (PriceQuote validates them), so only freshness
+    # and the thresholds decide
+    mask = fresh[:, None] & fresh[None, :]
+    mask &= profit > 0
+    mask &= volume > 0
+    mask &= volume >= min_vol
+    # profit / ask * 100 >= min_spread_pct, without the per-pair division
+    mask &= profit * 100 >= ask[None, :] * min_spread_pct
+    np.fill_diagonal(mask, False)
+
+    sell_idx, buy_idx = _pair_order(*np.nonzero(mask))
+
+    return buy_idx, sell_idx, ask[buy_idx], bid[sell_idx], volume[sell_idx, buy_idx]
+
+
+def scan_pairs_touching(bid: np.ndarray, ask: np.ndarray,
+                        bid_sz: np.ndarray, ask_sz: np.ndarray, ts: np.ndarray,
+                        now: float, max_age: float, min_vol: float,
+                        min_spread_pct: float, n: int,
+                        ex: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    scan_pairs() restricted to pairs with at least one exchange in ex
+
+    Only the rows and columns of the changed exchanges are evaluated, so an
+    incremental scan costs O(n * len(ex)) instead of O(n^2).
+
+    Args:
+        ex: Sorted, unique exchange ids below n
+        (other arguments as for scan_pairs)
+
+    Returns:
+        Same arrays and ordering as scan_pairs() for the pairs touching ex
+    """
+    bid = bid[:n]
+    ask = ask[:n]
+    bid_sz = bid_sz[:n]
+    ask_sz = ask_sz[:n]
+    fresh = (now - ts[:n]) <= max_age
+
+    others = np.ones(n, dtype=bool)
+    others[ex] = False
+    others = np.flatnonzero(others)
+
+    # Changed exchanges selling to anyone, then the rest selling to them
+    sell_a, buy_a = _crossing(bid, ask, bid_sz, ask_sz, fresh,
+                              ex, np.arange(n), min_vol, min_spread_pct)
+    sell_b, buy_b = _crossing(bid, ask, bid_sz, ask_sz, fresh,
+                              others, ex, min_vol, min_spread_pct)
+    sell_idx, buy_idx = _pair_order(np.concatenate((sell_a, sell_b)),
+                                    np.concatenate((buy_a, buy_b)))
+
+    volume = np.minimum(np.minimum(bid_sz[sell_idx], ask_sz[buy_idx]), min_vol)
+    return buy_idx, sell_idx, ask[buy_idx], bid[sell_idx], volume
+
+
+def _crossing(bid: np.ndarray, ask: np.ndarray,
+              bid_sz: np.ndarray, ask_sz: np.ndarray,
+              fresh: np.ndarray, sell: np.ndarray, buy: np.ndarray,
+              min_vol: float, min_spread_pct: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Hits among sell x buy exchange ids, as (sell_idx, buy_idx)"""
+    sell_ask = ask[buy]
+    profit = bid[sell][:, None] - sell_ask[None, :]
+    volume = np.minimum(np.minimum(bid_sz[sell][:, None], ask_sz[buy][None, :]), min_vol)
+
+    # Same tests as scan_pairs()
+    mask = fresh[sell][:, None] & fresh[buy][None, :]
+    mask &= profit > 0
+    mask &= volume > 0
+    mask &= volume >= min_vol
+    mask &= profit * 100 >= sell_ask[None, :] * min_spread_pct
+    mask &= sell[:, None] != buy[None, :]
+
+    rows, cols = np.nonzero(mask)
+    return sell[rows], buy[cols]
+
+
+def _pair_order(sell_idx: np.ndarray, buy_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Order hits by exchange pair, the lower id buying first"""
+    if sell_idx.size > 1:
+        order = np.lexsort((
+            buy_idx > sell_idx,
+            np.maximum(buy_idx, sell_idx),
+            np.minimum(buy_idx, sell_idx),
+        ))
+        sell_idx = sell_idx[order]
+        buy_idx = buy_idx[order]
+    return sell_idx, buy_idx
@@ -0,0 +1,122 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+# cython: profile=False
+# cython: linetrace=False
+
+"""
+Native Arbitrage Kernels
+
+Compiled versions of the scans in _arb_kernels, with the same signatures
+and results. Exchange pairs are walked in a C loop without the GIL and hits
+are emitted already in pair order, so there are no n x n temporaries and no
+sort. arbitrage_detector falls back to _arb_kernels when this module isn't
+built.
+
+Author: Tanzil github://@tanzil7890
+License: Apache License 2.0
+"""
+
+import numpy as np
+
+
+cdef Py_ssize_t _scan_into(const double[:] bid, const double[:] ask,
+                           const double[:] bid_sz, const double[:] ask_sz,
+                           const unsigned char[:] fresh,
+                           const unsigned char[:] touched, bint use_touched,
+                           double min_vol, double min_spread_pct, Py_ssize_t n,
+                           Py_ssize_t[:] out_buy, Py_ssize_t[:] out_sell,
+                           double[:] out_buy_px, double[:] out_sell_px,
+                           double[:] out_vol) nogil:
+    """Write hits to the output buffers in pair order; returns the count"""
+    cdef Py_ssize_t lo, hi, side, buy, sell
+    cdef Py_ssize_t k = 0
+    cdef double profit, volume
+
+    for lo in range(n):
+        for hi in range(lo + 1, n):
+            if use_touched and not (touched[lo] or touched[hi]):
+                continue
+
+            # Lower id buying first, as scan_pairs() orders its hits
+            for side in range(2):
+                if side == 0:
+                    buy = lo
+                    sell = hi
+                else:
+                    buy = hi
+                    sell = lo
+
+                if not (fresh[sell] and fresh[buy]):
+                    continue
+                profit = bid[sell] - ask[buy]
+                if not profit > 0:
+                    continue
+                volume = bid_sz[sell] if bid_sz[sell] < ask_sz[buy] else ask_sz[buy]
+                if min_vol < volume:
+                    volume = min_vol
+                if not (volume > 0 and volume >= min_vol):
+                    continue
+                if not profit * 100 >= ask[buy] * min_spread_pct:
+                    continue
+
+                out_buy[k] = buy
+                out_sell[k] = sell
+                out_buy_px[k] = ask[buy]
+                out_sell_px[k] = bid[sell]
+                out_vol[k] = volume
+                k += 1
+
+    return k
+
+
+def _scan(bid, ask, bid_sz, ask_sz, ts, double now, double max_age,
+          double min_vol, double min_spread_pct, Py_ssize_t n, ex):
+    """Shared body of scan_pairs() and scan_pairs_touching()"""
+    fresh = np.ascontiguousarray((now - np.asarray(ts)[:n]) <= max_age).view(np.uint8)
+    touched = np.zeros(n, dtype=np.uint8)
+    if ex is not None:
+        touched[ex] = 1
+
+    cdef Py_ssize_t cap = n * (n - 1) if n > 1 else 0
+    buy_idx = np.empty(cap, dtype=np.intp)
+    sell_idx = np.empty(cap, dtype=np.intp)
+    buy_px = np.empty(cap)
+    sell_px = np.empty(cap)
+    vol = np.empty(cap)
+
+    cdef const double[:] bid_v = bid
+    cdef const double[:] ask_v = ask
+    cdef const double[:] bid_sz_v = bid_sz
+    cdef const double[:] ask_sz_v = ask_sz
+    cdef const unsigned char[:] fresh_v = fresh
+    cdef const unsigned char[:] touched_v = touched
+    cdef Py_ssize_t[:] buy_v = buy_idx
+    cdef Py_ssize_t[:] sell_v = sell_idx
+    cdef double[:] buy_px_v = buy_px
+    cdef double[:] sell_px_v = sell_px
+    cdef double[:] vol_v = vol
+    cdef bint use_touched = ex is not None
+    cdef Py_ssize_t k
+
+    with nogil:
+        k = _scan_into(bid_v, ask_v, bid_sz_v, ask_sz_v, fresh_v,
+                       touched_v, use_touched, min_vol, min_spread_pct, n,
+                       buy_v, sell_v, buy_px_v, sell_px_v, vol_v)
+
+    return buy_idx[:k], sell_idx[:k], buy_px[:k], sell_px[:k], vol[:k]
+
+
+def scan_pairs(bid, ask, bid_sz, ask_sz, ts, double now, double max_age,
+               double min_vol, double min_spread_pct, Py_ssize_t n):
+    """Native _arb_kernels.scan_pairs()"""
+    return _scan(bid, ask, bid_sz, ask_sz, ts, now, max_age,
+                 min_vol, min_spread_pct, n, None)
+
+
+def scan_pairs_touching(bid, ask, bid_sz, ask_sz, ts, double now, double max_age,
+                        double min_vol, double min_spread_pct, Py_ssize_t n, ex):
+    """Native _arb_kernels.scan_pairs_touching()"""
+    return _scan(bid, ask, bid_sz, ask_sz, ts, now, max_age,
+                 min_vol, min_spread_pct, n, ex)
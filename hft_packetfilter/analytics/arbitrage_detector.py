@@ -8,21 +8,64 @@ Author: Tanzil github://@tanzil7890
 License: Apache License 2.0
 """
 
+import asyncio
+import heapq
+import itertools
+import sys
 import time
 import threading
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Callable, Iterable, Set, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
-import statistics
+from collections import deque
 import logging
 
+import numpy as np
+
 from ..core.data_structures import ArbitrageOpportunity
 from ..core.exceptions import ArbitrageDetectionError
 from ..utils.logger import get_logger
 from ..utils.metrics_collector import get_metrics_collector
 
+try:
+    from ._arb_native import scan_pairs, scan_pairs_touching
+except ImportError:  # Extension not built
+    from ._arb_kernels import scan_pairs, scan_pairs_touching
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Initial exchange capacity of the per-symbol quote arrays (doubled on demand)
+_INITIAL_EXCHANGE_SLOTS = 8
+
+# Field rows of the per-symbol quote buffers
+_BID, _ASK, _BID_SZ, _ASK_SZ, _TS = range(5)
+
+# Quotes kept per exchange for price statistics
+QUOTE_HISTORY_SIZE = 1000
+
+# Quotes older than this are left out of the cross-exchange scan
+QUOTE_MAX_AGE_SEC = 1.0
+
+# Quote gauges buffered by update_price_quote() before a bulk flush
+GAUGE_FLUSH_BATCH = 64
+
+# Quotes queued for the asyncio ingest consumer before the oldest is dropped
+INGEST_QUEUE_SIZE = 10000
+
+# Detected opportunities kept for get_arbitrage_report()
+OPPORTUNITY_HISTORY_SIZE = 10000
+
+# Lifetime of a detected opportunity
+OPPORTUNITY_TTL_SEC = 5.0
+_OPPORTUNITY_TTL_NS = int(OPPORTUNITY_TTL_SEC * 1_000_000_000)
 
-@dataclass
+# Quote and opportunity timestamps are epoch seconds (quotes carry exchange
+# time), but expiry of active opportunities runs on the monotonic clock in
+# integer nanoseconds so wall-clock steps can't expire or pin them
+_monotonic_ns = time.monotonic_ns
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PriceQuote:
     """Price quote from an exchange"""
     timestamp: float
@@ -33,6 +76,12 @@ class PriceQuote:
     bid_size: float
     ask_size: float
     
+    def __post_init__(self):
+        """Reject non-positive prices once, so the price math needs no guards"""
+        if self.bid_price <= 0 or self.ask_price <= 0:
+            raise ValueError(f"Quote prices must be positive: "
+                             f"bid={self.bid_price}, ask={self.ask_price}")
+    
     def mid_price(self) -> float:
         """Calculate mid price"""
         return (self.bid_price + self.ask_price) / 2
@@ -43,11 +92,10 @@ class PriceQuote:
     
     def spread_percentage(self) -> float:
         """Calculate spread as percentage of mid price"""
-        mid = self.mid_price()
-        return (self.spread() / mid) * 100 if mid > 0 else 0
+        return (self.ask_price - self.bid_price) / ((self.bid_price + self.ask_price) * 0.5) * 100
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ArbitrageOpportunityData:
     """Extended arbitrage opportunity with additional data"""
     timestamp: float
@@ -71,14 +119,51 @@ class ArbitrageOpportunityData:
     risk_score: float = 0.0
     
     def __post_init__(self):
-        """Calculate derived fields"""
+        """Validate inputs and calculate derived fields"""
+        if self.buy_price <= 0 or self.volume <= 0:
+            raise ValueError(f"Opportunity needs a positive buy price and volume: "
+                             f"buy_price={self.buy_price}, volume={self.volume}")
+        
         self.spread = self.sell_price - self.buy_price
-        self.spread_percentage = (self.spread / self.buy_price) * 100 if self.buy_price > 0 else 0
+        self.spread_percentage = (self.spread / self.buy_price) * 100
         
         # Calculate estimated profit after costs
         gross_profit = self.spread * self.volume
         self.estimated_profit = gross_profit - self.transaction_costs
     
+    @classmethod
+    def _from_scan(cls, timestamp: float, symbol: str,
+                   buy_exchange: str, sell_exchange: str,
+                   buy_price: float, sell_price: float, volume: float,
+                   buy_quote: PriceQuote, sell_quote: PriceQuote,
+                   expires_at: float) -> "ArbitrageOpportunityData":
+        """Build an opportunity for a pair the scan kernel already accepted
+        
+        Quotes guarantee buy_price > 0 and the kernel a positive spread and
+        volume, so the generated __init__/__post_init__ pair is bypassed and
+        the derived fields are filled in directly.
+        """
+        self = object.__new__(cls)
+        spread = sell_price - buy_price
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.buy_exchange = buy_exchange
+        self.sell_exchange = sell_exchange
+        self.buy_price = buy_price
+        self.sell_price = sell_price
+        self.spread = spread
+        self.spread_percentage = spread / buy_price * 100
+        self.volume = volume
+        self.estimated_profit = spread * volume
+        self.execution_time_us = 0.0
+        self.confidence = 1.0
+        self.expires_at = expires_at
+        self.buy_quote = buy_quote
+        self.sell_quote = sell_quote
+        self.transaction_costs = 0.0
+        self.risk_score = 0.0
+        return self
+    
     def is_profitable(self, min_spread_percentage: float = 0.1) -> bool:
         """Check if opportunity is profitable"""
         return (self.spread_percentage >= min_spread_percentage and 
@@ -91,28 +176,159 @@ class ArbitrageOpportunityData:
         return time.time() > self.expires_at
 
 
+class _QuoteRing:
+    """Fixed-size ring of recent quote fields for one exchange"""
+    
+    __slots__ = ("bid", "ask", "bid_sz", "ask_sz", "ts", "head", "count")
+    
+    def __init__(self, size: int = QUOTE_HISTORY_SIZE):
+        self.bid = np.empty(size)
+        self.ask = np.empty(size)
+        self.bid_sz = np.empty(size)
+        self.ask_sz = np.empty(size)
+        self.ts = np.empty(size)
+        self.head = 0
+        self.count = 0
+    
+    def append(self, quote: PriceQuote) -> None:
+        """Overwrite the oldest slot with a quote"""
+        i = self.head
+        self.bid[i] = quote.bid_price
+        self.ask[i] = quote.ask_price
+        self.bid_sz[i] = quote.bid_size
+        self.ask_sz[i] = quote.ask_size
+        self.ts[i] = quote.timestamp
+        
+        i += 1
+        self.head = 0 if i == self.bid.size else i
+        if self.count < self.bid.size:
+            self.count += 1
+
+
+def _array_stats(values: np.ndarray) -> Dict[str, float]:
+    return {
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "avg": float(values.mean()),
+        "median": _median(values)
+    }
+
+
+def _median(values: np.ndarray) -> float:
+    """Median by partial selection (as statistics.median for even counts)"""
+    mid = values.size // 2
+    if values.size % 2:
+        return float(np.partition(values, mid)[mid])
+    lower, upper = np.partition(values, (mid - 1, mid))[mid - 1:mid + 1]
+    return float((lower + upper) / 2)
+
+
 class CrossExchangeAnalyzer:
     """Cross-exchange price analysis"""
     
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, tick_size: Optional[float] = None):
         self.symbol = symbol
+        self.tick_size = tick_size
+        self._ticks_per_unit = None if tick_size is None else 1.0 / tick_size
         self.logger = get_logger()
         
         # Price tracking
         self.quotes: Dict[str, PriceQuote] = {}  # exchange -> latest quote
-        self.quote_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._history: List[_QuoteRing] = []  # exchange id -> recent quotes
+        
+        # Latest quote per exchange as field rows indexed by exchange id, so
+        # the cross-exchange scan is a handful of vectorized comparisons.
+        # With a tick size, bid and ask are whole tick counts (exact in
+        # float64), so crossing and spread thresholds compare exactly on the
+        # symbol's price grid.
+        # Each exchange has two buffer generations: its (single) producer
+        # fills the unpublished one and then flips _published_idx, so the
+        # scan can snapshot consistent quotes without taking a lock.
+        self._ex_ids: Dict[str, int] = {}
+        self._ex_names: List[str] = []
+        self._quote_buf = np.zeros((2, 5, _INITIAL_EXCHANGE_SLOTS))
+        self._quote_refs = np.empty((2, _INITIAL_EXCHANGE_SLOTS), dtype=object)
+        self._published_idx = np.zeros(_INITIAL_EXCHANGE_SLOTS, dtype=np.intp)
+        
+        # Registration is serialized by _register_lock. _resizes is odd
+        # while the arrays are being grown, and a producer whose write may
+        # have missed the copy writes again once the resize is done.
+        self._register_lock = threading.Lock()
+        self._resizes = 0
+        
+        # Exchange ids updated since the detector's last scan, and which
+        # exchanges had fresh quotes at that scan (see _scan_changed)
+        self._dirty_ex: Set[int] = set()
+        self._scanned_fresh = np.zeros(0, dtype=bool)
         
         # Statistics
         self.total_quotes_processed = 0
         self.opportunities_detected = 0
+    
+    def _register_exchange(self, exchange: str) -> int:
+        """Assign the next array slot to an exchange, growing the arrays if full"""
+        with self._register_lock:
+            ex_id = self._ex_ids.get(exchange)
+            if ex_id is not None:  # Registered by another thread meanwhile
+                return ex_id
+            
+            ex_id = len(self._ex_names)
+            if ex_id == self._published_idx.size:
+                # Buffers are grown before the new id is published, so a scan
+                # never sees an id beyond the arrays it reads
+                self._resizes += 1
+                capacity = 2 * ex_id
+                quote_buf = np.zeros((2, 5, capacity))
+                quote_buf[:, :, :ex_id] = self._quote_buf
+                quote_refs = np.empty((2, capacity), dtype=object)
+                quote_refs[:, :ex_id] = self._quote_refs
+                published_idx = np.zeros(capacity, dtype=np.intp)
+                published_idx[:ex_id] = self._published_idx
+                self._quote_buf = quote_buf
+                self._quote_refs = quote_refs
+                self._published_idx = published_idx
+                self._resizes += 1
+            
+            # The name lookup is published last, once the slot's history exists
+            self._history.append(_QuoteRing())
+            self._ex_names.append(exchange)
+            self._ex_ids[exchange] = ex_id
+            return ex_id
         
     def update_quote(self, quote: PriceQuote) -> None:
         """Update price quote for an exchange"""
         if quote.symbol != self.symbol:
             return
         
+        ex_id = self._ex_ids.get(quote.exchange)
+        if ex_id is None:
+            ex_id = self._register_exchange(quote.exchange)
+        
+        ticks_per_unit = self._ticks_per_unit
+        if ticks_per_unit is None:
+            bid, ask = quote.bid_price, quote.ask_price
+        else:
+            bid = round(quote.bid_price * ticks_per_unit)
+            ask = round(quote.ask_price * ticks_per_unit)
+        fields = (bid, ask, quote.bid_size, quote.ask_size, quote.timestamp)
+        
+        # Fill the unpublished generation, then publish it with one store
+        while True:
+            resizes = self._resizes
+            published = self._published_idx
+            gen = 1 - published[ex_id]
+            self._quote_buf[gen, :, ex_id] = fields
+            self._quote_refs[gen, ex_id] = quote
+            published[ex_id] = gen
+            if resizes == self._resizes and not resizes & 1:
+                break
+            # Arrays grown around the write; redo it once the resize is done
+            with self._register_lock:
+                pass
+        self._dirty_ex.add(ex_id)
+        
         self.quotes[quote.exchange] = quote
-        self.quote_history[quote.exchange].append(quote)
+        self._history[ex_id].append(quote)
         self.total_quotes_processed += 1
     
     def find_arbitrage_opportunities(self, 
@@ -128,108 +344,139 @@ class CrossExchangeAnalyzer:
         Returns:
             List of arbitrage opportunities
         """
-        opportunities = []
         current_time = time.time()
+        snapshot = self._snapshot()
+        return self._materialize(snapshot, current_time, *self._scan(
+            snapshot, min_spread_percentage, min_volume, current_time
+        ))
+    
+    def _snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copy the published quotes of every registered exchange
         
-        # Get all exchange pairs
-        exchanges = list(self.quotes.keys())
-        
-        for i, buy_exchange in enumerate(exchanges):
-            for sell_exchange in exchanges[i+1:]:
-                if buy_exchange == sell_exchange:
-                    continue
-                
-                buy_quote = self.quotes[buy_exchange]
-                sell_quote = self.quotes[sell_exchange]
-                
-                # Check if quotes are recent (within 1 second)
-                if (current_time - buy_quote.timestamp > 1.0 or 
-                    current_time - sell_quote.timestamp > 1.0):
-                    continue
-                
-                # Check buy low, sell high opportunity
-                if sell_quote.bid_price > buy_quote.ask_price:
-                    volume = min(buy_quote.ask_size, sell_quote.bid_size, min_volume)
-                    if volume >= min_volume:
-                        opportunity = ArbitrageOpportunityData(
-                            timestamp=current_time,
-                            symbol=self.symbol,
-                            buy_exchange=buy_exchange,
-                            sell_exchange=sell_exchange,
-                            buy_price=buy_quote.ask_price,
-                            sell_price=sell_quote.bid_price,
-                            volume=volume,
-                            buy_quote=buy_quote,
-                            sell_quote=sell_quote,
-                            expires_at=current_time + 5.0  # 5 second expiry
-                        )
-                        
-                        if opportunity.is_profitable(min_spread_percentage):
-                            opportunities.append(opportunity)
-                
-                # Check reverse opportunity
-                if buy_quote.bid_price > sell_quote.ask_price:
-                    volume = min(sell_quote.ask_size, buy_quote.bid_size, min_volume)
-                    if volume >= min_volume:
-                        opportunity = ArbitrageOpportunityData(
-                            timestamp=current_time,
-                            symbol=self.symbol,
-                            buy_exchange=sell_exchange,
-                            sell_exchange=buy_exchange,
-                            buy_price=sell_quote.ask_price,
-                            sell_price=buy_quote.bid_price,
-                            volume=volume,
-                            buy_quote=sell_quote,
-                            sell_quote=buy_quote,
-                            expires_at=current_time + 5.0
-                        )
-                        
-                        if opportunity.is_profitable(min_spread_percentage):
-                            opportunities.append(opportunity)
-        
-        self.opportunities_detected += len(opportunities)
-        return opportunities
+        Returns:
+            (fields, quotes): a (5, n) array of bid and ask (in ticks if
+            tick_size is set), bid size, ask size and timestamp rows, and the
+            matching PriceQuote objects
+        """
+        # Ids are published after the buffers grow, so read them first;
+        # the generation vector is copied once so both gathers agree
+        n = len(self._ex_names)
+        ex = np.arange(n)
+        gen = self._published_idx[:n].copy()
+        return self._quote_buf[gen, :, ex].T, self._quote_refs[gen, ex]
+    
+    def _scan(self, snapshot: Tuple[np.ndarray, np.ndarray],
+              min_spread_percentage: float, min_volume: float,
+              current_time: float) -> Tuple[np.ndarray, ...]:
+        """Run the pair kernel over a quote snapshot; returns its hit arrays
+        
+        Hit prices are in ticks if tick_size is set.
+        """
+        fields = snapshot[0]
+        hits = scan_pairs(
+            fields[_BID], fields[_ASK], fields[_BID_SZ], fields[_ASK_SZ], fields[_TS],
+            current_time, QUOTE_MAX_AGE_SEC, min_volume, min_spread_percentage,
+            fields.shape[1]
+        )
+        self.opportunities_detected += hits[0].size
+        return hits
+    
+    def _drain_changed(self) -> np.ndarray:
+        """Take the exchange ids queued by update_quote(), sorted"""
+        dirty = self._dirty_ex
+        ids = []
+        while dirty:
+            try:
+                ids.append(dirty.pop())
+            except KeyError:
+                break
+        ids.sort()
+        return np.array(ids, dtype=np.intp)
+    
+    def _scan_changed(self, snapshot: Tuple[np.ndarray, np.ndarray],
+                      changed: np.ndarray, incremental: bool,
+                      min_spread_percentage: float, min_volume: float,
+                      current_time: float) -> Tuple[Optional[np.ndarray], Tuple[np.ndarray, ...]]:
+        """
+        Scan for the detector, optionally only the pairs that may have changed
+        
+        An incremental scan covers the pairs touching an exchange in changed
+        or one whose quote went fresh or stale since the previous call. It
+        falls back to a full scan once that is half the exchanges or more.
+        
+        Returns:
+            (touched, hits): the exchange ids whose pairs were rescanned
+            (None after a full scan) and the kernel's hit arrays
+        """
+        fields = snapshot[0]
+        n = fields.shape[1]
+        fresh = (current_time - fields[_TS]) <= QUOTE_MAX_AGE_SEC
+        previous = self._scanned_fresh
+        self._scanned_fresh = fresh
+        
+        if incremental:
+            touched = np.union1d(
+                changed, np.flatnonzero(fresh[:previous.size] != previous)
+            )
+            if touched.size * 2 < n:
+                hits = scan_pairs_touching(
+                    fields[_BID], fields[_ASK], fields[_BID_SZ], fields[_ASK_SZ],
+                    fields[_TS], current_time, QUOTE_MAX_AGE_SEC, min_volume,
+                    min_spread_percentage, n, touched
+                )
+                self.opportunities_detected += hits[0].size
+                return touched, hits
+        
+        return None, self._scan(snapshot, min_spread_percentage, min_volume, current_time)
+    
+    def _materialize(self, snapshot: Tuple[np.ndarray, np.ndarray],
+                     current_time: float,
+                     buy_idx: np.ndarray, sell_idx: np.ndarray,
+                     buy_px: np.ndarray, sell_px: np.ndarray,
+                     vol: np.ndarray) -> List[ArbitrageOpportunityData]:
+        """Create opportunity objects for scan hits, priced from their quotes
+        
+        Each expires after OPPORTUNITY_TTL_SEC, or sooner once the older of
+        its two quotes is too stale to be scanned.
+        """
+        names = self._ex_names
+        quotes = snapshot[1]
+        ts = snapshot[0][_TS]
+        from_scan = ArbitrageOpportunityData._from_scan
+        expires_at = np.minimum(np.minimum(ts[buy_idx], ts[sell_idx]) + QUOTE_MAX_AGE_SEC,
+                                current_time + OPPORTUNITY_TTL_SEC)
+        return [
+            from_scan(current_time, self.symbol, names[b], names[s],
+                      quotes[b].ask_price, quotes[s].bid_price, volume,
+                      quotes[b], quotes[s], expiry)
+            for b, s, volume, expiry in zip(buy_idx.tolist(), sell_idx.tolist(),
+                                            vol.tolist(), expires_at.tolist())
+        ]
     
     def get_price_statistics(self, exchange: str, 
                            time_window: float = 3600) -> Dict[str, Any]:
         """Get price statistics for an exchange"""
-        current_time = time.time()
-        
-        # Get recent quotes
-        recent_quotes = [
-            q for q in self.quote_history[exchange]
-            if current_time - q.timestamp <= time_window
-        ]
+        ex_id = self._ex_ids.get(exchange)
+        if ex_id is None:
+            return {}
         
-        if not recent_quotes:
+        ring = self._history[ex_id]
+        count = ring.count
+        recent = (time.time() - ring.ts[:count]) <= time_window
+        if not recent.any():
             return {}
         
-        bid_prices = [q.bid_price for q in recent_quotes]
-        ask_prices = [q.ask_price for q in recent_quotes]
-        spreads = [q.spread() for q in recent_quotes]
+        bid_prices = ring.bid[:count][recent]
+        ask_prices = ring.ask[:count][recent]
         
         return {
             "exchange": exchange,
             "symbol": self.symbol,
-            "quote_count": len(recent_quotes),
-            "bid_stats": {
-                "min": min(bid_prices),
-                "max": max(bid_prices),
-                "avg": statistics.mean(bid_prices),
-                "median": statistics.median(bid_prices)
-            },
-            "ask_stats": {
-                "min": min(ask_prices),
-                "max": max(ask_prices),
-                "avg": statistics.mean(ask_prices),
-                "median": statistics.median(ask_prices)
-            },
-            "spread_stats": {
-                "min": min(spreads),
-                "max": max(spreads),
-                "avg": statistics.mean(spreads),
-                "median": statistics.median(spreads)
-            }
+            "quote_count": int(bid_prices.size),
+            "bid_stats": _array_stats(bid_prices),
+            "ask_stats": _array_stats(ask_prices),
+            "spread_stats": _array_stats(ask_prices - bid_prices)
         }
 
 
@@ -268,37 +515,95 @@ class ArbitrageDetector:
         self.analyzers: Dict[str, CrossExchangeAnalyzer] = {}
         
         # Opportunity tracking
-        self.active_opportunities: List[ArbitrageOpportunityData] = []
-        self.opportunity_history: deque = deque(maxlen=10000)
+        # Active opportunities by sequence number, with a min-heap of
+        # (monotonic expiry ns, seq) so cleanup only touches what actually
+        # expired. Heap entries for opportunities already replaced are skipped.
+        self._active_by_id: Dict[int, ArbitrageOpportunityData] = {}
+        self._active_ids_by_symbol: Dict[str, List[int]] = {}
+        self._expiry_heap: List[Tuple[int, int]] = []
+        self._opportunity_seq = itertools.count()
+        self.opportunity_history: deque = deque(maxlen=OPPORTUNITY_HISTORY_SIZE)
+        
+        # Numeric columns of opportunity_history, kept in step with it as a
+        # ring so reports aggregate with array reductions
+        self._symbol_ids: Dict[str, int] = {}
+        self._symbol_names: List[str] = []
+        self._hist_ts = np.empty(OPPORTUNITY_HISTORY_SIZE)
+        self._hist_spread_pct = np.empty(OPPORTUNITY_HISTORY_SIZE)
+        self._hist_profit = np.empty(OPPORTUNITY_HISTORY_SIZE)
+        self._hist_sym_id = np.empty(OPPORTUNITY_HISTORY_SIZE, dtype=np.intp)
+        self._hist_head = 0
+        self._hist_count = 0
         
         # Exchange configuration
         self.exchange_fees: Dict[str, float] = {}  # exchange -> fee percentage
         self.exchange_latencies: Dict[str, float] = {}  # exchange -> latency in us
         
+        # Per symbol, the scan settings its active opportunities were found
+        # with; a change forces the next scan of that symbol to be full
+        self._scan_keys: Dict[str, Tuple[Any, ...]] = {}
+        
+        # Fee/latency arrays per symbol, indexed like the analyzer's quote
+        # arrays; rebuilt when exchanges are added or reconfigured
+        self._exchange_config_version = 0
+        self._exchange_arrays: Dict[str, Tuple[CrossExchangeAnalyzer, int, int, np.ndarray, np.ndarray]] = {}
+        
         # Monitoring
         self.is_monitoring = False
         self.monitoring_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         
-        # Callbacks
-        self.opportunity_callbacks: List[Callable] = []
-        self.alert_callbacks: List[Callable] = []
+        # Symbols with quotes since their last scan; the monitoring loop
+        # sleeps on _wake and rescans only these. Producers only add and the
+        # loop only pops, both atomic set operations, so no lock is needed
+        self._dirty_symbols: Set[str] = set()
+        self._wake = threading.Event()
+        
+        # Asyncio ingest (see start_ingest); while a loop is attached,
+        # update_price_quote() only hands quotes to it
+        self._ingest_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ingest_q: Optional[asyncio.Queue] = None
+        self._ingest_task: Optional[asyncio.Task] = None
+        self.quotes_dropped = 0
+        
+        # (exchange, symbol) -> (price gauge name, spread gauge name)
+        self._metric_name_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        
+        # Gauge updates are appended lock-free and recorded in bulk; only
+        # the (rare) flush is serialized
+        self._gauge_buf: List[Tuple[str, float]] = []
+        self._gauge_flush_lock = threading.Lock()
+        
+        # Callbacks as tuples replaced by add_*_callback(), which dispatch
+        # iterates (and skips outright while they're empty)
+        self._opp_cb_tuple: Tuple[Callable, ...] = ()
+        self._alert_cb_tuple: Tuple[Callable, ...] = ()
         
         # Statistics
         self.start_time = time.time()
         self.total_opportunities_found = 0
         self.total_profit_potential = 0.0
         
-    def add_symbol(self, symbol: str) -> None:
-        """Add symbol for arbitrage monitoring"""
+    def add_symbol(self, symbol: str, tick_size: Optional[float] = None) -> None:
+        """
+        Add symbol for arbitrage monitoring
+        
+        Args:
+            symbol: Symbol to monitor
+            tick_size: Optional price grid of the symbol. Quotes are then
+                compared in whole ticks, which is exact; a grid coarser than
+                the real one hides sub-tick spreads
+        """
         if symbol not in self.analyzers:
-            self.analyzers[symbol] = CrossExchangeAnalyzer(symbol)
+            self.analyzers[symbol] = CrossExchangeAnalyzer(symbol, tick_size)
             self.logger.info(f"Added symbol for arbitrage monitoring: {symbol}")
     
     def remove_symbol(self, symbol: str) -> None:
         """Remove symbol from arbitrage monitoring"""
         if symbol in self.analyzers:
             del self.analyzers[symbol]
+            self._scan_keys.pop(symbol, None)
+            self._drop_active(symbol)
             self.logger.info(f"Removed symbol from arbitrage monitoring: {symbol}")
     
     def configure_exchange(self, exchange: str, fee_percentage: float, 
@@ -313,6 +618,7 @@ class ArbitrageDetector:
         """
         self.exchange_fees[exchange] = fee_percentage
         self.exchange_latencies[exchange] = latency_us
+        self._exchange_config_version += 1
         
         self.logger.info(f"Configured exchange {exchange}: "
                         f"fee={fee_percentage}%, latency={latency_us}μs")
@@ -321,9 +627,119 @@ class ArbitrageDetector:
         """
         Update price quote from an exchange
         
+        While asyncio ingest is running the quote is handed to its loop and
+        applied there, so the calling thread never waits on analyzer state
+        or metrics; otherwise it is applied immediately.
+        
+        Args:
+            quote: Price quote object
+        """
+        loop = self._ingest_loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._enqueue_quote, quote)
+                return
+            except RuntimeError:  # Loop closed without stop_ingest()
+                self._ingest_loop = None
+        self._apply_quote(quote)
+    
+    async def update_price_quote_async(self, quote: PriceQuote) -> None:
+        """
+        Update price quote from a coroutine
+        
+        Queues the quote for the ingest consumer without blocking when
+        called on the ingest loop; otherwise behaves as update_price_quote().
+        
         Args:
             quote: Price quote object
         """
+        if self._ingest_loop is asyncio.get_running_loop():
+            self._enqueue_quote(quote)
+        else:
+            self.update_price_quote(quote)
+    
+    async def start_ingest(self, maxsize: int = INGEST_QUEUE_SIZE) -> None:
+        """
+        Start applying quotes on the running event loop
+        
+        Quotes are queued in a bounded queue and applied by one consumer
+        task. When the queue is full the oldest quote is dropped (counted
+        in quotes_dropped), as a newer quote for it is already queued or
+        it is about to go stale anyway.
+        
+        Args:
+            maxsize: Queue capacity
+        """
+        loop = asyncio.get_running_loop()
+        task = self._ingest_task
+        if task is not None:
+            if not task.done() and task.get_loop() is loop:
+                return
+            # Left behind by a loop that ended (or moved on) without
+            # stop_ingest(); its queue is unreachable now
+            self._ingest_loop = None
+            self._ingest_task = None
+            self._ingest_q = None
+        
+        self._ingest_q = asyncio.Queue(maxsize)
+        self._ingest_task = loop.create_task(self._ingest_consumer())
+        self._ingest_loop = loop
+        
+        self.logger.info("Started arbitrage quote ingest")
+    
+    async def stop_ingest(self) -> None:
+        """Apply the quotes still queued, then stop the ingest consumer"""
+        if self._ingest_task is None:
+            return
+        
+        # Detach first so new quotes are applied directly, then drain
+        self._ingest_loop = None
+        q = self._ingest_q
+        await q.join()
+        self._ingest_task.cancel()
+        try:
+            await self._ingest_task
+        except asyncio.CancelledError:
+            pass
+        self._ingest_task = None
+        self._ingest_q = None
+        
+        # Quotes other threads scheduled before they saw the detach
+        while not q.empty():
+            self._apply_quote(q.get_nowait())
+        
+        self.logger.info("Stopped arbitrage quote ingest")
+    
+    def _enqueue_quote(self, quote: PriceQuote) -> None:
+        """Queue a quote for the consumer, dropping the oldest when full"""
+        q = self._ingest_q
+        if q is None:  # Stopped while this was scheduled
+            self._apply_quote(quote)
+            return
+        try:
+            q.put_nowait(quote)
+        except asyncio.QueueFull:
+            # Put before marking the dropped quote done, so the unfinished
+            # count never touches zero and releases stop_ingest()'s join()
+            q.get_nowait()
+            q.put_nowait(quote)
+            q.task_done()
+            self.quotes_dropped += 1
+    
+    async def _ingest_consumer(self) -> None:
+        """Apply queued quotes one at a time"""
+        q = self._ingest_q
+        while True:
+            quote = await q.get()
+            try:
+                self._apply_quote(quote)
+            except Exception as e:
+                self.logger.error(f"Error applying quote: {e}")
+            finally:
+                q.task_done()
+    
+    def _apply_quote(self, quote: PriceQuote) -> None:
+        """Apply a quote to its analyzer and queue its symbol for scanning"""
         # Ensure symbol analyzer exists
         if quote.symbol not in self.analyzers:
             self.add_symbol(quote.symbol)
@@ -332,129 +748,232 @@ class ArbitrageDetector:
         analyzer = self.analyzers[quote.symbol]
         analyzer.update_quote(quote)
         
-        # Record metrics
-        self.metrics_collector.record_gauge(
-            f"arbitrage.price.{quote.exchange}.{quote.symbol}",
-            quote.mid_price()
-        )
-        self.metrics_collector.record_gauge(
-            f"arbitrage.spread.{quote.exchange}.{quote.symbol}",
-            quote.spread_percentage()
-        )
+        # Hand the symbol to the monitoring loop
+        self._dirty_symbols.add(quote.symbol)
+        if not self._wake.is_set():
+            self._wake.set()
+        
+        # Record metrics (names are formatted once per exchange/symbol)
+        key = (quote.exchange, quote.symbol)
+        names = self._metric_name_cache.get(key)
+        if names is None:
+            names = self._metric_name_cache[key] = (
+                f"arbitrage.price.{quote.exchange}.{quote.symbol}",
+                f"arbitrage.spread.{quote.exchange}.{quote.symbol}",
+            )
+        
+        gauge_buf = self._gauge_buf
+        gauge_buf.append((names[0], quote.mid_price()))
+        gauge_buf.append((names[1], quote.spread_percentage()))
+        if len(gauge_buf) >= GAUGE_FLUSH_BATCH:
+            self._flush_gauges()
     
     def find_opportunities(self) -> List[ArbitrageOpportunityData]:
         """Find all current arbitrage opportunities"""
+        return self._find_opportunities(self.analyzers)
+    
+    def _find_opportunities(self, symbols: Iterable[str],
+                            incremental: bool = False) -> List[ArbitrageOpportunityData]:
+        """
+        Scan the given symbols and publish what they yield
+        
+        With incremental set, only exchange pairs that changed since a
+        symbol's previous scan are rescanned, and only their opportunities
+        are replaced; the rest of the symbol's active ones stay.
+        """
         all_opportunities = []
+        scanned = {}
         
-        for symbol, analyzer in self.analyzers.items():
-            opportunities = analyzer.find_arbitrage_opportunities(
-                self.min_spread_percentage,
-                self.min_volume
+        # One clock reading per batch; the monotonic one dates expiry
+        current_time = time.time()
+        now_ns = _monotonic_ns()
+        
+        for symbol in tuple(symbols):
+            analyzer = self.analyzers.get(symbol)
+            if analyzer is None:  # Removed since it was queued
+                continue
+            scanned[symbol], opportunities = self._scan_symbol(
+                symbol, analyzer, incremental, current_time
             )
-            
-            # Enhance opportunities with additional analysis
-            for opp in opportunities:
-                self._enhance_opportunity(opp)
-                
-                # Filter by minimum profit
-                if opp.estimated_profit >= self.min_profit_usd:
-                    all_opportunities.append(opp)
-        
-        # Update active opportunities
-        self.active_opportunities = [opp for opp in all_opportunities if not opp.is_expired()]
+            all_opportunities.extend(opportunities)
+        
+        # Update active opportunities; rescanned pairs' previous results are
+        # replaced by their latest ones
+        self._cleanup_expired_opportunities(now_ns)
+        for symbol, touched in scanned.items():
+            if touched is None:
+                self._drop_active(symbol)
+            else:
+                self._drop_active_touching(symbol, touched)
+        self._add_active(all_opportunities, now_ns, current_time)
         
         # Add to history
-        for opp in all_opportunities:
-            self.opportunity_history.append(opp)
+        self._record_history(all_opportunities)
         
         # Update statistics
         self.total_opportunities_found += len(all_opportunities)
         self.total_profit_potential += sum(opp.estimated_profit for opp in all_opportunities)
         
-        # Record metrics
-        self.metrics_collector.record_gauge(
-            "arbitrage.active_opportunities",
-            len(self.active_opportunities)
-        )
+        # Record metrics (also flushes buffered quote gauges)
+        self._gauge_buf.append(("arbitrage.active_opportunities", len(self._active_by_id)))
+        self._flush_gauges()
         self.metrics_collector.record_counter(
             "arbitrage.opportunities_found",
             len(all_opportunities)
         )
         
         # Trigger callbacks
-        for opp in all_opportunities:
-            for callback in self.opportunity_callbacks:
-                try:
-                    callback(opp)
-                except Exception as e:
-                    self.logger.error(f"Opportunity callback error: {e}")
-            
-            # Send alerts for high-value opportunities
-            if opp.estimated_profit >= self.min_profit_usd * 5:  # 5x minimum
-                self._send_opportunity_alert(opp)
+        opp_callbacks = self._opp_cb_tuple
+        if opp_callbacks:
+            for opp in all_opportunities:
+                for callback in opp_callbacks:
+                    try:
+                        callback(opp)
+                    except Exception as e:
+                        self.logger.error(f"Opportunity callback error: {e}")
+        
+        # Send alerts for high-value opportunities
+        if self._alert_cb_tuple:
+            alert_profit = self.min_profit_usd * 5  # 5x minimum
+            for opp in all_opportunities:
+                if opp.estimated_profit >= alert_profit:
+                    self._send_opportunity_alert(opp)
         
         return all_opportunities
     
-    def _enhance_opportunity(self, opportunity: ArbitrageOpportunityData) -> None:
-        """Enhance opportunity with additional analysis"""
-        # Calculate transaction costs
-        buy_fee = self.exchange_fees.get(opportunity.buy_exchange, 0.001)  # 0.1% default
-        sell_fee = self.exchange_fees.get(opportunity.sell_exchange, 0.001)
-        
-        buy_cost = opportunity.buy_price * opportunity.volume * (buy_fee / 100)
-        sell_cost = opportunity.sell_price * opportunity.volume * (sell_fee / 100)
-        opportunity.transaction_costs = buy_cost + sell_cost
-        
-        # Recalculate profit after costs
-        gross_profit = opportunity.spread * opportunity.volume
-        opportunity.estimated_profit = gross_profit - opportunity.transaction_costs
-        
-        # Calculate execution time
-        buy_latency = self.exchange_latencies.get(opportunity.buy_exchange, 1000)  # 1ms default
-        sell_latency = self.exchange_latencies.get(opportunity.sell_exchange, 1000)
-        opportunity.execution_time_us = max(buy_latency, sell_latency)
-        
-        # Calculate confidence score
-        confidence = 1.0
-        
-        # Reduce confidence for stale quotes
-        current_time = time.time()
-        if opportunity.buy_quote:
-            age = current_time - opportunity.buy_quote.timestamp
-            if age > 0.5:  # Older than 500ms
-                confidence *= 0.8
-        
-        if opportunity.sell_quote:
-            age = current_time - opportunity.sell_quote.timestamp
-            if age > 0.5:
-                confidence *= 0.8
-        
-        # Reduce confidence for small spreads
-        if opportunity.spread_percentage < 0.2:  # Less than 0.2%
-            confidence *= 0.7
-        
-        # Reduce confidence for high execution time
-        if opportunity.execution_time_us > 5000:  # More than 5ms
-            confidence *= 0.6
-        
-        opportunity.confidence = confidence
-        
-        # Calculate risk score
-        risk_score = 0.0
+    def _record_history(self, opportunities: List[ArbitrageOpportunityData]) -> None:
+        """Append opportunities to opportunity_history and its numeric ring"""
+        head = self._hist_head
+        for opp in opportunities:
+            sym_id = self._symbol_ids.get(opp.symbol)
+            if sym_id is None:
+                sym_id = self._symbol_ids[opp.symbol] = len(self._symbol_names)
+                self._symbol_names.append(opp.symbol)
+            
+            self._hist_ts[head] = opp.timestamp
+            self._hist_spread_pct[head] = opp.spread_percentage
+            self._hist_profit[head] = opp.estimated_profit
+            self._hist_sym_id[head] = sym_id
+            head = (head + 1) % OPPORTUNITY_HISTORY_SIZE
+            
+            self.opportunity_history.append(opp)
         
-        # Higher risk for larger volumes
-        if opportunity.volume > 10000:
-            risk_score += 0.3
+        self._hist_head = head
+        self._hist_count = min(self._hist_count + len(opportunities), OPPORTUNITY_HISTORY_SIZE)
+    
+    def _scan_symbol(self, symbol: str, analyzer: CrossExchangeAnalyzer,
+                     incremental: bool, current_time: float) -> Tuple[Optional[Set[str]], List[ArbitrageOpportunityData]]:
+        """
+        Scan one symbol for enhanced, profitable opportunities
         
-        # Higher risk for volatile symbols (simplified)
-        if opportunity.spread_percentage > 1.0:  # Very wide spread
-            risk_score += 0.4
+        Returns:
+            (touched, opportunities): the exchanges whose pairs were
+            rescanned (None after a full scan) and what they yielded
+        """
+        scan_key = (analyzer, self._exchange_config_version, self.min_spread_percentage,
+                    self.min_volume, self.min_profit_usd)
+        if self._scan_keys.get(symbol) != scan_key:
+            self._scan_keys[symbol] = scan_key
+            incremental = False
+        
+        # Drain before snapshotting, so a quote published in between is
+        # queued again rather than lost
+        changed = analyzer._drain_changed()
+        snapshot = analyzer._snapshot()
+        touched, hits = analyzer._scan_changed(snapshot, changed, incremental,
+                                               self.min_spread_percentage,
+                                               self.min_volume, current_time)
+        if touched is not None:
+            names = analyzer._ex_names
+            touched = {names[i] for i in touched.tolist()}
+        if not hits[0].size:
+            return touched, []
+        
+        # Score every hit as arrays, then build objects only for survivors
+        costs, profit, exec_us, confidence, risk = self._enhance_batch(
+            symbol, analyzer, current_time, snapshot, *hits
+        )
+        keep = np.flatnonzero(profit >= self.min_profit_usd)
+        if not keep.size:
+            return touched, []
+        
+        opportunities = analyzer._materialize(snapshot, current_time,
+                                              *(a[keep] for a in hits))
+        for opp, c, p, e, conf, r in zip(opportunities, costs[keep].tolist(),
+                                         profit[keep].tolist(), exec_us[keep].tolist(),
+                                         confidence[keep].tolist(), risk[keep].tolist()):
+            opp.transaction_costs = c
+            opp.estimated_profit = p
+            opp.execution_time_us = e
+            opp.confidence = conf
+            opp.risk_score = r
+        
+        return touched, opportunities
+    
+    def _exchange_params(self, symbol: str,
+                         analyzer: CrossExchangeAnalyzer) -> Tuple[np.ndarray, np.ndarray]:
+        """Fee and latency arrays indexed by the analyzer's exchange ids"""
+        n = len(analyzer._ex_names)
+        cached = self._exchange_arrays.get(symbol)
+        if (cached is not None and cached[0] is analyzer and cached[1] == n
+                and cached[2] == self._exchange_config_version):
+            return cached[3], cached[4]
+        
+        names = analyzer._ex_names
+        fees = np.array([self.exchange_fees.get(name, 0.001) for name in names])  # 0.1% default
+        latencies = np.array([self.exchange_latencies.get(name, 1000) for name in names],
+                             dtype=np.float64)  # 1ms default
+        self._exchange_arrays[symbol] = (analyzer, n, self._exchange_config_version, fees, latencies)
+        return fees, latencies
+    
+    def _enhance_batch(self, symbol: str, analyzer: CrossExchangeAnalyzer,
+                       current_time: float,
+                       snapshot: Tuple[np.ndarray, np.ndarray],
+                       buy_idx: np.ndarray, sell_idx: np.ndarray,
+                       buy_px: np.ndarray, sell_px: np.ndarray,
+                       vol: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Score scan hits with costs, confidence and risk
         
-        # Higher risk for slow execution
-        if opportunity.execution_time_us > 2000:  # More than 2ms
-            risk_score += 0.3
+        Returns:
+            (transaction_costs, estimated_profit, execution_time_us,
+             confidence, risk_score) arrays aligned with the hits
+        """
+        fees, latencies = self._exchange_params(symbol, analyzer)
+        ts = snapshot[0][_TS]
+        
+        # Hit prices are in ticks when the symbol has a tick size; ticks only
+        # decide crossing, so score with the quotes' own prices as
+        # _materialize() does
+        if analyzer.tick_size is not None:
+            quotes = snapshot[1]
+            buy_px = np.array([q.ask_price for q in quotes[buy_idx]])
+            sell_px = np.array([q.bid_price for q in quotes[sell_idx]])
+        spread = sell_px - buy_px
+        
+        # Calculate transaction costs and profit after costs
+        costs = (buy_px * vol * (fees[buy_idx] / 100) +
+                 sell_px * vol * (fees[sell_idx] / 100))
+        profit = spread * vol - costs
         
-        opportunity.risk_score = min(1.0, risk_score)
+        # Calculate execution time
+        exec_us = np.maximum(latencies[buy_idx], latencies[sell_idx])
+        
+        # Confidence drops for quotes older than 500ms, spreads under 0.2%
+        # and execution slower than 5ms (spread thresholds are compared as
+        # spread vs. buy_price * pct / 100 to avoid dividing)
+        confidence = (np.where(current_time - ts[buy_idx] > 0.5, 0.8, 1.0) *
+                      np.where(current_time - ts[sell_idx] > 0.5, 0.8, 1.0) *
+                      np.where(spread < buy_px * 0.002, 0.7, 1.0) *
+                      np.where(exec_us > 5000, 0.6, 1.0))
+        
+        # Risk rises with large volumes, very wide (volatile) spreads and
+        # execution slower than 2ms
+        risk = np.minimum(1.0, (vol > 10000) * 0.3 +
+                               (spread > buy_px * 0.01) * 0.4 +
+                               (exec_us > 2000) * 0.3)
+        
+        return costs, profit, exec_us, confidence, risk
     
     def _send_opportunity_alert(self, opportunity: ArbitrageOpportunityData) -> None:
         """Send alert for high-value opportunity"""
@@ -471,7 +990,7 @@ class ArbitrageDetector:
             "opportunity": opportunity
         }
         
-        for callback in self.alert_callbacks:
+        for callback in self._alert_cb_tuple:
             try:
                 callback(alert_data)
             except Exception as e:
@@ -500,6 +1019,7 @@ class ArbitrageDetector:
         
         self.is_monitoring = False
         self._stop_event.set()
+        self._wake.set()
         
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
@@ -507,22 +1027,91 @@ class ArbitrageDetector:
         self.logger.info("Stopped arbitrage monitoring")
     
     def _monitoring_loop(self) -> None:
-        """Arbitrage monitoring loop"""
+        """Arbitrage monitoring loop
+        
+        Wakes as soon as a quote arrives (or after monitoring_interval to
+        expire old opportunities) and rescans only the symbols that changed,
+        and within those only the exchange pairs that did.
+        """
         while not self._stop_event.is_set():
             try:
-                self.find_opportunities()
+                self._wake.wait(self.monitoring_interval)
+                # Clear before draining so a quote landing mid-scan wakes us again
+                self._wake.clear()
+                self._find_opportunities(self._drain_dirty_symbols(), incremental=True)
                 self._cleanup_expired_opportunities()
-                self._stop_event.wait(self.monitoring_interval)
             except Exception as e:
                 self.logger.error(f"Error in arbitrage monitoring loop: {e}")
                 time.sleep(1)
     
-    def _cleanup_expired_opportunities(self) -> None:
+    def _flush_gauges(self) -> None:
+        """Record buffered gauge updates in one collector call"""
+        with self._gauge_flush_lock:
+            buf = self._gauge_buf
+            # Slice and delete are each atomic, so appends racing with the
+            # flush stay in the buffer for next time
+            n = len(buf)
+            if not n:
+                return
+            batch = buf[:n]
+            del buf[:n]
+        self.metrics_collector.record_gauges_bulk(batch)
+    
+    def _drain_dirty_symbols(self) -> List[str]:
+        """Take every symbol queued by update_price_quote()"""
+        dirty = self._dirty_symbols
+        symbols = []
+        while dirty:
+            try:
+                symbols.append(dirty.pop())
+            except KeyError:
+                break
+        return symbols
+    
+    @property
+    def active_opportunities(self) -> List[ArbitrageOpportunityData]:
+        """Opportunities found by the latest scans that have not expired yet"""
+        return list(self._active_by_id.values())
+    
+    def _add_active(self, opportunities: List[ArbitrageOpportunityData],
+                    now_ns: int, current_time: float) -> None:
+        """Publish opportunities, dating their expires_at on the monotonic clock"""
+        active = self._active_by_id
+        heap = self._expiry_heap
+        for opp in opportunities:
+            seq = next(self._opportunity_seq)
+            active[seq] = opp
+            self._active_ids_by_symbol.setdefault(opp.symbol, []).append(seq)
+            if opp.expires_at is not None:
+                ttl_ns = min(_OPPORTUNITY_TTL_NS,
+                             int((opp.expires_at - current_time) * 1_000_000_000))
+                heapq.heappush(heap, (now_ns + ttl_ns, seq))
+    
+    def _drop_active(self, symbol: str) -> None:
+        active = self._active_by_id
+        for seq in self._active_ids_by_symbol.pop(symbol, ()):
+            active.pop(seq, None)
+    
+    def _drop_active_touching(self, symbol: str, exchanges: Set[str]) -> None:
+        active = self._active_by_id
+        kept = []
+        for seq in self._active_ids_by_symbol.get(symbol, ()):
+            opp = active.get(seq)
+            if opp is None:  # Expired
+                continue
+            if opp.buy_exchange in exchanges or opp.sell_exchange in exchanges:
+                del active[seq]
+            else:
+                kept.append(seq)
+        self._active_ids_by_symbol[symbol] = kept
+    
+    def _cleanup_expired_opportunities(self, now_ns: Optional[int] = None) -> None:
         """Remove expired opportunities"""
-        self.active_opportunities = [
-            opp for opp in self.active_opportunities 
-            if not opp.is_expired()
-        ]
+        now = _monotonic_ns() if now_ns is None else now_ns
+        heap = self._expiry_heap
+        active = self._active_by_id
+        while heap and heap[0][0] < now:
+            active.pop(heapq.heappop(heap)[1], None)
     
     def get_arbitrage_report(self, symbol: Optional[str] = None,
                            time_window: float = 3600) -> Dict[str, Any]:
@@ -538,50 +1127,54 @@ class ArbitrageDetector:
         """
         current_time = time.time()
         
-        # Filter recent opportunities
-        recent_opportunities = [
-            opp for opp in self.opportunity_history
-            if current_time - opp.timestamp <= time_window
-        ]
+        # Ring slots in insertion order, aligned with opportunity_history
+        count = self._hist_count
+        slots = (np.arange(count) + (self._hist_head - count)) % OPPORTUNITY_HISTORY_SIZE
         
+        # Filter recent opportunities
+        sym_ids = self._hist_sym_id[slots]
+        mask = (current_time - self._hist_ts[slots]) <= time_window
         if symbol:
-            recent_opportunities = [
-                opp for opp in recent_opportunities
-                if opp.symbol == symbol
-            ]
+            mask &= sym_ids == self._symbol_ids.get(symbol, -1)
+        
+        sym_ids = sym_ids[mask]
+        profits = self._hist_profit[slots][mask]
+        spreads = self._hist_spread_pct[slots][mask]
         
         # Calculate statistics
-        total_opportunities = len(recent_opportunities)
-        total_profit = sum(opp.estimated_profit for opp in recent_opportunities)
+        total_opportunities = int(sym_ids.size)
+        total_profit = float(profits.sum())
         
         # Group by symbol
-        symbol_stats = defaultdict(lambda: {
-            "count": 0,
-            "total_profit": 0.0,
-            "avg_spread": 0.0,
-            "max_spread": 0.0
-        })
-        
-        for opp in recent_opportunities:
-            stats = symbol_stats[opp.symbol]
-            stats["count"] += 1
-            stats["total_profit"] += opp.estimated_profit
-            stats["avg_spread"] += opp.spread_percentage
-            stats["max_spread"] = max(stats["max_spread"], opp.spread_percentage)
-        
-        # Calculate averages
-        for symbol_name, stats in symbol_stats.items():
-            if stats["count"] > 0:
-                stats["avg_spread"] /= stats["count"]
+        n_symbols = len(self._symbol_names)
+        counts = np.bincount(sym_ids, minlength=n_symbols)
+        profit_sums = np.bincount(sym_ids, weights=profits, minlength=n_symbols)
+        spread_sums = np.bincount(sym_ids, weights=spreads, minlength=n_symbols)
+        max_spreads = np.zeros(n_symbols)
+        np.maximum.at(max_spreads, sym_ids, spreads)
+        
+        symbol_stats = {
+            self._symbol_names[i]: {
+                "count": int(counts[i]),
+                "total_profit": float(profit_sums[i]),
+                "avg_spread": float(spread_sums[i] / counts[i]),
+                "max_spread": float(max_spreads[i])
+            }
+            for i in np.flatnonzero(counts).tolist()
+        }
+        
+        # Last 20 matching opportunities, looked up by history position
+        history = self.opportunity_history
+        recent_opportunities = [history[i] for i in np.flatnonzero(mask)[-20:].tolist()]
         
         report = {
             "timestamp": current_time,
             "time_window_hours": time_window / 3600,
             "total_opportunities": total_opportunities,
-            "active_opportunities": len(self.active_opportunities),
+            "active_opportunities": len(self._active_by_id),
             "total_profit_potential": total_profit,
             "avg_profit_per_opportunity": total_profit / total_opportunities if total_opportunities > 0 else 0,
-            "symbol_statistics": dict(symbol_stats),
+            "symbol_statistics": symbol_stats,
             "recent_opportunities": [
                 {
                     "timestamp": opp.timestamp,
@@ -593,19 +1186,29 @@ class ArbitrageDetector:
                     "confidence": opp.confidence,
                     "risk_score": opp.risk_score
                 }
-                for opp in recent_opportunities[-20:]  # Last 20 opportunities
+                for opp in recent_opportunities
             ]
         }
         
         return report
     
+    @property
+    def opportunity_callbacks(self) -> Tuple[Callable, ...]:
+        """Registered opportunity callbacks (read-only; use add_opportunity_callback())"""
+        return self._opp_cb_tuple
+    
+    @property
+    def alert_callbacks(self) -> Tuple[Callable, ...]:
+        """Registered alert callbacks (read-only; use add_alert_callback())"""
+        return self._alert_cb_tuple
+    
     def add_opportunity_callback(self, callback: Callable) -> None:
         """Add opportunity callback"""
-        self.opportunity_callbacks.append(callback)
+        self._opp_cb_tuple += (callback,)
     
     def add_alert_callback(self, callback: Callable) -> None:
         """Add alert callback"""
-        self.alert_callbacks.append(callback)
+        self._alert_cb_tuple += (callback,)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get detector statistics"""
@@ -614,8 +1217,9 @@ class ArbitrageDetector:
             "symbols_monitored": len(self.analyzers),
             "total_opportunities_found": self.total_opportunities_found,
             "total_profit_potential": self.total_profit_potential,
-            "active_opportunities": len(self.active_opportunities),
+            "active_opportunities": len(self._active_by_id),
             "is_monitoring": self.is_monitoring,
+            "quotes_dropped": self.quotes_dropped,
             "min_spread_percentage": self.min_spread_percentage,
             "min_volume": self.min_volume,
             "min_profit_usd": self.min_profit_usd
@@ -8,64 +8,76 @@ Author: Tanzil github://@tanzil7890
 License: Apache License 2.0
 """
 
-# Core classes
-from .hft_analyzer import HFTAnalyzer
-from .exchange_config import ExchangeConfig, CommonExchanges
-from .production_config import ProductionConfig
-from .data_structures import (
-    TradingMetrics,
-    LatencyMeasurement,
-    RiskEvent,
-    MarketDataQuality,
-    ArbitrageOpportunity,
-    ExchangeConnection,
-    SystemMetrics,
-    ComplianceEvent,
-    RiskLevel,
-    EventType,
-    ExchangeStatus
-)
-from .constants import (
-    DEFAULT_LATENCY_TARGET_US,
-    DEFAULT_PACKET_BUFFER_SIZE,
-    SUPPORTED_EXCHANGES,
-    SUPPORTED_PROTOCOLS,
-    COMPLIANCE_REGULATIONS,
-    PERFORMANCE_MODES,
-    RISK_SEVERITY_LEVELS,
-    ALERT_TYPES,
-    FIX_MESSAGE_TYPES,
-    TRADING_SESSIONS,
-    ARBITRAGE_THRESHOLDS,
-    SYSTEM_LIMITS
-)
-from .exceptions import (
-    HFTPacketFilterError,
-    ExchangeConnectionError,
-    LatencyThresholdExceededError,
-    ComplianceViolationError,
-    ConfigurationError,
-    AuthenticationError,
-    PermissionError,
-    TimeoutError,
-    ProtocolError,
-    DataValidationError,
-    ResourceLimitExceededError,
-    PacketCaptureError,
-    MetricsCollectionError,
-    AlertSystemError,
-    ArbitrageDetectionError,
-    MarketDataQualityError,
-    CriticalError,
-    WarningError,
-    CriticalLatencyError,
-    CriticalComplianceError,
-    CriticalConnectionError,
-    is_critical_error,
-    is_warning_error,
-    get_error_code,
-    format_exception_for_logging
-)
+# Core classes and constants are imported lazily on first access (see
+# __getattr__), so importing e.g. core.constants doesn't pull in the analyzer
+_LAZY_SUBMODULES = {
+    ".hft_analyzer": ("HFTAnalyzer",),
+    ".exchange_config": ("ExchangeConfig", "CommonExchanges"),
+    ".production_config": ("ProductionConfig",),
+
+    # Data structures
+    ".data_structures": (
+        "TradingMetrics",
+        "LatencyMeasurement",
+        "acquire_latency_measurement",
+        "release_latency_measurement",
+        "RiskEvent",
+        "MarketDataQuality",
+        "ArbitrageOpportunity",
+        "ExchangeConnection",
+        "SystemMetrics",
+        "ComplianceEvent",
+        "RiskLevel",
+        "EventType",
+        "ExchangeStatus",
+    ),
+
+    # Constants
+    ".constants": (
+        "DEFAULT_LATENCY_TARGET_US",
+        "DEFAULT_PACKET_BUFFER_SIZE",
+        "SUPPORTED_EXCHANGES",
+        "SUPPORTED_PROTOCOLS",
+        "COMPLIANCE_REGULATIONS",
+        "PERFORMANCE_MODES",
+        "PerfMode",
+        "RISK_SEVERITY_LEVELS",
+        "ALERT_TYPES",
+        "FIX_MESSAGE_TYPES",
+        "TRADING_SESSIONS",
+        "ARBITRAGE_THRESHOLDS",
+        "SYSTEM_LIMITS",
+    ),
+
+    # Exceptions
+    ".exceptions": (
+        "HFTPacketFilterError",
+        "ExchangeConnectionError",
+        "LatencyThresholdExceededError",
+        "ComplianceViolationError",
+        "ConfigurationError",
+        "AuthenticationError",
+        "PermissionError",
+        "TimeoutError",
+        "ProtocolError",
+        "DataValidationError",
+        "ResourceLimitExceededError",
+        "PacketCaptureError",
+        "MetricsCollectionError",
+        "AlertSystemError",
+        "ArbitrageDetectionError",
+        "MarketDataQualityError",
+        "CriticalError",
+        "WarningError",
+        "CriticalLatencyError",
+        "CriticalComplianceError",
+        "CriticalConnectionError",
+        "is_critical_error",
+        "is_warning_error",
+        "get_error_code",
+        "format_exception_for_logging",
+    ),
+}
 
 __all__ = [
     # Main analyzer
@@ -79,6 +91,8 @@ __all__ = [
     # Data structures
     "TradingMetrics",
     "LatencyMeasurement",
+    "acquire_latency_measurement",
+    "release_latency_measurement",
     "RiskEvent",
     "MarketDataQuality",
     "ArbitrageOpportunity",
@@ -98,6 +112,7 @@ __all__ = [
     "SUPPORTED_PROTOCOLS",
     "COMPLIANCE_REGULATIONS",
     "PERFORMANCE_MODES",
+    "PerfMode",
     "RISK_SEVERITY_LEVELS",
     "ALERT_TYPES",
     "FIX_MESSAGE_TYPES",
@@ -134,3 +149,25 @@ __all__ = [
     "get_error_code",
     "format_exception_for_logging",
 ]
+
+_LAZY_IMPORTS = {
+    name: module
+    for module, names in _LAZY_SUBMODULES.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    """Import a core name from its submodule on first access"""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
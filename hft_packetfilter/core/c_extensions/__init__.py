@@ -11,9 +11,12 @@ License: Apache License 2.0
 
 try:
     # Import compiled Cython extensions
-    from .fast_parser import FastPacketParser
-    from .latency_tracker import UltraLowLatencyTracker
-    from .memory_pool import HighPerformanceMemoryPool
+    from .fast_parser import (
+        FastPacketParser, parse_fix_symbol_price, parse_fix_symbol_price_cents, fix_checksum,
+        fix_field_offsets,
+    )
+    from .latency_tracker import UltraLowLatencyTracker, rdtsc_ns, spin_pause
+    from .memory_pool import HighPerformanceMemoryPool, PoolLease
     from .lock_free_queue import LockFreeQueue
     
     # Performance utilities
@@ -39,8 +42,15 @@ except ImportError as e:
     
     from .fallbacks import (
         FastPacketParser,
+        parse_fix_symbol_price,
+        parse_fix_symbol_price_cents,
+        fix_checksum,
+        fix_field_offsets,
         UltraLowLatencyTracker,
+        rdtsc_ns,
+        spin_pause,
         HighPerformanceMemoryPool,
+        PoolLease,
         LockFreeQueue,
     )
     
@@ -64,8 +74,15 @@ except ImportError as e:
 
 __all__ = [
     'FastPacketParser',
+    'parse_fix_symbol_price',
+    'parse_fix_symbol_price_cents',
+    'fix_checksum',
+    'fix_field_offsets',
     'UltraLowLatencyTracker', 
+    'rdtsc_ns',
+    'spin_pause',
     'HighPerformanceMemoryPool',
+    'PoolLease',
     'LockFreeQueue',
     'get_cpu_affinity',
     'set_cpu_affinity',
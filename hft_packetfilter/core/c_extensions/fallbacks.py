@@ -18,6 +18,100 @@ from collections import deque
 from typing import Optional, Dict, Any, List
 import warnings
 
+import numpy as np
+
+def rdtsc_ns() -> int:
+    """Get monotonic time in nanoseconds (relative values only)."""
+    return time.perf_counter_ns()
+
+
+def spin_pause(iterations: int = 1) -> None:
+    """Spin-wait hint for busy-poll loops (yields the GIL in pure Python)."""
+    time.sleep(0)
+
+
+def fix_checksum(message) -> int:
+    """Compute the FIX checksum (tag 10): byte sum modulo 256."""
+    return sum(bytes(message)) & 0xFF
+
+
+def fix_field_offsets(message, delimiter: int = 0x01) -> np.ndarray:
+    """
+    Locate every field delimiter in a FIX message.
+    
+    Args:
+        message: FIX message bytes or buffer
+        delimiter: Field separator byte (SOH, or ord('|') for display form)
+        
+    Returns:
+        numpy.ndarray: int32 offsets of each delimiter, in order
+    """
+    data = np.frombuffer(message, dtype=np.uint8)
+    return np.flatnonzero(data == delimiter).astype(np.int32)
+
+
+def _scan_fix_symbol_price(message) -> tuple:
+    """Find the symbol (tag 55) and raw first price value (tag 270) of a FIX message."""
+    symbol = None
+    price_value = None
+    
+    for field in bytes(message).split(b'\x01'):
+        tag, sep, value = field.partition(b'=')
+        if not sep:
+            continue
+        if tag == b'55' and symbol is None:
+            symbol = value.decode('ascii')
+        elif tag == b'270' and price_value is None:
+            price_value = value
+        if symbol is not None and price_value is not None:
+            break
+            
+    return symbol, price_value
+
+
+def parse_fix_symbol_price(message) -> tuple:
+    """
+    Extract symbol (tag 55) and first price (tag 270) from a FIX message.
+    
+    Args:
+        message: FIX message bytes or buffer
+        
+    Returns:
+        tuple: (symbol or None, price or 0.0)
+    """
+    symbol, price_value = _scan_fix_symbol_price(message)
+    if price_value is None:
+        return symbol, 0.0
+    
+    try:
+        return symbol, float(price_value)
+    except ValueError:
+        return symbol, 0.0
+
+
+def parse_fix_symbol_price_cents(message) -> tuple:
+    """
+    Extract symbol (tag 55) and first price (tag 270) as fixed-point cents.
+    
+    Args:
+        message: FIX message bytes or buffer
+        
+    Returns:
+        tuple: (symbol or None, price in cents or 0)
+    """
+    symbol, price_value = _scan_fix_symbol_price(message)
+    if price_value is None:
+        return symbol, 0
+    
+    negative = price_value.startswith(b'-')
+    whole, _, fraction = price_value.lstrip(b'-').partition(b'.')
+    if not (whole or fraction) or not (whole + fraction).isdigit():
+        return symbol, 0
+    
+    cents = int(whole or b'0') * 100 + int((fraction + b'00')[:2])
+    return symbol, -cents if negative else cents
+
+
 class FastPacketParser:
     """Pure Python packet parser fallback."""
     
@@ -270,8 +364,9 @@ class HighPerformanceMemoryPool:
     
     def __init__(self, pool_size: int = 1024*1024, block_size: int = 1024, use_mmap: bool = False):
         self.pool_size = pool_size
-        self.block_size = block_size
-        self.num_blocks = pool_size // block_size
+        # Whole cache lines, matching the compiled pool's block sizing
+        self.block_size = (block_size + 63) & ~63
+        self.num_blocks = pool_size // self.block_size
         
         # Use simple list-based pool
         self.free_blocks = queue.Queue(maxsize=self.num_blocks)
@@ -279,7 +374,7 @@ class HighPerformanceMemoryPool:
         
         # Pre-allocate all blocks
         for _ in range(self.num_blocks):
-            block = bytearray(block_size)
+            block = bytearray(self.block_size)
             self.free_blocks.put(block)
             
         self.total_allocations = 0
@@ -311,6 +406,42 @@ class HighPerformanceMemoryPool:
                 self.free_blocks.put(memview.obj)
                 self.total_deallocations += 1
                 
+    def allocate_many(self, count: int) -> List[memoryview]:
+        """Allocate up to count blocks in one call (fewer if the pool runs out)."""
+        views = []
+        with self.lock:
+            for _ in range(count):
+                try:
+                    block = self.free_blocks.get_nowait()
+                except queue.Empty:
+                    break
+                self.allocated_blocks.add(id(block))
+                views.append(memoryview(block))
+            self.total_allocations += len(views)
+        return views
+        
+    def deallocate_many(self, memviews):
+        """Deallocate a batch of blocks in one call."""
+        with self.lock:
+            for memview in memviews:
+                if memview is not None:
+                    self.deallocate(memview)
+                    
+    def run_allocation_cycles(self, iterations: int) -> int:
+        """Allocate and immediately deallocate a block repeatedly; returns successful cycles."""
+        completed = 0
+        for i in range(iterations):
+            buf = self.allocate()
+            if buf is not None:
+                buf[0] = i & 0xFF
+                self.deallocate(buf)
+                completed += 1
+        return completed
+        
+    def lease(self):
+        """Lease a packet buffer for the duration of a with-block."""
+        return PoolLease(self)
+        
     def allocate_packet_buffer(self):
         """Allocate packet buffer."""
         return self.allocate()
@@ -359,11 +490,37 @@ class HighPerformanceMemoryPool:
         """Get block size."""
         return self.block_size
         
+    def get_alignment(self) -> int:
+        """Get guaranteed block start alignment (none for bytearray-backed blocks)."""
+        return 1
+        
     def get_free_blocks(self) -> int:
         """Get number of free blocks."""
         return self.free_blocks.qsize()
 
 
+class PoolLease:
+    """Scoped pool block: allocated on __enter__, always deallocated on __exit__."""
+    
+    __slots__ = ('pool', 'buffer')
+    
+    def __init__(self, pool: HighPerformanceMemoryPool):
+        self.pool = pool
+        self.buffer = None
+        
+    def __enter__(self) -> Optional[memoryview]:
+        if self.buffer is not None:
+            raise RuntimeError("Pool lease is already active")
+        self.buffer = self.pool.allocate_packet_buffer()
+        return self.buffer
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if self.buffer is not None:
+            self.pool.deallocate(self.buffer)
+            self.buffer = None
+        return False
+
+
 class LockFreeQueue:
     """Pure Python queue fallback (uses locks)."""
     
@@ -400,6 +557,32 @@ class LockFreeQueue:
                 self.total_failed_dequeues += 1
             return None
             
+    def enqueue_batch(self, items) -> int:
+        """Enqueue a batch of items, returning how many were enqueued."""
+        count = 0
+        with self.lock:
+            for item in items:
+                try:
+                    self.queue.put_nowait(item)
+                except queue.Full:
+                    self.total_failed_enqueues += len(items) - count
+                    break
+                count += 1
+            self.total_enqueued += count
+        return count
+        
+    def dequeue_batch(self, max_items: int = 1000) -> List[Any]:
+        """Dequeue up to max_items items."""
+        batch = []
+        with self.lock:
+            while len(batch) < max_items:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.total_dequeued += len(batch)
+        return batch
+        
     def enqueue_packet(self, packet_data) -> bool:
         """Enqueue packet data."""
         return self.enqueue(packet_data)
@@ -16,8 +16,8 @@ License: Apache License 2.0
 """
 
 import cython
-from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
-from libc.string cimport memcpy, memset
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t, int32_t, int64_t
+from libc.string cimport memcpy, memset, memchr
 from libc.stdlib cimport malloc, free
 import numpy as np
 cimport numpy as cnp
@@ -66,6 +66,328 @@ NYSE_PORTS[:] = [4001, 9001, 8001, 7001]
 NASDAQ_PORTS[:] = [4002, 9002, 8002, 7002]
 CBOE_PORTS[:] = [4003, 9003, 8003, 7003]
 
+# Vectorized byte sum (AVX2/SSE2 sum-of-absolute-differences against zero)
+cdef extern from *:
+    """
+    #include <stdint.h>
+    #include <stddef.h>
+    #if defined(__AVX2__)
+    #include <immintrin.h>
+    static inline uint64_t hft_byte_sum(const uint8_t* p, size_t n) {
+        const __m256i zero = _mm256_setzero_si256();
+        __m256i acc = _mm256_setzero_si256();
+        uint64_t lanes[4];
+        uint64_t total;
+        size_t i = 0;
+        for (; i + 32 <= n; i += 32)
+            acc = _mm256_add_epi64(acc, _mm256_sad_epu8(_mm256_loadu_si256((const __m256i*)(p + i)), zero));
+        _mm256_storeu_si256((__m256i*)lanes, acc);
+        total = lanes[0] + lanes[1] + lanes[2] + lanes[3];
+        for (; i < n; i++) total += p[i];
+        return total;
+    }
+    #elif defined(__SSE2__)
+    #include <emmintrin.h>
+    static inline uint64_t hft_byte_sum(const uint8_t* p, size_t n) {
+        const __m128i zero = _mm_setzero_si128();
+        __m128i acc = _mm_setzero_si128();
+        uint64_t lanes[2];
+        uint64_t total;
+        size_t i = 0;
+        for (; i + 16 <= n; i += 16)
+            acc = _mm_add_epi64(acc, _mm_sad_epu8(_mm_loadu_si128((const __m128i*)(p + i)), zero));
+        _mm_storeu_si128((__m128i*)lanes, acc);
+        total = lanes[0] + lanes[1];
+        for (; i < n; i++) total += p[i];
+        return total;
+    }
+    #else
+    static inline uint64_t hft_byte_sum(const uint8_t* p, size_t n) {
+        uint64_t total = 0;
+        size_t i;
+        for (i = 0; i < n; i++) total += p[i];
+        return total;
+    }
+    #endif
+    """
+    uint64_t hft_byte_sum(const uint8_t* p, size_t n) nogil
+
+# Vectorized delimiter scan (AVX2/SSE2 byte compare, movemask, count trailing zeros)
+cdef extern from *:
+    """
+    #include <stdint.h>
+    #include <stddef.h>
+    #if defined(__AVX2__)
+    #include <immintrin.h>
+    static inline size_t hft_scan_delimiters(const uint8_t* p, size_t n, uint8_t delim, int32_t* out) {
+        const __m256i needle = _mm256_set1_epi8((char)delim);
+        size_t count = 0;
+        size_t i = 0;
+        uint32_t mask;
+        for (; i + 32 <= n; i += 32) {
+            mask = (uint32_t)_mm256_movemask_epi8(
+                _mm256_cmpeq_epi8(_mm256_loadu_si256((const __m256i*)(p + i)), needle));
+            while (mask) {
+                out[count++] = (int32_t)(i + __builtin_ctz(mask));
+                mask &= mask - 1;
+            }
+        }
+        for (; i < n; i++) if (p[i] == delim) out[count++] = (int32_t)i;
+        return count;
+    }
+    #elif defined(__SSE2__)
+    #include <emmintrin.h>
+    static inline size_t hft_scan_delimiters(const uint8_t* p, size_t n, uint8_t delim, int32_t* out) {
+        const __m128i needle = _mm_set1_epi8((char)delim);
+        size_t count = 0;
+        size_t i = 0;
+        uint32_t mask;
+        for (; i + 16 <= n; i += 16) {
+            mask = (uint32_t)_mm_movemask_epi8(
+                _mm_cmpeq_epi8(_mm_loadu_si128((const __m128i*)(p + i)), needle));
+            while (mask) {
+                out[count++] = (int32_t)(i + __builtin_ctz(mask));
+                mask &= mask - 1;
+            }
+        }
+        for (; i < n; i++) if (p[i] == delim) out[count++] = (int32_t)i;
+        return count;
+    }
+    #else
+    static inline size_t hft_scan_delimiters(const uint8_t* p, size_t n, uint8_t delim, int32_t* out) {
+        size_t count = 0;
+        size_t i;
+        for (i = 0; i < n; i++) if (p[i] == delim) out[count++] = (int32_t)i;
+        return count;
+    }
+    #endif
+    """
+    size_t hft_scan_delimiters(const uint8_t* p, size_t n, uint8_t delim, int32_t* out) nogil
+
+# FIX protocol constants
+cdef uint8_t FIX_SOH = 0x01
+cdef int FIX_TAG_SYMBOL = 55
+cdef int FIX_TAG_MD_ENTRY_PX = 270
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint _parse_fix_decimal(const uint8_t* value, const uint8_t* end, double* out) nogil:
+    """Parse an ASCII decimal FIX value using digit arithmetic. Returns False if malformed."""
+    cdef:
+        double result = 0.0
+        double scale = 1.0
+        bint negative = False
+        bint fraction = False
+        bint digits = False
+        
+    if value < end and value[0] == 45:  # '-'
+        negative = True
+        value += 1
+        
+    while value < end:
+        if 48 <= value[0] <= 57:  # '0'-'9'
+            result = result * 10.0 + (value[0] - 48)
+            if fraction:
+                scale *= 10.0
+            digits = True
+        elif value[0] == 46 and not fraction:  # '.'
+            fraction = True
+        else:
+            return False
+        value += 1
+        
+    if not digits:
+        return False
+        
+    out[0] = -result / scale if negative else result / scale
+    return True
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint _parse_fix_cents(const uint8_t* value, const uint8_t* end, int64_t* out) nogil:
+    """Parse an ASCII decimal FIX value as fixed-point cents (x100), truncating extra decimals."""
+    cdef:
+        int64_t result = 0
+        int fraction_digits = -1
+        bint negative = False
+        bint digits = False
+        
+    if value < end and value[0] == 45:  # '-'
+        negative = True
+        value += 1
+        
+    while value < end:
+        if 48 <= value[0] <= 57:  # '0'-'9'
+            if fraction_digits < 2:
+                result = result * 10 + (value[0] - 48)
+                if fraction_digits >= 0:
+                    fraction_digits += 1
+            digits = True
+        elif value[0] == 46 and fraction_digits < 0:  # '.'
+            fraction_digits = 0
+        else:
+            return False
+        value += 1
+        
+    if not digits:
+        return False
+        
+    if fraction_digits < 0:
+        fraction_digits = 0
+    while fraction_digits < 2:
+        result *= 10
+        fraction_digits += 1
+        
+    out[0] = -result if negative else result
+    return True
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _scan_fix_symbol_price(const uint8_t* field, const uint8_t* end,
+                                   const uint8_t** price_value, const uint8_t** price_end):
+    """Find the symbol (tag 55) and the bounds of the first price value (tag 270)."""
+    cdef:
+        const uint8_t* value
+        const uint8_t* soh
+        int tag
+        object symbol = None
+        
+    price_value[0] = NULL
+    price_end[0] = NULL
+    
+    while field < end:
+        soh = <const uint8_t*>memchr(field, FIX_SOH, end - field)
+        if soh == NULL:
+            soh = end
+            
+        # Decode tag number up to '='
+        tag = 0
+        value = field
+        while value < soh and 48 <= value[0] <= 57:
+            tag = tag * 10 + (value[0] - 48)
+            value += 1
+            
+        if value < soh and value[0] == 61:  # '='
+            value += 1
+            if tag == FIX_TAG_SYMBOL and symbol is None:
+                symbol = (<const char*>value)[:soh - value].decode('ascii')
+            elif tag == FIX_TAG_MD_ENTRY_PX and price_value[0] == NULL:
+                price_value[0] = value
+                price_end[0] = soh
+                
+            if symbol is not None and price_value[0] != NULL:
+                break
+                
+        field = soh + 1
+        
+    return symbol
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fix_checksum(const uint8_t[::1] message not None):
+    """
+    Compute the FIX checksum (tag 10): byte sum modulo 256.
+    
+    Args:
+        message: Message bytes up to and including the SOH before "10="
+        
+    Returns:
+        int: Checksum value (0-255)
+    """
+    cdef:
+        Py_ssize_t message_len = message.shape[0]
+        uint64_t total = 0
+        
+    if message_len > 0:
+        with nogil:
+            total = hft_byte_sum(&message[0], message_len)
+            
+    return total & 0xFF
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fix_field_offsets(const uint8_t[::1] message not None, uint8_t delimiter=FIX_SOH):
+    """
+    Locate every field delimiter in a FIX message.
+    
+    Compares 32 bytes at a time (16 without AVX2) against the delimiter and
+    walks the resulting bitmask, so the payload is scanned in one pass.
+    
+    Args:
+        message: FIX message bytes or buffer
+        delimiter: Field separator byte (SOH, or ord('|') for display form)
+        
+    Returns:
+        numpy.ndarray: int32 offsets of each delimiter, in order
+    """
+    cdef:
+        Py_ssize_t message_len = message.shape[0]
+        size_t count = 0
+        cnp.ndarray[cnp.int32_t, ndim=1] offsets = np.empty(message_len, dtype=np.int32)
+        
+    if message_len > 0:
+        with nogil:
+            count = hft_scan_delimiters(&message[0], message_len, delimiter,
+                                        <int32_t*>offsets.data)
+            
+    return offsets[:count]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def parse_fix_symbol_price(const uint8_t[::1] message not None):
+    """
+    Extract symbol (tag 55) and first price (tag 270) from a FIX message.
+    
+    Walks SOH-delimited fields with memchr and decodes tag numbers with
+    digit arithmetic, without decoding the message to str.
+    
+    Returns:
+        tuple: (symbol or None, price or 0.0)
+    """
+    cdef:
+        Py_ssize_t message_len = message.shape[0]
+        const uint8_t* price_value
+        const uint8_t* price_end
+        double price = 0.0
+        object symbol
+        
+    if message_len == 0:
+        return None, 0.0
+        
+    symbol = _scan_fix_symbol_price(&message[0], &message[0] + message_len, &price_value, &price_end)
+    if price_value != NULL and not _parse_fix_decimal(price_value, price_end, &price):
+        price = 0.0
+        
+    return symbol, price
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def parse_fix_symbol_price_cents(const uint8_t[::1] message not None):
+    """
+    Extract symbol (tag 55) and first price (tag 270) as fixed-point cents.
+    
+    Same field walk as parse_fix_symbol_price, but the price digits are
+    accumulated into an integer (x100) with no floating point.
+    
+    Returns:
+        tuple: (symbol or None, price in cents or 0)
+    """
+    cdef:
+        Py_ssize_t message_len = message.shape[0]
+        const uint8_t* price_value
+        const uint8_t* price_end
+        int64_t price = 0
+        object symbol
+        
+    if message_len == 0:
+        return None, 0
+        
+    symbol = _scan_fix_symbol_price(&message[0], &message[0] + message_len, &price_value, &price_end)
+    if price_value != NULL and not _parse_fix_cents(price_value, price_end, &price):
+        price = 0
+        
+    return symbol, price
+
 cdef class FastPacketParser:
     """Ultra-fast packet parser optimized for HFT trading protocols."""
     
@@ -28,6 +28,88 @@ cdef double NANOSEC_PER_SEC = 1000000000.0
 cdef double MICROSEC_PER_SEC = 1000000.0
 cdef int MAX_LATENCY_SAMPLES = 100000
 
+# Timestamp counter access with a monotonic clock fallback
+cdef extern from *:
+    """
+    #include <time.h>
+    #if (defined(__x86_64__) || defined(__i386__)) && !defined(_MSC_VER)
+    #include <x86intrin.h>
+    #define HFT_HAVE_RDTSC 1
+    static inline uint64_t hft_read_tsc(void) { return __rdtsc(); }
+    static inline void hft_cpu_pause(void) { _mm_pause(); }
+    #else
+    #define HFT_HAVE_RDTSC 0
+    static inline uint64_t hft_read_tsc(void) { return 0; }
+    #if defined(__aarch64__) || defined(__arm__)
+    static inline void hft_cpu_pause(void) { __asm__ __volatile__("yield"); }
+    #else
+    static inline void hft_cpu_pause(void) { }
+    #endif
+    #endif
+    static inline uint64_t hft_monotonic_ns(void) {
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        return (uint64_t)ts.tv_sec * 1000000000ULL + (uint64_t)ts.tv_nsec;
+    }
+    """
+    bint HFT_HAVE_RDTSC
+    uint64_t hft_read_tsc() nogil
+    uint64_t hft_monotonic_ns() nogil
+    void hft_cpu_pause() nogil
+
+cdef uint64_t TSC_CALIBRATION_NS = 5000000  # 5ms calibration window
+cdef uint64_t _tsc_base = 0
+cdef uint64_t _tsc_base_ns = 0
+cdef double _ns_per_tsc = 0.0
+
+cdef void _calibrate_tsc() nogil:
+    """Calibrate TSC ticks against the monotonic clock (once at import)."""
+    global _tsc_base, _tsc_base_ns, _ns_per_tsc
+    cdef uint64_t end_tsc, end_ns
+    
+    if not HFT_HAVE_RDTSC:
+        return
+        
+    _tsc_base_ns = hft_monotonic_ns()
+    _tsc_base = hft_read_tsc()
+    
+    end_ns = hft_monotonic_ns()
+    while end_ns - _tsc_base_ns < TSC_CALIBRATION_NS:
+        end_ns = hft_monotonic_ns()
+    end_tsc = hft_read_tsc()
+    
+    if end_tsc > _tsc_base:
+        _ns_per_tsc = (end_ns - _tsc_base_ns) / <double>(end_tsc - _tsc_base)
+
+cdef inline uint64_t _tsc_now_ns() nogil:
+    """Current monotonic time in nanoseconds from the calibrated TSC."""
+    if _ns_per_tsc == 0.0:
+        return hft_monotonic_ns()
+    return _tsc_base_ns + <uint64_t>((hft_read_tsc() - _tsc_base) * _ns_per_tsc)
+
+_calibrate_tsc()
+
+def rdtsc_ns():
+    """
+    Get monotonic time in nanoseconds from the CPU timestamp counter.
+    
+    Falls back to CLOCK_MONOTONIC where the TSC is unavailable. Values are
+    only meaningful relative to each other (not wall-clock time).
+    """
+    return _tsc_now_ns()
+
+def spin_pause(unsigned int iterations=1):
+    """
+    Execute CPU spin-wait hints (PAUSE on x86, YIELD on ARM) for busy-poll loops.
+    
+    Args:
+        iterations: Number of pause instructions to issue
+    """
+    cdef unsigned int i
+    with nogil:
+        for i in range(iterations):
+            hft_cpu_pause()
+
 # Latency measurement structure
 cdef packed struct latency_sample:
     uint64_t timestamp_ns
@@ -204,6 +204,66 @@ cdef class LockFreeQueue:
                 
                 return True
                 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef uint32_t _claim_enqueue_batch(self, uint32_t max_items, uint64_t* first_seq) nogil:
+        """Claim up to max_items consecutive free slots with a single tail CAS."""
+        cdef:
+            uint64_t current_tail
+            uint32_t count
+            queue_node* node
+            
+        while True:
+            current_tail = self.tail_seq
+            count = 0
+            while count < max_items:
+                node = &self.nodes[(current_tail + count) & self.mask]
+                if node.sequence != current_tail + count:
+                    break
+                count += 1
+                
+            if count == 0:
+                node = &self.nodes[current_tail & self.mask]
+                if node.sequence < current_tail:
+                    # Queue is full
+                    return 0
+                # Another thread is working on this slot, retry
+                continue
+                
+            if compare_and_swap(<volatile int*>&self.tail_seq, current_tail, current_tail + count):
+                first_seq[0] = current_tail
+                return count
+                
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef uint32_t _claim_dequeue_batch(self, uint32_t max_items, uint64_t* first_seq) nogil:
+        """Claim up to max_items consecutive ready slots with a single head CAS."""
+        cdef:
+            uint64_t current_head
+            uint32_t count
+            queue_node* node
+            
+        while True:
+            current_head = self.head_seq
+            count = 0
+            while count < max_items:
+                node = &self.nodes[(current_head + count) & self.mask]
+                if node.sequence != current_head + count + 1:
+                    break
+                count += 1
+                
+            if count == 0:
+                node = &self.nodes[current_head & self.mask]
+                if node.sequence < current_head + 1:
+                    # Queue is empty
+                    return 0
+                # Data not ready yet, retry
+                continue
+                
+            if compare_and_swap(<volatile int*>&self.head_seq, current_head, current_head + count):
+                first_seq[0] = current_head
+                return count
+                
     def enqueue(self, data):
         """
         Enqueue data into the queue.
@@ -273,6 +333,97 @@ cdef class LockFreeQueue:
                 
         return None
             
+    def enqueue_batch(self, items):
+        """
+        Enqueue a batch of items with a single tail advance.
+        
+        Args:
+            items: Sequence of Python objects to enqueue
+            
+        Returns:
+            int: Number of items enqueued (a prefix of items)
+        """
+        if not self.initialized:
+            return 0
+            
+        cdef:
+            list serialized = [str(item).encode('utf-8') for item in items]
+            uint32_t requested = min(len(serialized), self.capacity)
+            uint32_t count
+            uint32_t i
+            uint64_t first_seq = 0
+            bytes item_bytes
+            queue_node* node
+            void* data_ptr
+            
+        if requested == 0:
+            return 0
+            
+        with nogil:
+            count = self._claim_enqueue_batch(requested, &first_seq)
+            
+        for i in range(count):
+            item_bytes = serialized[i]
+            data_ptr = PyMem_Malloc(len(item_bytes))
+            if data_ptr != NULL:
+                memcpy(data_ptr, <char*>item_bytes, len(item_bytes))
+            node = &self.nodes[(first_seq + i) & self.mask]
+            node.data = data_ptr
+            node.data_size = len(item_bytes) if data_ptr != NULL else 0
+            
+        # Make data visible before publishing the claimed slots
+        memory_barrier()
+        for i in range(count):
+            self.nodes[(first_seq + i) & self.mask].sequence = first_seq + i + 1
+            
+        self.total_enqueued += count
+        self.total_failed_enqueues += len(serialized) - count
+        return count
+        
+    def dequeue_batch(self, uint32_t max_items=1000):
+        """
+        Dequeue up to max_items items with a single head advance.
+        
+        Args:
+            max_items: Maximum number of items to dequeue
+            
+        Returns:
+            list: Dequeued items (empty if the queue is empty)
+        """
+        cdef:
+            list batch = []
+            uint32_t count
+            uint32_t i
+            uint64_t first_seq = 0
+            queue_node* node
+            bytes data_bytes
+            
+        if max_items > self.capacity:
+            max_items = self.capacity
+            
+        with nogil:
+            count = self._claim_dequeue_batch(max_items, &first_seq)
+            
+        for i in range(count):
+            node = &self.nodes[(first_seq + i) & self.mask]
+            if node.data != NULL:
+                data_bytes = (<char*>node.data)[:node.data_size]
+                PyMem_Free(node.data)
+                try:
+                    batch.append(data_bytes.decode('utf-8'))
+                except UnicodeDecodeError:
+                    pass
+            node.data = NULL
+            node.data_size = 0
+            
+        # Make reads visible before releasing the claimed slots
+        memory_barrier()
+        for i in range(count):
+            self.nodes[(first_seq + i) & self.mask].sequence = first_seq + i + 1 + self.mask
+            
+        self.total_dequeued += count
+        return batch
+        
     def enqueue_packet(self, packet_data):
         """Optimized enqueue for packet data."""
         return self.enqueue(packet_data)
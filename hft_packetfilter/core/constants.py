@@ -8,7 +8,8 @@ Author: Tanzil github://@tanzil7890
 License: Apache License 2.0
 """
 
-from typing import Dict, List, Any
+from enum import IntEnum
+from typing import Dict, List, Any, Union
 
 # Package Information
 PACKAGE_NAME = "hft-packetfilter"
@@ -27,6 +28,7 @@ DEFAULT_METRICS_INTERVAL_SEC = 60   # 1 minute metrics collection interval
 ULTRA_LOW_LATENCY_BUFFER_SIZE = 1048576    # 1MB for ultra-low latency
 HIGH_PERFORMANCE_BUFFER_SIZE = 524288      # 512KB for high performance
 STANDARD_BUFFER_SIZE = 65536               # 64KB for standard mode
+CALLBACK_BATCH_SIZE = 256                  # Events dispatched per callback drain
 
 # Network Constants
 DEFAULT_CAPTURE_INTERFACE = "any"
@@ -35,7 +37,7 @@ MAX_PACKET_SIZE = 9000  # Jumbo frame size
 MIN_PACKET_SIZE = 64    # Minimum Ethernet frame size
 
 # Supported Exchanges
-SUPPORTED_EXCHANGES = [
+SUPPORTED_EXCHANGES = frozenset({
     "NYSE",
     "NASDAQ", 
     "CBOE",
@@ -46,7 +48,7 @@ SUPPORTED_EXCHANGES = [
     "TSE",
     "HKEX",
     "ASX"
-]
+})
 
 # Exchange Default Ports
 EXCHANGE_DEFAULT_PORTS: Dict[str, List[int]] = {
@@ -63,7 +65,7 @@ EXCHANGE_DEFAULT_PORTS: Dict[str, List[int]] = {
 }
 
 # Supported Protocols
-SUPPORTED_PROTOCOLS = [
+SUPPORTED_PROTOCOLS = frozenset({
     "FIX/TCP",
     "TCP",
     "UDP",
@@ -71,7 +73,7 @@ SUPPORTED_PROTOCOLS = [
     "HTTP",
     "HTTPS",
     "BINARY"
-]
+})
 
 # FIX Protocol Versions
 SUPPORTED_FIX_VERSIONS = [
@@ -98,7 +100,7 @@ MARKET_DATA_FEED_TYPES = [
 ]
 
 # Compliance Regulations
-COMPLIANCE_REGULATIONS = [
+COMPLIANCE_REGULATIONS = frozenset({
     "MiFID_II",
     "Reg_NMS",
     "CFTC_Rules",
@@ -107,10 +109,10 @@ COMPLIANCE_REGULATIONS = [
     "SEC_Rules",
     "FINRA_Rules",
     "IIROC_Rules"
-]
+})
 
 # Risk Management Constants
-RISK_SEVERITY_LEVELS = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+RISK_SEVERITY_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
 DEFAULT_RISK_THRESHOLDS: Dict[str, float] = {
     "latency_threshold_us": 1000.0,
     "packet_loss_threshold": 0.01,  # 1%
@@ -121,7 +123,7 @@ DEFAULT_RISK_THRESHOLDS: Dict[str, float] = {
 }
 
 # Alert Types
-ALERT_TYPES = [
+ALERT_TYPES = frozenset({
     "latency_alert",
     "packet_loss_alert",
     "security_threat",
@@ -130,14 +132,36 @@ ALERT_TYPES = [
     "connection_failure",
     "arbitrage_opportunity",
     "market_data_quality"
-]
+})
 
 # Performance Modes
-PERFORMANCE_MODES = [
+PERFORMANCE_MODES = (
     "standard",
     "high_performance", 
     "ultra_low_latency"
-]
+)
+
+
+class PerfMode(IntEnum):
+    """Performance mode resolved once at API boundaries for integer dispatch"""
+    STANDARD = 0
+    HIGH_PERFORMANCE = 1
+    ULTRA_LOW_LATENCY = 2
+
+    @property
+    def label(self) -> str:
+        """Mode name as used in PERFORMANCE_MODES and configuration files"""
+        return PERFORMANCE_MODES[self]
+
+    @classmethod
+    def parse(cls, mode: Union[str, "PerfMode"]) -> "PerfMode":
+        """Coerce a mode name (case-insensitive) or PerfMode to a PerfMode"""
+        if isinstance(mode, cls):
+            return mode
+        try:
+            return cls[mode.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Unsupported performance mode: {mode}") from None
 
 # Logging Constants
 LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
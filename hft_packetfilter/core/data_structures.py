@@ -8,11 +8,16 @@ Author: Tanzil github://@tanzil7890
 License: Apache License 2.0
 """
 
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class RiskLevel(Enum):
     """Risk level enumeration"""
@@ -43,7 +48,7 @@ class ExchangeStatus(Enum):
     MAINTENANCE = "maintenance"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TradingMetrics:
     """
     Trading performance metrics for an exchange
@@ -96,15 +101,18 @@ class TradingMetrics:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LatencyMeasurement:
     """
     Individual latency measurement
     
+    Times are held as integer nanoseconds; timestamp and latency_us are
+    float views in seconds and microseconds.
+    
     Attributes:
-        timestamp: Measurement timestamp
+        timestamp_ns: Measurement timestamp in nanoseconds since the epoch
         exchange_name: Exchange name
-        latency_us: Latency in microseconds
+        latency_ns: Latency in nanoseconds
         packet_size: Size of packet in bytes
         sequence_number: Packet sequence number
         round_trip: Whether this is round-trip latency
@@ -113,9 +121,9 @@ class LatencyMeasurement:
         protocol: Network protocol used
     """
     
-    timestamp: float
+    timestamp_ns: int
     exchange_name: str
-    latency_us: float
+    latency_ns: int
     packet_size: int = 0
     sequence_number: Optional[int] = None
     round_trip: bool = False
@@ -123,6 +131,27 @@ class LatencyMeasurement:
     destination_ip: Optional[str] = None
     protocol: str = "TCP"
     
+    # Set while leased from the measurement freelist
+    _leased: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    @property
+    def timestamp(self) -> float:
+        """Measurement timestamp in seconds since the epoch"""
+        return self.timestamp_ns / 1e9
+    
+    @timestamp.setter
+    def timestamp(self, value: float) -> None:
+        self.timestamp_ns = round(value * 1e9)
+    
+    @property
+    def latency_us(self) -> float:
+        """Latency in microseconds"""
+        return self.latency_ns / 1000.0
+    
+    @latency_us.setter
+    def latency_us(self, value: float) -> None:
+        self.latency_ns = round(value * 1000.0)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -138,6 +167,49 @@ class LatencyMeasurement:
         }
 
 
+# Bounded freelist of released LatencyMeasurement objects
+_LATENCY_MEASUREMENT_POOL: deque = deque(maxlen=4096)
+
+
+def acquire_latency_measurement(timestamp_ns: int, exchange_name: str, latency_ns: int,
+                                packet_size: int = 0, sequence_number: Optional[int] = None,
+                                round_trip: bool = False, source_ip: Optional[str] = None,
+                                destination_ip: Optional[str] = None,
+                                protocol: str = "TCP") -> LatencyMeasurement:
+    """
+    Get a LatencyMeasurement from the freelist, constructing one if it is empty
+    
+    Leased measurements are returned to the freelist by
+    release_latency_measurement. HFTAnalyzer.process_latency_batch does this
+    when they age out of its history, but only for measurements that were
+    never handed to callbacks.
+    """
+    try:
+        measurement = _LATENCY_MEASUREMENT_POOL.pop()
+    except IndexError:
+        measurement = LatencyMeasurement(timestamp_ns, exchange_name, latency_ns)
+    else:
+        measurement.timestamp_ns = timestamp_ns
+        measurement.exchange_name = exchange_name
+        measurement.latency_ns = latency_ns
+    
+    measurement.packet_size = packet_size
+    measurement.sequence_number = sequence_number
+    measurement.round_trip = round_trip
+    measurement.source_ip = source_ip
+    measurement.destination_ip = destination_ip
+    measurement.protocol = protocol
+    measurement._leased = True
+    return measurement
+
+
+def release_latency_measurement(measurement: LatencyMeasurement) -> None:
+    """Return a leased LatencyMeasurement to the freelist (no-op for other instances)"""
+    if measurement._leased:
+        measurement._leased = False
+        _LATENCY_MEASUREMENT_POOL.append(measurement)
+
+
 @dataclass
 class RiskEvent:
     """
@@ -314,7 +386,7 @@ class ArbitrageOpportunity:
         return time.time() > self.expires_at
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ExchangeConnection:
     """
     Exchange connection information
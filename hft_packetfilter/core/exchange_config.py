@@ -9,23 +9,26 @@ License: Apache License 2.0
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import ipaddress
 import socket
 
+from .data_structures import _DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ExchangeConfig:
     """
     Configuration for trading exchange connections
     
     This class defines the connection parameters and settings for
-    connecting to and monitoring trading exchanges.
+    connecting to and monitoring trading exchanges. Instances are
+    immutable and hashable (on their scalar fields and ports).
     
     Attributes:
         name: Exchange name (e.g., "NYSE", "NASDAQ")
         host: Exchange hostname or IP address
-        ports: List of ports to monitor
+        ports: Ports to monitor (stored as a tuple)
         protocol: Protocol type ("FIX/TCP", "UDP", "WebSocket", etc.)
         latency_target_us: Target latency in microseconds
         is_primary: Whether this is a primary connection
@@ -39,19 +42,21 @@ class ExchangeConfig:
     
     name: str
     host: str
-    ports: List[int]
+    ports: Tuple[int, ...]
     protocol: str
     latency_target_us: float
     is_primary: bool = True
     region: str = "US"
-    session_times: Optional[Dict[str, str]] = None
-    credentials: Optional[Dict[str, str]] = None
-    ssl_config: Optional[Dict[str, Any]] = None
-    rate_limits: Optional[Dict[str, int]] = None
-    custom_settings: Dict[str, Any] = field(default_factory=dict)
+    session_times: Optional[Dict[str, str]] = field(default=None, hash=False)
+    credentials: Optional[Dict[str, str]] = field(default=None, hash=False)
+    ssl_config: Optional[Dict[str, Any]] = field(default=None, hash=False)
+    rate_limits: Optional[Dict[str, int]] = field(default=None, hash=False)
+    custom_settings: Dict[str, Any] = field(default_factory=dict, hash=False)
     
     def __post_init__(self):
-        """Post-initialization validation"""
+        """Post-initialization normalization and validation"""
+        if isinstance(self.ports, list):
+            object.__setattr__(self, 'ports', tuple(self.ports))
         self.validate()
     
     def validate(self) -> None:
@@ -79,8 +84,8 @@ class ExchangeConfig:
                 raise ValueError(f"Invalid hostname: {self.host}")
         
         # Validate ports
-        if not self.ports or not isinstance(self.ports, list):
-            raise ValueError("Ports must be a non-empty list")
+        if not self.ports or not isinstance(self.ports, tuple):
+            raise ValueError("Ports must be a non-empty list or tuple")
         
         for port in self.ports:
             if not isinstance(port, int) or not (1 <= port <= 65535):
@@ -129,7 +134,7 @@ class ExchangeConfig:
         return {
             'name': self.name,
             'host': self.host,
-            'ports': self.ports,
+            'ports': list(self.ports),
             'protocol': self.protocol,
             'latency_target_us': self.latency_target_us,
             'is_primary': self.is_primary,
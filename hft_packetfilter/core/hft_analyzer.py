@@ -9,20 +9,30 @@ Author: Tanzil github://@tanzil7890
 License: Apache License 2.0
 """
 
+import os
 import time
 import threading
 import logging
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Iterable, Sequence, Tuple, Union
 from dataclasses import dataclass
 from collections import defaultdict, deque
 import json
 import yaml
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Core imports
 from .exchange_config import ExchangeConfig
 from .production_config import ProductionConfig
 from .data_structures import (
     LatencyMeasurement, 
+    acquire_latency_measurement,
+    release_latency_measurement,
     RiskEvent, 
     MarketDataQuality, 
     TradingMetrics,
@@ -34,6 +44,7 @@ from .data_structures import (
     ExchangeStatus
 )
 from .exceptions import HFTPacketFilterError, ExchangeConnectionError
+from .constants import CALLBACK_BATCH_SIZE, PerfMode
 from ..utils.logger import HFTLogger
 from ..utils.metrics_collector import MetricsCollector
 from ..utils.alert_system import AlertSystem
@@ -64,7 +75,7 @@ class HFTAnalyzer:
     
     def __init__(self, 
                  config: Optional[ProductionConfig] = None,
-                 performance_mode: str = "standard",
+                 performance_mode: Union[str, PerfMode] = "standard",
                  logging_level: str = "INFO",
                  metrics_export: Optional[str] = None):
         """
@@ -72,29 +83,36 @@ class HFTAnalyzer:
         
         Args:
             config: Production configuration object
-            performance_mode: Performance mode ('standard', 'high_performance', 'ultra_low_latency')
+            performance_mode: Performance mode name ('standard', 'high_performance',
+                'ultra_low_latency') or PerfMode member
             logging_level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR')
             metrics_export: Metrics export format ('prometheus', 'influxdb', 'json')
         """
         self.config = config or ProductionConfig()
-        self.performance_mode = performance_mode
+        # Branch on the enum; performance_mode keeps the name for reports
+        self._perf_mode = PerfMode.parse(performance_mode)
+        self.performance_mode = self._perf_mode.label
         self.metrics_export = metrics_export
         
         # Initialize logging
         self.logger = HFTLogger(
             name="HFTAnalyzer",
             level=logging_level,
-            performance_mode=performance_mode
+            performance_mode=self._perf_mode
         )
         
-        # Exchange management
-        self.exchanges: Dict[str, ExchangeConfig] = {}
+        # Exchange management: the dict is the writable index, the tuple an
+        # immutable snapshot rebuilt on add/remove for hot iteration
+        self._exchanges_dict: Dict[str, ExchangeConfig] = {}
+        self._exchanges_tuple: Tuple[ExchangeConfig, ...] = ()
         self.exchange_connections: Dict[str, ExchangeConnection] = {}
         
         # Monitoring state
         self.is_monitoring = False
         self.monitoring_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._done = threading.Event()
+        self._done.set()  # Not monitoring yet
         
         # Metrics and analytics
         self.metrics_collector = MetricsCollector(export_format=metrics_export or "json")
@@ -116,18 +134,33 @@ class HFTAnalyzer:
         self.latency_callbacks: List[Callable] = []
         self.risk_callbacks: List[Callable] = []
         
+        # Process GC thresholds, freeze and niceness replaced by
+        # ultra_low_latency mode, restored when switching out of it
+        self._saved_gc_state: Optional[Tuple[Tuple[int, ...], bool]] = None
+        self._saved_niceness: Optional[int] = None
+        
+        # Callback events are queued here and drained in batches by a
+        # dispatcher thread, keeping user code off the processing path
+        self._callback_events: deque = deque()
+        self._callback_wakeup = threading.Event()
+        self._callback_stop = threading.Event()
+        # Guards starting the dispatcher; the thread clears _callback_thread
+        # itself once it has stopped
+        self._callback_lock = threading.Lock()
+        self._callback_thread: Optional[threading.Thread] = None
+        
         # Initialize core components
         self._init_core_components()
         
-        self.logger.info(f"HFTAnalyzer initialized in {performance_mode} mode")
+        self.logger.info(f"HFTAnalyzer initialized in {self.performance_mode} mode")
     
     def _init_core_components(self):
         """Initialize core analysis components"""
         try:
             # Configure performance mode
-            if self.performance_mode == "ultra_low_latency":
+            if self._perf_mode is PerfMode.ULTRA_LOW_LATENCY:
                 self._configure_ultra_low_latency()
-            elif self.performance_mode == "high_performance":
+            elif self._perf_mode is PerfMode.HIGH_PERFORMANCE:
                 self._configure_high_performance()
             
             # Enable system monitoring
@@ -136,16 +169,62 @@ class HFTAnalyzer:
         except Exception as e:
             raise HFTPacketFilterError(f"Failed to initialize core components: {e}")
     
+    def set_performance_mode(self, performance_mode: Union[str, PerfMode]) -> None:
+        """
+        Switch performance mode on an existing analyzer
+        
+        Args:
+            performance_mode: Performance mode name ('standard', 'high_performance',
+                'ultra_low_latency') or PerfMode member
+        """
+        mode = PerfMode.parse(performance_mode)
+        
+        if mode is self._perf_mode:
+            return
+        
+        previous_measurements = self.latency_measurements
+        if self._perf_mode is PerfMode.ULTRA_LOW_LATENCY:
+            self._leave_ultra_low_latency()
+        self._perf_mode = mode
+        self.performance_mode = mode.label
+        
+        # Logger handlers are set up per mode; keep the configured level
+        self.logger = HFTLogger(
+            name="HFTAnalyzer",
+            level=self.logger.level,
+            performance_mode=mode
+        )
+        
+        if mode is PerfMode.ULTRA_LOW_LATENCY:
+            self._configure_ultra_low_latency()
+        elif mode is PerfMode.HIGH_PERFORMANCE:
+            self._configure_high_performance()
+        else:
+            self.latency_measurements = deque(maxlen=10000)
+        
+        # Carry recorded measurements over into the resized buffer
+        self.latency_measurements.extend(previous_measurements)
+        
+        self.logger.info(f"Switched to {self.performance_mode} mode")
+    
     def _configure_ultra_low_latency(self):
         """Configure for ultra-low latency mode"""
-        # Disable garbage collection for consistent latency
+        # Freeze startup objects and raise GC thresholds, as the package does
+        # at import in this mode, rather than disabling collection outright
         import gc
-        gc.disable()
+        from .. import _tune_gc
+        get_freeze_count = getattr(gc, "get_freeze_count", None)  # CPython-only
+        self._saved_gc_state = (
+            gc.get_threshold(),
+            get_freeze_count is not None and get_freeze_count() == 0
+        )
+        _tune_gc()
         
         # Set process priority
         try:
-            import os
+            niceness = os.nice(0)
             os.nice(-20)  # Highest priority (requires root)
+            self._saved_niceness = niceness
         except (OSError, PermissionError):
             self.logger.warning("Could not set high process priority")
         
@@ -154,6 +233,41 @@ class HFTAnalyzer:
         
         self.logger.info("Configured for ultra-low latency mode")
     
+    def _leave_ultra_low_latency(self):
+        """Restore the GC settings and process priority replaced by ultra-low latency mode"""
+        import gc
+        if self._saved_gc_state is not None:
+            threshold, unfreeze = self._saved_gc_state
+            gc.set_threshold(*threshold)
+            if unfreeze:
+                gc.unfreeze()
+            self._saved_gc_state = None
+        
+        if self._saved_niceness is not None:
+            try:
+                # Lowering priority back needs no privileges
+                os.nice(self._saved_niceness - os.nice(0))
+            except OSError:
+                self.logger.warning("Could not restore process priority")
+            self._saved_niceness = None
+    
+    @property
+    def exchanges(self) -> Tuple[ExchangeConfig, ...]:
+        """Snapshot of configured exchanges, in insertion order"""
+        return self._exchanges_tuple
+    
+    def get_exchange(self, exchange_name: str) -> Optional[ExchangeConfig]:
+        """
+        Look up an exchange configuration by name
+        
+        Args:
+            exchange_name: Name of the exchange
+            
+        Returns:
+            Exchange configuration, or None if not configured
+        """
+        return self._exchanges_dict.get(exchange_name)
+    
     def _configure_high_performance(self):
         """Configure for high performance mode"""
         # Optimize buffer sizes
@@ -168,18 +282,38 @@ class HFTAnalyzer:
         Args:
             exchange_config: Exchange configuration object
         """
+        self.add_exchanges((exchange_config,))
+    
+    def add_exchanges(self, exchange_configs: Iterable[ExchangeConfig]) -> None:
+        """
+        Add several exchanges for monitoring
+        
+        The exchange tuple is rebuilt once for the whole batch rather than
+        once per exchange.
+        
+        Args:
+            exchange_configs: Exchange configuration objects
+        """
+        try:
+            for exchange_config in exchange_configs:
+                self._register_exchange(exchange_config)
+        finally:
+            self._exchanges_tuple = tuple(self._exchanges_dict.values())
+    
+    def _register_exchange(self, exchange_config: ExchangeConfig) -> None:
+        """Validate and store one exchange without rebuilding lookup tables"""
         try:
             # Validate configuration
             exchange_config.validate()
             
             # Store configuration
-            self.exchanges[exchange_config.name] = exchange_config
+            self._exchanges_dict[exchange_config.name] = exchange_config
             
             # Create exchange connection
             connection = ExchangeConnection(
                 name=exchange_config.name,
                 ip_address=exchange_config.host,
-                ports=exchange_config.ports,
+                ports=list(exchange_config.ports),
                 protocol=exchange_config.protocol,
                 latency_target_us=exchange_config.latency_target_us,
                 is_primary=exchange_config.is_primary
@@ -209,8 +343,9 @@ class HFTAnalyzer:
         Args:
             exchange_name: Name of exchange to remove
         """
-        if exchange_name in self.exchanges:
-            del self.exchanges[exchange_name]
+        if exchange_name in self._exchanges_dict:
+            del self._exchanges_dict[exchange_name]
+            self._exchanges_tuple = tuple(self._exchanges_dict.values())
             del self.exchange_connections[exchange_name]
             if exchange_name in self.market_data_quality:
                 del self.market_data_quality[exchange_name]
@@ -235,6 +370,7 @@ class HFTAnalyzer:
         
         self.is_monitoring = True
         self._stop_event.clear()
+        self._done.clear()
         
         # Start monitoring thread
         self.monitoring_thread = threading.Thread(
@@ -247,17 +383,29 @@ class HFTAnalyzer:
         self.logger.info("Started HFT monitoring")
     
     def stop_monitoring(self) -> None:
-        """Stop HFT monitoring"""
-        if not self.is_monitoring:
-            return
-        
-        self.is_monitoring = False
-        self._stop_event.set()
+        """Stop HFT monitoring and deliver any queued callback events"""
+        if self.is_monitoring:
+            self.is_monitoring = False
+            self._stop_event.set()
+            
+            if self.monitoring_thread:
+                self.monitoring_thread.join(timeout=5)
+            
+            self.logger.info("Stopped HFT monitoring")
         
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=5)
+        self._stop_callback_dispatcher()
+    
+    def wait_until_done(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the monitoring loop has finished and flushed its metrics
         
-        self.logger.info("Stopped HFT monitoring")
+        Args:
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+            
+        Returns:
+            True if monitoring is complete, False if the timeout expired
+        """
+        return self._done.wait(timeout)
     
     def _monitoring_loop(self, duration_seconds: Optional[int]) -> None:
         """Main monitoring loop"""
@@ -284,21 +432,30 @@ class HFTAnalyzer:
                 self.logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(0.1)
         
+        # Flush final metrics before signalling completion to waiters
+        try:
+            self._update_metrics()
+            self.last_metrics_update = time.time()
+        except Exception as e:
+            self.logger.error(f"Error updating final metrics: {e}")
+        
         self.is_monitoring = False
+        self._done.set()
     
     def _simulate_packet_processing(self):
         """Simulate packet processing for demo purposes"""
         import random
         
         # Simulate processing packets from exchanges
-        for exchange_name, exchange_config in self.exchanges.items():
+        for exchange_config in self.exchanges:
+            exchange_name = exchange_config.name
             # Simulate latency measurement
             simulated_latency = random.uniform(100, 2000)  # 100-2000 microseconds
             
             latency_measurement = LatencyMeasurement(
-                timestamp=time.time(),
+                timestamp_ns=time.time_ns(),
                 exchange_name=exchange_name,
-                latency_us=simulated_latency
+                latency_ns=round(simulated_latency * 1000)
             )
             
             self.latency_measurements.append(latency_measurement)
@@ -351,20 +508,21 @@ class HFTAnalyzer:
             Dictionary containing current metrics
         """
         current_time = time.time()
+        cutoff_ns = time.time_ns() - 60 * 1_000_000_000  # Last minute
         
-        # Calculate recent latency statistics
-        recent_latencies = [
-            m.latency_us for m in self.latency_measurements 
-            if current_time - m.timestamp <= 60  # Last minute
-        ]
+        # Calculate recent latency statistics on integer nanoseconds
+        recent_latencies = np.fromiter(
+            (m.latency_ns for m in self.latency_measurements if m.timestamp_ns >= cutoff_ns),
+            dtype=np.int64
+        )
         
         latency_stats = {}
-        if recent_latencies:
+        if recent_latencies.size:
             latency_stats = {
-                "min": min(recent_latencies),
-                "max": max(recent_latencies),
-                "avg": sum(recent_latencies) / len(recent_latencies),
-                "count": len(recent_latencies)
+                "min": int(recent_latencies.min()) / 1000.0,
+                "max": int(recent_latencies.max()) / 1000.0,
+                "avg": int(recent_latencies.sum()) / recent_latencies.size / 1000.0,
+                "count": int(recent_latencies.size)
             }
         
         return {
@@ -375,7 +533,7 @@ class HFTAnalyzer:
             "exchanges": {
                 name: {
                     "status": conn.status.value,
-                    "latency_target_us": self.exchanges[name].latency_target_us,
+                    "latency_target_us": self._exchanges_dict[name].latency_target_us,
                     "last_heartbeat": conn.last_heartbeat
                 }
                 for name, conn in self.exchange_connections.items()
@@ -401,12 +559,20 @@ class HFTAnalyzer:
         """
         Process a latency measurement from network capture or simulation
         
+        The caller may keep referencing the measurement, so it is never
+        returned to the LatencyMeasurement freelist.
+        
         Args:
             measurement: LatencyMeasurement object containing timing data
         """
         try:
-            # Add to latency measurements collection
-            self.latency_measurements.append(measurement)
+            # Add to latency measurements collection, recycling the evicted
+            # oldest entry if it never left the analyzer
+            measurement._leased = False
+            measurements = self.latency_measurements
+            if len(measurements) == measurements.maxlen:
+                release_latency_measurement(measurements[0])
+            measurements.append(measurement)
             
             # Update trading metrics
             self.trading_metrics.latency_us = measurement.latency_us
@@ -418,41 +584,22 @@ class HFTAnalyzer:
                 quality.timestamp = measurement.timestamp
                 
                 # Update quality score based on latency performance
-                if measurement.exchange_name in self.exchanges:
-                    target_latency = self.exchanges[measurement.exchange_name].latency_target_us
+                if measurement.exchange_name in self._exchanges_dict:
+                    target_latency = self._exchanges_dict[measurement.exchange_name].latency_target_us
                     if measurement.latency_us <= target_latency:
                         quality.quality_score = min(99.9, quality.quality_score + 0.1)
                     else:
                         quality.quality_score = max(0.0, quality.quality_score - 0.5)
             
             # Check for latency violations and generate risk events
-            if measurement.exchange_name in self.exchanges:
-                target_latency = self.exchanges[measurement.exchange_name].latency_target_us
+            if measurement.exchange_name in self._exchanges_dict:
+                target_latency = self._exchanges_dict[measurement.exchange_name].latency_target_us
                 if measurement.latency_us > target_latency * 2:  # 2x target is high risk
-                    risk_event = RiskEvent(
-                        timestamp=measurement.timestamp,
-                        event_type=EventType.LATENCY_VIOLATION.value,
-                        severity=RiskLevel.HIGH.value,
-                        source_ip="analyzer",
-                        destination_ip="",
-                        description=f"High latency detected: {measurement.latency_us:.1f}μs (target: {target_latency}μs)",
-                        exchange_name=measurement.exchange_name
-                    )
-                    self.risk_events.append(risk_event)
-                    
-                    # Trigger risk callbacks
-                    for callback in self.risk_callbacks:
-                        try:
-                            callback(risk_event)
-                        except Exception as e:
-                            self.logger.error(f"Risk callback error: {e}")
+                    self._record_latency_violation(measurement, target_latency)
             
-            # Trigger latency callbacks
-            for callback in self.latency_callbacks:
-                try:
-                    callback(measurement)
-                except Exception as e:
-                    self.logger.error(f"Latency callback error: {e}")
+            # Queue latency callbacks
+            if self.latency_callbacks:
+                self._queue_callback_event(self.latency_callbacks, measurement)
             
             # Update packet count
             self.packet_count += 1
@@ -460,15 +607,110 @@ class HFTAnalyzer:
         except Exception as e:
             self.logger.error(f"Error processing latency measurement: {e}")
     
+    def process_latency_batch(self, exchange_names: Sequence[str], latencies_ns: Sequence[int],
+                              timestamps_ns: Optional[Sequence[int]] = None) -> None:
+        """
+        Process a batch of latency samples in one call
+        
+        Equivalent to calling process_latency_measurement once per sample, but
+        per-exchange lookups are done once per batch. NumPy arrays are accepted
+        for any argument.
+        
+        Args:
+            exchange_names: Exchange name of each sample
+            latencies_ns: Latency of each sample in integer nanoseconds
+            timestamps_ns: Timestamp of each sample in nanoseconds since the
+                epoch (defaults to now for all)
+        """
+        if hasattr(latencies_ns, "tolist"):
+            latencies_ns = latencies_ns.tolist()
+        if hasattr(exchange_names, "tolist"):
+            exchange_names = exchange_names.tolist()
+        if timestamps_ns is None:
+            timestamps_ns = [time.time_ns()] * len(latencies_ns)
+        elif hasattr(timestamps_ns, "tolist"):
+            timestamps_ns = timestamps_ns.tolist()
+        
+        if not latencies_ns:
+            return
+        
+        try:
+            measurements = self.latency_measurements
+            maxlen = measurements.maxlen
+            append = measurements.append
+            latency_callbacks = self.latency_callbacks
+            
+            # Resolve each exchange's quality record and target (in microseconds
+            # and nanoseconds) once per batch
+            targets: Dict[str, Tuple[Optional[MarketDataQuality], Optional[float], float]] = {}
+            for name in set(exchange_names):
+                config = self._exchanges_dict.get(name)
+                target_latency = config.latency_target_us if config is not None else None
+                targets[name] = (
+                    self.market_data_quality.get(name),
+                    target_latency,
+                    target_latency * 1000 if target_latency is not None else 0.0
+                )
+            
+            for name, latency_ns, timestamp_ns in zip(exchange_names, latencies_ns, timestamps_ns):
+                measurement = acquire_latency_measurement(timestamp_ns, name, latency_ns)
+                if len(measurements) == maxlen:
+                    release_latency_measurement(measurements[0])
+                append(measurement)
+                
+                quality, target_latency, target_ns = targets[name]
+                if quality is not None:
+                    quality.latency_us = latency_ns / 1000.0
+                    quality.timestamp = timestamp_ns / 1e9
+                
+                if target_latency is not None:
+                    if quality is not None:
+                        if latency_ns <= target_ns:
+                            quality.quality_score = min(99.9, quality.quality_score + 0.1)
+                        else:
+                            quality.quality_score = max(0.0, quality.quality_score - 0.5)
+                    
+                    if latency_ns > target_ns * 2:  # 2x target is high risk
+                        self._record_latency_violation(measurement, target_latency)
+                
+                if latency_callbacks:
+                    # Callbacks may hold on to it; keep it out of the freelist
+                    measurement._leased = False
+                    self._queue_callback_event(latency_callbacks, measurement)
+            
+            self.trading_metrics.latency_us = latencies_ns[-1] / 1000.0
+            self.packet_count += len(latencies_ns)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing latency batch: {e}")
+    
+    def _record_latency_violation(self, measurement: LatencyMeasurement, target_latency: float) -> None:
+        """Record a high-risk latency violation and notify risk callbacks"""
+        risk_event = RiskEvent(
+            timestamp=measurement.timestamp,
+            event_type=EventType.LATENCY_VIOLATION.value,
+            severity=RiskLevel.HIGH.value,
+            source_ip="analyzer",
+            destination_ip="",
+            description=f"High latency detected: {measurement.latency_us:.1f}μs (target: {target_latency}μs)",
+            exchange_name=measurement.exchange_name
+        )
+        self.risk_events.append(risk_event)
+        
+        # Queue risk callbacks
+        if self.risk_callbacks:
+            self._queue_callback_event(self.risk_callbacks, risk_event)
+    
     def get_latency_report(self) -> Dict[str, Any]:
         """Get detailed latency analysis report"""
         current_time = time.time()
+        cutoff_ns = time.time_ns() - 3600 * 1_000_000_000  # Last hour
         
-        # Group latencies by exchange
+        # Group integer nanosecond latencies by exchange
         exchange_latencies = defaultdict(list)
         for measurement in self.latency_measurements:
-            if current_time - measurement.timestamp <= 3600:  # Last hour
-                exchange_latencies[measurement.exchange_name].append(measurement.latency_us)
+            if measurement.timestamp_ns >= cutoff_ns:
+                exchange_latencies[measurement.exchange_name].append(measurement.latency_ns)
         
         report = {
             "timestamp": current_time,
@@ -478,19 +720,20 @@ class HFTAnalyzer:
         
         for exchange_name, latencies in exchange_latencies.items():
             if latencies:
-                sorted_latencies = sorted(latencies)
-                count = len(sorted_latencies)
+                sorted_latencies = np.sort(np.array(latencies, dtype=np.int64))
+                count = sorted_latencies.size
+                target_us = self._exchanges_dict[exchange_name].latency_target_us
                 
                 report["exchanges"][exchange_name] = {
                     "count": count,
-                    "min_us": min(latencies),
-                    "max_us": max(latencies),
-                    "avg_us": sum(latencies) / count,
-                    "median_us": sorted_latencies[count // 2],
-                    "p95_us": sorted_latencies[int(count * 0.95)],
-                    "p99_us": sorted_latencies[int(count * 0.99)],
-                    "target_us": self.exchanges[exchange_name].latency_target_us,
-                    "violations": sum(1 for l in latencies if l > self.exchanges[exchange_name].latency_target_us)
+                    "min_us": int(sorted_latencies[0]) / 1000.0,
+                    "max_us": int(sorted_latencies[-1]) / 1000.0,
+                    "avg_us": int(sorted_latencies.sum()) / count / 1000.0,
+                    "median_us": int(sorted_latencies[count // 2]) / 1000.0,
+                    "p95_us": int(sorted_latencies[int(count * 0.95)]) / 1000.0,
+                    "p99_us": int(sorted_latencies[int(count * 0.99)]) / 1000.0,
+                    "target_us": target_us,
+                    "violations": int(np.count_nonzero(sorted_latencies > target_us * 1000))
                 }
         
         return report
@@ -533,54 +776,155 @@ class HFTAnalyzer:
         
         Args:
             filename: Output filename
-            format: Export format ('json', 'csv', 'yaml')
+            format: Export format ('json', 'msgpack', 'csv', 'yaml')
         """
         data = {
             "export_timestamp": time.time(),
             "analyzer_config": {
                 "performance_mode": self.performance_mode,
-                "exchanges": [config.to_dict() for config in self.exchanges.values()]
+                "exchanges": [config.to_dict() for config in self.exchanges]
             },
             "live_metrics": self.get_live_metrics(),
             "latency_report": self.get_latency_report(),
             "risk_report": self.get_risk_report()
         }
         
+        # Serialize fully in memory, then hand the payload to the kernel in a
+        # single write rather than many small buffered flushes
         if format.lower() == "json":
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+            else:
+                payload = json.dumps(data, indent=2).encode()
+        elif format.lower() == "msgpack":
+            try:
+                import msgpack
+            except ImportError:
+                raise ValueError("MessagePack export requires msgpack")
+            payload = msgpack.packb(data, use_bin_type=True)
         elif format.lower() == "yaml":
-            with open(filename, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False)
+            payload = yaml.dump(data, default_flow_style=False).encode()
         elif format.lower() == "csv":
             # Export latency data as CSV
             import csv
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['timestamp', 'exchange', 'latency_us', 'packet_type'])
-                for measurement in self.latency_measurements:
-                    writer.writerow([
-                        measurement.timestamp,
-                        measurement.exchange_name,
-                        measurement.latency_us,
-                        measurement.packet_type
-                    ])
+            import io
+            buffer = io.StringIO(newline='')
+            writer = csv.writer(buffer)
+            writer.writerow(['timestamp', 'exchange', 'latency_us', 'protocol'])
+            writer.writerows(
+                (m.timestamp, m.exchange_name, m.latency_us, m.protocol)
+                for m in self.latency_measurements
+            )
+            payload = buffer.getvalue().encode()
         else:
             raise ValueError(f"Unsupported export format: {format}")
         
+        self._write_export(filename, payload)
         self.logger.info(f"Exported analysis to {filename} ({format})")
     
+    @staticmethod
+    def _write_export(filename: str, payload: bytes) -> None:
+        """Write an export payload with as few write() calls as possible"""
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
     def add_packet_callback(self, callback: Callable) -> None:
         """Add callback for packet events"""
         self.packet_callbacks.append(callback)
+        self._ensure_callback_dispatcher()
     
     def add_latency_callback(self, callback: Callable) -> None:
         """Add callback for latency events"""
         self.latency_callbacks.append(callback)
+        self._ensure_callback_dispatcher()
     
     def add_risk_callback(self, callback: Callable) -> None:
         """Add callback for risk events"""
         self.risk_callbacks.append(callback)
+        self._ensure_callback_dispatcher()
+    
+    def _ensure_callback_dispatcher(self) -> None:
+        """Start the callback dispatcher thread if it is not running"""
+        with self._callback_lock:
+            if self._callback_thread is None:
+                self._callback_stop.clear()
+                self._callback_thread = threading.Thread(
+                    target=self._callback_dispatch_loop,
+                    name="HFTAnalyzer-callbacks",
+                    daemon=True
+                )
+                self._callback_thread.start()
+    
+    def _stop_callback_dispatcher(self) -> None:
+        """Deliver the queued callback events, then stop the dispatcher thread"""
+        thread = self._callback_thread
+        if thread is None:
+            return
+        
+        self._callback_stop.set()
+        self._callback_wakeup.set()
+        thread.join(timeout=5)
+        if thread.is_alive():
+            # Still inside a slow callback; it clears its own reference on
+            # exit, so no second dispatcher is started on the same queue
+            self.logger.warning("Callback dispatcher still busy after 5s; "
+                                "it will stop once the running callback returns")
+    
+    def _queue_callback_event(self, callbacks: List[Callable], event: Any) -> None:
+        """Queue an event for asynchronous delivery to a callback list"""
+        self._callback_events.append((callbacks, event))
+        if self._callback_thread is None:
+            # Restart a dispatcher stopped by stop_monitoring()
+            self._ensure_callback_dispatcher()
+        if not self._callback_wakeup.is_set():
+            self._callback_wakeup.set()
+    
+    def _callback_dispatch_loop(self) -> None:
+        """Deliver queued callback events in batches of CALLBACK_BATCH_SIZE"""
+        # User callbacks run at normal priority even if the creating thread
+        # was made real-time by ultra_low_latency package setup
+        from .. import _use_normal_scheduling
+        _use_normal_scheduling()
+        
+        events = self._callback_events
+        wakeup = self._callback_wakeup
+        stop = self._callback_stop
+        
+        while True:
+            wakeup.wait()
+            wakeup.clear()
+            
+            # Events queued before the stop request are still delivered
+            stopping = stop.is_set()
+            
+            while events:
+                batch = []
+                while events and len(batch) < CALLBACK_BATCH_SIZE:
+                    batch.append(events.popleft())
+                
+                for callbacks, event in batch:
+                    for callback in callbacks:
+                        try:
+                            callback(event)
+                        except Exception as e:
+                            self.logger.error(f"Callback error: {e}")
+            
+            if stopping:
+                with self._callback_lock:
+                    self._callback_thread = None
+                # Events queued after the last drain found this thread still
+                # registered, so hand them to a fresh dispatcher
+                if events:
+                    self._ensure_callback_dispatcher()
+                return
     
     def enable_compliance_monitoring(self, 
                                    regulations: List[str],
@@ -10,7 +10,7 @@ License: Apache License 2.0
 
 import time
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from collections import OrderedDict
 import logging
@@ -18,6 +18,18 @@ import logging
 from ..core.exceptions import ProtocolError
 from ..utils.logger import get_logger
 
+# Delimiter scan for bytes payloads, resolved on first use so importing the
+# parser doesn't load the C extension package (with its fallback warning and
+# TSC calibration)
+_fix_field_offsets = None
+
+
+def _load_fix_field_offsets():
+    """Import and cache fix_field_offsets from the C extension package"""
+    global _fix_field_offsets
+    from ..core.c_extensions import fix_field_offsets as _fix_field_offsets
+    return _fix_field_offsets
+
 
 @dataclass
 class FIXMessage:
@@ -296,26 +308,31 @@ class FIXParser:
         self.parse_errors = 0
         self.validation_errors = 0
     
-    def parse_message(self, raw_message: str) -> Optional[FIXMessage]:
+    def parse_message(self, raw_message: Union[str, bytes]) -> Optional[FIXMessage]:
         """
         Parse FIX message from raw string
         
         Args:
-            raw_message: Raw FIX message string
+            raw_message: Raw FIX message string, or the payload bytes as
+                captured (delimiters are then located with a vectorized scan)
             
         Returns:
             Parsed FIX message or None if parsing failed
         """
         try:
-            # Clean the message (remove any trailing characters)
-            message = raw_message.strip()
-            
-            # Split by SOH character
-            if self.SOH in message:
-                fields_list = message.split(self.SOH)
+            if isinstance(raw_message, (bytes, bytearray, memoryview)):
+                fields_list = self._split_payload(bytes(raw_message).strip())
+                raw_message = bytes(raw_message).decode('latin-1')
             else:
-                # Try with pipe separator (some systems use this for display)
-                fields_list = message.split('|')
+                # Clean the message (remove any trailing characters)
+                message = raw_message.strip()
+                
+                # Split by SOH character
+                if self.SOH in message:
+                    fields_list = message.split(self.SOH)
+                else:
+                    # Try with pipe separator (some systems use this for display)
+                    fields_list = message.split('|')
             
             # Parse fields
             fields = OrderedDict()
@@ -361,6 +378,22 @@ class FIXParser:
             self.logger.error(f"FIX parsing error: {e}")
             raise ProtocolError(f"Failed to parse FIX message: {e}")
     
+    def _split_payload(self, payload: bytes) -> List[str]:
+        """Split raw FIX payload bytes into field strings at the delimiter offsets"""
+        delimiter = 0x01 if b'\x01' in payload else 0x7C  # SOH, else '|'
+        
+        # latin-1 maps each byte to one character, so byte offsets index the str
+        message = payload.decode('latin-1')
+        fields_list = []
+        start = 0
+        field_offsets = _fix_field_offsets or _load_fix_field_offsets()
+        for end in field_offsets(payload, delimiter).tolist():
+            fields_list.append(message[start:end])
+            start = end + 1
+        fields_list.append(message[start:])
+        
+        return fields_list
+    
     def parse_multiple_messages(self, data: str) -> List[FIXMessage]:
         """
         Parse multiple FIX messages from data stream
@@ -176,8 +176,8 @@ def create_dashboard_app(analyzer: HFTAnalyzer, auto_refresh: int, logger: HFTLo
         """API endpoint for exchange information"""
         try:
             exchanges = {}
-            for name, config in analyzer.exchanges.items():
-                exchanges[name] = {
+            for config in analyzer.exchanges:
+                exchanges[config.name] = {
                     'name': config.name,
                     'host': config.host,
                     'ports': config.ports,
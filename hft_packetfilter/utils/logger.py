@@ -14,10 +14,12 @@ import sys
 import os
 import time
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 import threading
 
+from ..core.constants import PerfMode
+
 
 class HFTLogger:
     """
@@ -34,7 +36,7 @@ class HFTLogger:
     def __init__(self, 
                  name: str = "HFTPacketFilter",
                  level: str = "INFO",
-                 performance_mode: str = "standard",
+                 performance_mode: Union[str, PerfMode] = "standard",
                  log_file: Optional[str] = None,
                  format_type: str = "structured"):
         """
@@ -49,7 +51,8 @@ class HFTLogger:
         """
         self.name = name
         self.level = level.upper()
-        self.performance_mode = performance_mode
+        self._perf_mode = PerfMode.parse(performance_mode)
+        self.performance_mode = self._perf_mode.label
         self.log_file = log_file
         self.format_type = format_type
         
@@ -70,9 +73,9 @@ class HFTLogger:
     
     def _configure_logger(self):
         """Configure logger based on performance mode"""
-        if self.performance_mode == "ultra_low_latency":
+        if self._perf_mode is PerfMode.ULTRA_LOW_LATENCY:
             self._configure_ultra_low_latency()
-        elif self.performance_mode == "high_performance":
+        elif self._perf_mode is PerfMode.HIGH_PERFORMANCE:
             self._configure_high_performance()
         else:
             self._configure_standard()
@@ -176,7 +179,7 @@ class HFTLogger:
     
     def _log(self, level: int, message: str, **kwargs):
         """Internal logging method with performance tracking"""
-        if self.performance_mode == "ultra_low_latency":
+        if self._perf_mode is PerfMode.ULTRA_LOW_LATENCY:
             # Minimal overhead logging
             self.logger.log(level, message)
         else:
@@ -394,7 +397,7 @@ def get_logger(name: str = "HFTPacketFilter") -> HFTLogger:
 
 
 def configure_global_logger(level: str = "INFO", 
-                          performance_mode: str = "standard",
+                          performance_mode: Union[str, PerfMode] = "standard",
                           log_file: Optional[str] = None,
                           format_type: str = "structured"):
     """Configure global logger"""
@@ -12,7 +12,7 @@ import time
 import json
 import csv
 import threading
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import psutil
@@ -185,6 +185,28 @@ class MetricsCollector:
             self.total_metrics_collected += 1
             self._cleanup_old_metrics()
     
+    def record_gauges_bulk(self, gauges: Iterable[Tuple[str, float]],
+                           tags: Optional[Dict[str, str]] = None,
+                           timestamp: Optional[float] = None):
+        """Record several gauge values with one lock acquisition and retention sweep
+        
+        Args:
+            gauges: (name, value) pairs, applied in order
+            tags: Tags attached to every point
+            timestamp: Timestamp for every point (defaults to now)
+        """
+        timestamp = timestamp or time.time()
+        tags = tags or {}
+        
+        with self._lock:
+            count = 0
+            for name, value in gauges:
+                self.gauges[name] = value
+                self.metrics[name].append(MetricPoint(timestamp, name, value, tags))
+                count += 1
+            self.total_metrics_collected += count
+            self._cleanup_old_metrics()
+    
     def record_histogram(self, name: str, value: float,
                         tags: Optional[Dict[str, str]] = None,
                         timestamp: Optional[float] = None):
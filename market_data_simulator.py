@@ -91,9 +91,9 @@ class HighPerformanceMessagePool:
         """Pre-allocate message objects (Python fallback)"""
         for _ in range(self.pool_size):
             msg = LatencyMeasurement(
-                timestamp=0.0,
+                timestamp_ns=0,
                 exchange_name="",
-                latency_us=0.0,
+                latency_ns=0,
                 packet_size=0
             )
             self.pool.append(msg)
@@ -103,13 +103,13 @@ class HighPerformanceMessagePool:
         if self.use_c_extensions:
             # Use high-performance memory pool for packet buffers
             # but still return standard LatencyMeasurement
-            return LatencyMeasurement(0.0, "", 0.0, 0)
+            return LatencyMeasurement(0, "", 0, 0)
         else:
             # Python fallback
             if self.pool:
                 return self.pool.popleft()
             else:
-                return LatencyMeasurement(0.0, "", 0.0, 0)
+                return LatencyMeasurement(0, "", 0, 0)
     
     def return_message(self, msg: LatencyMeasurement):
         """Return message to pool for reuse"""
@@ -123,9 +123,9 @@ class HighPerformanceMessagePool:
             # Python fallback
             if len(self.pool) < self.pool_size:
                 # Reset message data
-                msg.timestamp = 0.0
+                msg.timestamp_ns = 0
                 msg.exchange_name = ""
-                msg.latency_us = 0.0
+                msg.latency_ns = 0
                 msg.packet_size = 0
                 self.pool.append(msg)
     
@@ -265,12 +265,12 @@ class UltraHighPerformanceMarketDataSimulator:
             'CBOE': 680
         }
         
-        # Pre-compute 10,000 latency values for each exchange
+        # Pre-compute 10,000 latency values (integer nanoseconds) for each exchange
         self.latency_values = {}
         for exchange in self.exchanges:
             base = self.base_latencies[exchange]
-            self.latency_values[exchange] = array.array('d', [
-                base * self.rng_latency.fast_uniform(0.8, 1.2) for _ in range(10000)
+            self.latency_values[exchange] = array.array('q', [
+                round(base * self.rng_latency.fast_uniform(0.8, 1.2) * 1000) for _ in range(10000)
             ])
         
         self.latency_indices = {exchange: 0 for exchange in self.exchanges}
@@ -303,16 +303,16 @@ class UltraHighPerformanceMarketDataSimulator:
             
             # Pre-computed latency
             latency_idx = self.latency_indices[exchange] % 10000
-            latency_us = self.latency_values[exchange][latency_idx]
+            latency_ns = self.latency_values[exchange][latency_idx]
             self.latency_indices[exchange] += 1
             
             # Get message from pool
             message = self.message_pools[exchange_idx].get_message()
             
             # Update message data (zero allocation)
-            message.timestamp = time.time()
+            message.timestamp_ns = time.time_ns()
             message.exchange_name = exchange
-            message.latency_us = latency_us
+            message.latency_ns = latency_ns
             message.packet_size = 128 + (self.rng_main.fast_random() % 1400)
             
             # Store packet buffer reference if using C extensions
@@ -334,7 +334,7 @@ class UltraHighPerformanceMarketDataSimulator:
                     'symbol': self.symbols[symbol_idx],
                     'price': new_price,
                     'volume': volume,
-                    'latency_us': latency_us,
+                    'latency_us': latency_ns / 1000.0,
                     'timestamp': message.timestamp
                 }
                 self.message_queues[exchange_idx].enqueue_message(queue_data)
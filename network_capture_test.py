@@ -166,9 +166,9 @@ class NetworkCaptureTest:
             if exchange:
                 latency = self._calculate_latency(packet)
                 measurement = LatencyMeasurement(
-                    timestamp=time.time(),
+                    timestamp_ns=time.time_ns(),
                     exchange_name=exchange,
-                    latency_us=latency,
+                    latency_ns=round(latency * 1000),
                     packet_size=len(packet) if hasattr(packet, '__len__') else 64
                 )
                 self.analyzer.process_latency_measurement(measurement)
@@ -287,9 +287,8 @@ class NetworkCaptureTest:
         try:
             self.fix_messages_found += 1
             
-            # Try to parse FIX message
-            payload_str = payload.decode('ascii', errors='ignore')
-            fix_message = self.fix_parser.parse_message(payload_str)
+            # Try to parse FIX message straight from the captured bytes
+            fix_message = self.fix_parser.parse_message(payload)
             
             if fix_message:
                 print(f"📨 FIX Message from {exchange or 'Unknown'}")
@@ -348,9 +347,9 @@ class NetworkCaptureTest:
                 # Simulate latency measurement
                 latency = 400 + (self.packets_captured % 200)  # 400-600 μs
                 measurement = LatencyMeasurement(
-                    timestamp=time.time(),
+                    timestamp_ns=time.time_ns(),
                     exchange_name=exchange,
-                    latency_us=latency,
+                    latency_ns=latency * 1000,
                     packet_size=64 + (self.packets_captured % 1400)
                 )
                 self.analyzer.process_latency_measurement(measurement)
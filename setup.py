@@ -88,6 +88,14 @@ extensions = [
         extra_link_args=["-O3"],
         language="c",
     ),
+    Extension(
+        "hft_packetfilter.analytics._arb_native",
+        sources=["hft_packetfilter/analytics/_arb_native.pyx"],
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=["-O3", "-ffast-math", "-march=native"],
+        extra_link_args=["-O3"],
+        language="c",
+    ),
 ]
 
 # Platform-specific optimizations
@@ -164,6 +172,9 @@ setup(
             'numpy>=1.24.0',
             'psutil>=5.9.0',
             'atomics>=1.0.2',
+            'orjson>=3.9.0',
+            'msgpack>=1.0.5',
+            'pyahocorasick>=2.0.0',
         ],
         'ml': [
             'scikit-learn>=1.2.0',
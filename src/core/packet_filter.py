@@ -9,17 +9,20 @@ Author: Tanzil github://@tanzil7890
 License: Educational/Research Use Only
 """
 
+import ipaddress
 import logging
+import socket
 import threading
 import time
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Callable, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 try:
     from scapy.all import sniff, get_if_list, conf
     from scapy.layers.inet import IP, TCP, UDP, ICMP
     from scapy.layers.l2 import Ether
+    from scapy.packet import Raw
 except ImportError as e:
     print(f"Error importing Scapy: {e}")
     print("Please ensure Scapy is installed: pip install scapy")
@@ -28,6 +31,12 @@ except ImportError as e:
 import psutil
 import netifaces
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class FilterAction(Enum):
     """Actions that can be taken on filtered packets"""
@@ -50,6 +59,174 @@ class FilterRule:
     priority: int = 100
     enabled: bool = True
     description: str = ""
+    payload_patterns: Optional[List[str]] = None  # match if payload contains any
+    
+    # Precompiled (network, mask, negate) address matchers, built once here
+    # so the packet path only does integer masking
+    _src_match: Optional[Tuple[int, int, bool]] = field(init=False, repr=False, compare=False)
+    _dst_match: Optional[Tuple[int, int, bool]] = field(init=False, repr=False, compare=False)
+    # Payload patterns as latin-1 bytes, matching how payloads are compared
+    _payload_match: Optional[Tuple[bytes, ...]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._src_match = _compile_ip_match(self.src_ip)
+        self._dst_match = _compile_ip_match(self.dst_ip)
+        self._payload_match = _compile_payload_patterns(self.payload_patterns)
+
+
+def _compile_ip_match(spec: Optional[str]) -> Optional[Tuple[int, int, bool]]:
+    """
+    Compile an address spec such as "10.0.0.1", "192.168.1.0/24" or
+    "!192.168.1.0/24" into (network, mask, negate) integers
+    """
+    if not spec:
+        return None
+    
+    negate = spec.startswith('!')
+    network = ipaddress.ip_network(spec[1:] if negate else spec, strict=False)
+    return int(network.network_address), int(network.netmask), negate
+
+
+def _compile_payload_patterns(patterns: Optional[List[str]]) -> Optional[Tuple[bytes, ...]]:
+    """
+    Encode payload patterns to bytes once, as latin-1 for str patterns
+    
+    An empty pattern is contained in every payload, so a rule carrying one
+    places no constraint on the payload and compiles to None.
+    """
+    if not patterns:
+        return None
+    
+    compiled = []
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            try:
+                pattern = pattern.encode('latin-1')
+            except UnicodeEncodeError:
+                raise ValueError(f"Payload pattern {pattern!r} is not latin-1 encodable; "
+                                 f"pass it as bytes") from None
+        if not pattern:
+            return None
+        compiled.append(bytes(pattern))
+    return tuple(compiled)
+
+
+def _ip_to_int(address: str) -> int:
+    """Convert a dotted-quad IPv4 address to an integer"""
+    return int.from_bytes(socket.inet_aton(address), 'big')
+
+
+class AddressRuleIndex:
+    """
+    Prefix index over one address field (source or destination) of a rule set
+    
+    Rule prefixes are grouped into one hash table per prefix length, so a
+    lookup costs one masked dict probe per distinct prefix length in use
+    rather than one comparison per rule. Negated prefixes are indexed the
+    same way and subtracted from the set of negated rules.
+    """
+    
+    def __init__(self, matchers: List[Optional[Tuple[int, int, bool]]]):
+        """
+        Args:
+            matchers: Compiled (network, mask, negate) matcher per rule position
+        """
+        unconstrained = set()
+        negated = set()
+        positive: Dict[int, Dict[int, List[int]]] = {}
+        negative: Dict[int, Dict[int, List[int]]] = {}
+        
+        for position, matcher in enumerate(matchers):
+            if matcher is None:
+                unconstrained.add(position)
+                continue
+            
+            net, mask, negate = matcher
+            if negate:
+                negated.add(position)
+            tables = negative if negate else positive
+            tables.setdefault(mask, {}).setdefault(net, []).append(position)
+        
+        self._always = frozenset(unconstrained | negated)
+        self._positive = tuple(positive.items())
+        self._negative = tuple(negative.items())
+    
+    def matching_rules(self, address: int) -> set:
+        """Positions of rules whose constraint on this field accepts address"""
+        matched = set(self._always)
+        
+        for mask, table in self._negative:
+            excluded = table.get(address & mask)
+            if excluded:
+                matched.difference_update(excluded)
+        
+        for mask, table in self._positive:
+            included = table.get(address & mask)
+            if included:
+                matched.update(included)
+        
+        return matched
+
+
+class PayloadRuleIndex:
+    """
+    Multi-pattern payload index over the payload_patterns of a rule set
+    
+    All patterns are compiled into one Aho-Corasick automaton (pyahocorasick)
+    so a payload is scanned once regardless of how many patterns the rules
+    carry. Without pyahocorasick each distinct pattern is searched once.
+    """
+    
+    def __init__(self, pattern_lists: List[Optional[Tuple[bytes, ...]]]):
+        """
+        Args:
+            pattern_lists: Compiled payload patterns per rule position
+                (None = any payload)
+        """
+        unconstrained = set()
+        rules_by_pattern: Dict[str, List[int]] = {}
+        
+        for position, patterns in enumerate(pattern_lists):
+            if not patterns:
+                unconstrained.add(position)
+                continue
+            for pattern in patterns:
+                # Payloads are decoded as latin-1, so patterns stay byte-exact
+                rules_by_pattern.setdefault(pattern.decode('latin-1'), []).append(position)
+        
+        self._always = frozenset(unconstrained)
+        self._automaton = None
+        self._patterns = tuple(
+            (pattern, tuple(positions)) for pattern, positions in rules_by_pattern.items()
+        )
+        
+        if self._patterns and AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for pattern, positions in self._patterns:
+                self._automaton.add_word(pattern, positions)
+            self._automaton.make_automaton()
+    
+    @property
+    def has_patterns(self) -> bool:
+        """Whether any rule constrains the payload"""
+        return bool(self._patterns)
+    
+    def matching_rules(self, payload: bytes) -> set:
+        """Positions of rules whose payload constraint accepts payload"""
+        matched = set(self._always)
+        if not payload:
+            return matched
+        
+        text = payload.decode('latin-1')
+        if self._automaton is not None:
+            for _, positions in self._automaton.iter(text):
+                matched.update(positions)
+        else:
+            for pattern, positions in self._patterns:
+                if pattern in text:
+                    matched.update(positions)
+        
+        return matched
 
 
 class PacketFilter:
@@ -72,6 +249,7 @@ class PacketFilter:
         """
         self.interface = interface or self._get_default_interface()
         self.rules: List[FilterRule] = []
+        self._rule_index = self._build_rule_index([])
         self.is_running = False
         self.packet_count = 0
         self.captured_packets = []
@@ -140,6 +318,7 @@ class PacketFilter:
             self.rules.append(rule)
             # Sort rules by priority (lower number = higher priority)
             self.rules.sort(key=lambda r: r.priority)
+            self._rule_index = self._build_rule_index(self.rules)
         
         self.logger.info(f"Added rule: {rule.name}")
     
@@ -149,6 +328,7 @@ class PacketFilter:
             for i, rule in enumerate(self.rules):
                 if rule.name == rule_name:
                     del self.rules[i]
+                    self._rule_index = self._build_rule_index(self.rules)
                     self.logger.info(f"Removed rule: {rule_name}")
                     return True
         return False
@@ -162,7 +342,18 @@ class PacketFilter:
         """Add a callback function to be called for each packet"""
         self.packet_callbacks.append(callback)
     
-    def _match_rule(self, packet, rule: FilterRule) -> bool:
+    @staticmethod
+    def _build_rule_index(rules: List[FilterRule]):
+        """Snapshot rules with address and payload pattern indexes"""
+        return (
+            tuple(rules),
+            AddressRuleIndex([rule._src_match for rule in rules]),
+            AddressRuleIndex([rule._dst_match for rule in rules]),
+            PayloadRuleIndex([rule._payload_match for rule in rules])
+        )
+    
+    def _match_rule(self, packet, rule: FilterRule, check_addresses: bool = True,
+                    check_payload: bool = True) -> bool:
         """Check if a packet matches a filtering rule"""
         if not rule.enabled:
             return False
@@ -177,16 +368,20 @@ class PacketFilter:
                 return False
         
         # Check IP layer
-        if packet.haslayer(IP):
+        if check_addresses and packet.haslayer(IP):
             ip_layer = packet[IP]
             
             # Check source IP
-            if rule.src_ip and rule.src_ip != ip_layer.src:
-                return False
+            if rule._src_match:
+                net, mask, negate = rule._src_match
+                if ((_ip_to_int(ip_layer.src) & mask) == net) == negate:
+                    return False
             
             # Check destination IP
-            if rule.dst_ip and rule.dst_ip != ip_layer.dst:
-                return False
+            if rule._dst_match:
+                net, mask, negate = rule._dst_match
+                if ((_ip_to_int(ip_layer.dst) & mask) == net) == negate:
+                    return False
         
         # Check ports for TCP/UDP
         if packet.haslayer(TCP):
@@ -202,6 +397,12 @@ class PacketFilter:
             if rule.dst_port and rule.dst_port != udp_layer.dport:
                 return False
         
+        # Check payload patterns
+        if check_payload and rule._payload_match:
+            payload = packet[Raw].load if packet.haslayer(Raw) else b''
+            if not any(p in payload for p in rule._payload_match):
+                return False
+        
         return True
     
     def _process_packet(self, packet) -> None:
@@ -226,8 +427,26 @@ class PacketFilter:
         action_taken = FilterAction.ALLOW  # Default action
         matched_rule = None
         
-        for rule in self.rules:
-            if self._match_rule(packet, rule):
+        # Narrow the candidates with the address and payload indexes, then
+        # check the remaining fields in priority order
+        rules, src_index, dst_index, payload_index = self._rule_index
+        candidates = None
+        if packet.haslayer(IP):
+            ip_layer = packet[IP]
+            candidates = src_index.matching_rules(_ip_to_int(ip_layer.src))
+            candidates.intersection_update(dst_index.matching_rules(_ip_to_int(ip_layer.dst)))
+        if payload_index.has_patterns:
+            payload = packet[Raw].load if packet.haslayer(Raw) else b''
+            payload_candidates = payload_index.matching_rules(payload)
+            if candidates is None:
+                candidates = payload_candidates
+            else:
+                candidates.intersection_update(payload_candidates)
+        
+        for position, rule in enumerate(rules):
+            if candidates is not None and position not in candidates:
+                continue
+            if self._match_rule(packet, rule, check_addresses=False, check_payload=False):
                 action_taken = rule.action
                 matched_rule = rule
                 break
@@ -285,13 +504,17 @@ class PacketFilter:
         
         return summary
     
-    def start_capture(self, count: int = 0, timeout: Optional[int] = None) -> None:
+    def start_capture(self, count: int = 0, timeout: Optional[int] = None,
+                      bpf_filter: Optional[str] = None) -> None:
         """
         Start packet capture
         
         Args:
             count: Number of packets to capture (0 = unlimited)
             timeout: Timeout in seconds (None = no timeout)
+            bpf_filter: Optional BPF capture expression, compiled and attached
+                to the capture socket so non-matching traffic is dropped in
+                the kernel before it reaches the Python callbacks
         """
         if self.is_running:
             self.logger.warning("Packet capture is already running")
@@ -307,6 +530,7 @@ class PacketFilter:
                 prn=self._process_packet,
                 count=count,
                 timeout=timeout,
+                filter=bpf_filter,
                 stop_filter=lambda x: not self.is_running
             )
         except PermissionError:
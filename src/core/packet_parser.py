@@ -28,6 +28,24 @@ except ImportError as e:
     exit(1)
 
 
+# Precompiled header layouts for the fast parsing path
+_ETH_TYPE = struct.Struct('!H')
+_IP_HDR = struct.Struct('!BBHHHBBH4s4s')
+_TCP_HDR = struct.Struct('!HHIIBBHHH')
+_UDP_HDR = struct.Struct('!HHHH')
+_ICMP_HDR = struct.Struct('!BB')
+
+_ETH_HDR_LEN = 14
+_ETH_TYPE_IPV4 = 0x0800
+_IP_PROTO_ICMP = 1
+_IP_PROTO_TCP = 6
+_IP_PROTO_UDP = 17
+_TCP_FLAG_NAMES = (
+    (0x01, "FIN"), (0x02, "SYN"), (0x04, "RST"), (0x08, "PSH"),
+    (0x10, "ACK"), (0x20, "URG"), (0x40, "ECE"), (0x80, "CWR"),
+)
+
+
 @dataclass
 class ParsedPacket:
     """Represents a parsed network packet with extracted information"""
@@ -143,28 +161,32 @@ class PacketParser:
         Returns:
             ParsedPacket: Parsed packet information
         """
+        buf = bytes(packet)
         parsed = ParsedPacket(
             timestamp=time.time(),
-            size=len(packet)
+            size=len(buf)
         )
         
-        # Parse Layer 2 (Ethernet)
-        if packet.haslayer(Ether):
-            self._parse_ethernet(packet, parsed)
-        
-        # Parse Layer 3 (IP)
-        if packet.haslayer(IP):
-            self._parse_ipv4(packet, parsed)
-        elif packet.haslayer(IPv6):
-            self._parse_ipv6(packet, parsed)
-        
-        # Parse Layer 4 (Transport)
-        if packet.haslayer(TCP):
-            self._parse_tcp(packet, parsed)
-        elif packet.haslayer(UDP):
-            self._parse_udp(packet, parsed)
-        elif packet.haslayer(ICMP):
-            self._parse_icmp(packet, parsed)
+        # Plain Ethernet/IPv4 TCP, UDP and ICMP headers are unpacked straight
+        # from the wire bytes; anything else goes through the Scapy layers
+        if not self._parse_headers_fast(packet, buf, parsed):
+            # Parse Layer 2 (Ethernet)
+            if packet.haslayer(Ether):
+                self._parse_ethernet(packet, parsed)
+            
+            # Parse Layer 3 (IP)
+            if packet.haslayer(IP):
+                self._parse_ipv4(packet, parsed)
+            elif packet.haslayer(IPv6):
+                self._parse_ipv6(packet, parsed)
+            
+            # Parse Layer 4 (Transport)
+            if packet.haslayer(TCP):
+                self._parse_tcp(packet, parsed)
+            elif packet.haslayer(UDP):
+                self._parse_udp(packet, parsed)
+            elif packet.haslayer(ICMP):
+                self._parse_icmp(packet, parsed)
         
         # Parse Application Layer
         self._parse_application_layer(packet, parsed)
@@ -180,6 +202,83 @@ class PacketParser:
         
         return parsed
     
+    def _parse_headers_fast(self, packet, buf: bytes, parsed: ParsedPacket) -> bool:
+        """
+        Unpack Ethernet, IPv4 and TCP/UDP/ICMP headers with precompiled structs
+        
+        Args:
+            packet: Scapy packet object (Ether or IP at the top)
+            buf: Wire bytes of the packet
+            parsed: ParsedPacket to fill in
+            
+        Returns:
+            bool: False, with parsed untouched, if the packet is not a plain
+            unfragmented IPv4 TCP/UDP/ICMP packet and needs the Scapy path
+        """
+        if isinstance(packet, Ether):
+            if len(buf) < _ETH_HDR_LEN or _ETH_TYPE.unpack_from(buf, 12)[0] != _ETH_TYPE_IPV4:
+                return False
+            ip_offset = _ETH_HDR_LEN
+        elif isinstance(packet, IP):
+            ip_offset = 0
+        else:
+            return False
+        
+        if len(buf) < ip_offset + _IP_HDR.size:
+            return False
+        (version_ihl, _, ip_len, _, flags_frag, ttl, proto, _,
+         src, dst) = _IP_HDR.unpack_from(buf, ip_offset)
+        ihl = (version_ihl & 0x0F) * 4
+        if version_ihl >> 4 != 4 or ihl < _IP_HDR.size or flags_frag & 0x1FFF:
+            return False
+        
+        l4_offset = ip_offset + ihl
+        l4_header = {_IP_PROTO_TCP: _TCP_HDR, _IP_PROTO_UDP: _UDP_HDR,
+                     _IP_PROTO_ICMP: _ICMP_HDR}.get(proto)
+        if (l4_header is None or ip_len < ihl + l4_header.size
+                or len(buf) < l4_offset + l4_header.size):
+            return False
+        
+        # Layer 2 (Ethernet)
+        if ip_offset:
+            parsed.eth_dst = buf[0:6].hex(':')
+            parsed.eth_src = buf[6:12].hex(':')
+            parsed.eth_type = f"0x{_ETH_TYPE_IPV4:04x}"
+        
+        # Layer 3 (IPv4)
+        parsed.ip_version = 4
+        parsed.ip_src = socket.inet_ntoa(src)
+        parsed.ip_dst = socket.inet_ntoa(dst)
+        parsed.ip_protocol = self.ip_protocols.get(proto, f"Unknown({proto})")
+        parsed.ip_ttl = ttl
+        
+        flags = []
+        if flags_frag & 0x4000:  # Don't Fragment
+            flags.append("DF")
+        if flags_frag & 0x2000:  # More Fragments
+            flags.append("MF")
+            parsed.is_fragmented = True
+        parsed.ip_flags = ",".join(flags) if flags else "None"
+        
+        # Layer 4 (Transport)
+        if proto == _IP_PROTO_TCP:
+            (parsed.src_port, parsed.dst_port, parsed.tcp_seq, parsed.tcp_ack,
+             _, tcp_flags, parsed.tcp_window, _, _) = _TCP_HDR.unpack_from(buf, l4_offset)
+            parsed.tcp_flags = ",".join(
+                name for bit, name in _TCP_FLAG_NAMES if tcp_flags & bit
+            ) or "None"
+            
+            # Check for encrypted traffic
+            if parsed.dst_port in [443, 993, 995] or parsed.src_port in [443, 993, 995]:
+                parsed.is_encrypted = True
+        elif proto == _IP_PROTO_UDP:
+            parsed.src_port, parsed.dst_port, _, _ = _UDP_HDR.unpack_from(buf, l4_offset)
+        else:
+            # ICMP doesn't have ports, but we can store type and code
+            parsed.src_port, parsed.dst_port = _ICMP_HDR.unpack_from(buf, l4_offset)
+        
+        return True
+    
     def _parse_ethernet(self, packet, parsed: ParsedPacket) -> None:
         """Parse Ethernet layer information"""
         eth = packet[Ether]
@@ -16,6 +16,12 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -88,6 +94,23 @@ class HFTNetworkAnalyzer:
         # Setup callbacks
         self.packet_filter.add_packet_callback(self._analyze_hft_packet)
     
+    def clear_data(self) -> None:
+        """
+        Clear collected analysis data, keeping exchange connections and rules
+        
+        Lets one analyzer (with its packet filter and parser) be reused across
+        monitoring runs instead of being reconstructed.
+        """
+        self.latency_measurements.clear()
+        self.order_flow.clear()
+        self.market_data_stats.clear()
+        self.risk_metrics.clear()
+        self.packet_timestamps.clear()
+        self.trading_sessions.clear()
+        
+        self.packet_parser.clear_data()
+        self.packet_filter.clear_statistics()
+    
     def add_exchange_connection(self, exchange: ExchangeConnection) -> None:
         """Add exchange connection for monitoring"""
         self.exchange_connections[exchange.name] = exchange
@@ -103,6 +126,24 @@ class HFTNetworkAnalyzer:
             )
             self.packet_filter.add_rule(rule)
     
+    def build_capture_filter(self) -> Optional[str]:
+        """
+        Build a BPF capture expression covering the exchange connections
+        
+        Returns:
+            Filter matching traffic to or from each exchange on its ports,
+            or None when no exchange connections are configured
+        """
+        clauses = []
+        for exchange in self.exchange_connections.values():
+            ports = " or ".join(f"port {port}" for port in exchange.ports)
+            if ports:
+                clauses.append(f"(host {exchange.ip_address} and ({ports}))")
+            else:
+                clauses.append(f"(host {exchange.ip_address})")
+        
+        return " or ".join(clauses) if clauses else None
+    
     def _analyze_hft_packet(self, packet, action, rule) -> None:
         """Analyze packet for HFT-specific metrics"""
         parsed = self.packet_parser.parse_packet(packet)
@@ -334,13 +375,26 @@ class HFTNetworkAnalyzer:
         
         return report
     
-    def start_monitoring(self, duration_seconds: int = 60) -> None:
-        """Start HFT network monitoring"""
+    def start_monitoring(self, duration_seconds: int = 60,
+                         exchange_traffic_only: bool = False) -> None:
+        """
+        Start HFT network monitoring
+        
+        Args:
+            duration_seconds: Capture duration in seconds
+            exchange_traffic_only: Attach a kernel BPF filter so only traffic
+                for the configured exchange connections is delivered
+        """
         print(f"Starting HFT network monitoring for {duration_seconds} seconds...")
         print(f"Monitoring {len(self.exchange_connections)} exchange connections")
         
+        bpf_filter = self.build_capture_filter() if exchange_traffic_only else None
+        if bpf_filter:
+            print(f"Kernel capture filter: {bpf_filter}")
+        
         try:
-            self.packet_filter.start_capture(timeout=duration_seconds)
+            self.packet_filter.start_capture(timeout=duration_seconds,
+                                             bpf_filter=bpf_filter)
         except PermissionError:
             print("ERROR: Packet capture requires sudo privileges")
             print("Run with: sudo python3 hft_analyzer.py")
@@ -351,8 +405,17 @@ class HFTNetworkAnalyzer:
         """Export HFT analysis data"""
         report = self.generate_hft_report()
         
-        with open(f"{filename}_hft_report.json", 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(
+                report,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            payload = json.dumps(report, indent=2, default=str).encode()
+        
+        with open(f"{filename}_hft_report.json", 'wb') as f:
+            f.write(payload)
         
         print(f"HFT analysis exported to {filename}_hft_report.json")
 
@@ -166,6 +166,22 @@ def test_memory_pool():
     pool.prefault_memory()
     print("✅ Memory prefaulting completed")
     
+    # Test 9: Bulk allocation
+    print("\n9. Testing bulk allocation/deallocation...")
+    free_before = pool.get_free_blocks()
+    bulk_buffers = pool.allocate_many(free_before + 10)
+    
+    if len(bulk_buffers) != free_before or pool.get_free_blocks() != 0:
+        print("❌ Bulk allocation should stop at pool exhaustion")
+        return False
+    
+    pool.deallocate_many(bulk_buffers)
+    if pool.get_free_blocks() != free_before:
+        print("❌ Bulk deallocation did not return all blocks")
+        return False
+    
+    print(f"✅ Bulk allocation test passed ({len(bulk_buffers)} blocks)")
+    
     print("\n🎉 All memory pool tests passed!")
     return True
 